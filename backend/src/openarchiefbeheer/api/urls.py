@@ -38,6 +38,7 @@ from openarchiefbeheer.logging.api.viewsets import LogsViewset
 from openarchiefbeheer.selection.api.views import (
     SelectionCountView,
     SelectionSelectAllView,
+    SelectionSelectedCountView,
     SelectionView,
 )
 from openarchiefbeheer.zaken.api.views import (
@@ -164,6 +165,11 @@ urlpatterns = [
                     SelectionCountView.as_view(),
                     name="selections-count",
                 ),
+                path(
+                    "selections/<str:key>/selected-count/",
+                    SelectionSelectedCountView.as_view(),
+                    name="selections-selected-count",
+                ),
                 path(
                     "selections/<str:key>/select-all/",
                     SelectionSelectAllView.as_view(),
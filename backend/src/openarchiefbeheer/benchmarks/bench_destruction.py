@@ -0,0 +1,56 @@
+import pytest
+from privates.test import temp_private_root
+from rest_framework.reverse import reverse
+
+from openarchiefbeheer.destruction.constants import InternalStatus, ListItemStatus
+from openarchiefbeheer.destruction.destruction_report import (
+    generate_destruction_report,
+)
+from openarchiefbeheer.destruction.models import ReviewItemResponse
+from openarchiefbeheer.destruction.utils import process_review_item_responses
+
+from .stubs import stub_zgw_apis
+
+
+@pytest.mark.django_db
+def test_list_destruction_list_items(benchmark, benchmark_data, api_client):
+    endpoint = reverse("api:destruction-list-items-list")
+    params = {"item-destruction_list": str(benchmark_data.destruction_list.uuid)}
+
+    response = benchmark(api_client.get, endpoint, params)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_process_review_item_responses(benchmark, benchmark_data):
+    destruction_list = benchmark_data.reviewed_list
+    items_responses = ReviewItemResponse.objects.filter(
+        review_item__destruction_list=destruction_list
+    )
+
+    def reset():
+        items_responses.update(processing_status=InternalStatus.new)
+        destruction_list.items.update(status=ListItemStatus.suggested)
+
+    with stub_zgw_apis(zaken_count=benchmark_data.scale):
+        benchmark.pedantic(
+            process_review_item_responses,
+            args=(items_responses,),
+            setup=reset,
+            rounds=3,
+        )
+
+    assert not destruction_list.items.filter(status=ListItemStatus.suggested).exists()
+
+
+@pytest.mark.django_db
+def test_generate_destruction_report(benchmark, benchmark_data):
+    destruction_list = benchmark_data.deleted_list
+
+    with temp_private_root():
+        benchmark.pedantic(
+            generate_destruction_report, args=(destruction_list,), rounds=3
+        )
+
+    assert destruction_list.destruction_report
@@ -0,0 +1,44 @@
+from django.core.cache import cache
+
+import pytest
+from rest_framework.reverse import reverse
+
+from openarchiefbeheer.selection.models import AllSelectedToggle
+
+
+@pytest.mark.django_db
+def test_get_selection(benchmark, benchmark_data, api_client):
+    endpoint = reverse("api:selections", kwargs={"key": benchmark_data.selection_key})
+
+    response = benchmark(api_client.get, endpoint)
+
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_count_selection(benchmark, benchmark_data, api_client):
+    endpoint = reverse(
+        "api:selections-count", kwargs={"key": benchmark_data.selection_key}
+    )
+
+    response = benchmark(api_client.get, endpoint)
+
+    assert response.data["count"] == (benchmark_data.scale + 1) // 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("all_selected", [False, True])
+def test_count_selected_zaken(benchmark, benchmark_data, api_client, all_selected):
+    key = benchmark_data.selection_key
+    AllSelectedToggle.objects.create(key=key, all_selected=all_selected)
+    endpoint = reverse("api:selections-selected-count", kwargs={"key": key})
+
+    # The count is cached, so the cache is cleared to measure the query
+    response = benchmark.pedantic(
+        api_client.get,
+        args=(endpoint, {"not_in_destruction_list": "true"}),
+        setup=cache.clear,
+        rounds=10,
+    )
+
+    assert response.status_code == 200
@@ -0,0 +1,41 @@
+import pytest
+
+from openarchiefbeheer.zaken.api.filtersets import ZaakFilterSet
+from openarchiefbeheer.zaken.models import Zaak
+from openarchiefbeheer.zaken.tasks import retrieve_and_cache_zaken
+
+from .stubs import stub_zgw_apis
+
+
+@pytest.mark.django_db
+def test_sync_zaken(benchmark, benchmark_data):
+    with stub_zgw_apis(zaken_count=benchmark_data.scale):
+        benchmark.pedantic(
+            retrieve_and_cache_zaken, kwargs={"is_full_resync": True}, rounds=3
+        )
+
+    assert Zaak.objects.count() == benchmark_data.scale
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"not_in_destruction_list": "true"},
+        {"zaaktype": "ZAAKTYPE-1"},
+        {"vcs": "1"},
+        {"heeft_relaties": "false"},
+        {"resultaat__resultaattype__archiefactietermijn__icontains": "P1"},
+        {"einddatum__lte": "2005-01-01", "archiefnominatie": "vernietigen"},
+    ],
+    ids=lambda filters: ",".join(filters),
+)
+def test_filter_zaken(benchmark, benchmark_data, filters):
+    def filter_zaken():
+        queryset = ZaakFilterSet(data=filters, queryset=Zaak.objects.all()).qs
+        # Like a page of the API: the total count and the first items
+        return queryset.count(), list(queryset.order_by("pk")[:100])
+
+    count, zaken = benchmark(filter_zaken)
+
+    assert len(zaken) == min(count, 100)
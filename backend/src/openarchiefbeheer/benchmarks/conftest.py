@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+
+import pytest
+from rest_framework.test import APIClient
+from zgw_consumers.constants import APITypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openarchiefbeheer.accounts.models import User
+from openarchiefbeheer.accounts.tests.factories import UserFactory
+from openarchiefbeheer.destruction.models import DestructionList
+from openarchiefbeheer.utils.load_testing.data import (
+    seed_destruction_list,
+    seed_destruction_results,
+    seed_review_response,
+    seed_selection,
+    seed_zaken,
+)
+from openarchiefbeheer.zaken.models import Zaak
+
+from .stubs import DATA
+
+SCALES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--scale",
+        choices=SCALES.keys(),
+        default="10k",
+        help="Number of zaken with which the database is seeded for the benchmarks.",
+    )
+
+
+@dataclass
+class BenchmarkData:
+    scale: int
+    user: User
+    # A list with 10% of the zaken
+    destruction_list: DestructionList
+    # A list with 1% of the zaken, which are all rejected by the reviewer
+    reviewed_list: DestructionList
+    # A list with 10% of the zaken, which are all deleted
+    deleted_list: DestructionList
+    # A selection with all the zaken, of which half are selected
+    selection_key: str
+
+
+@pytest.fixture(scope="session")
+def benchmark_data(request, django_db_setup, django_db_blocker) -> BenchmarkData:
+    """Seed the test database once for all the benchmarks of the session.
+
+    The benchmarks run in a transaction that is rolled back, so they all start
+    from the same data.
+    """
+    scale = SCALES[request.config.getoption("--scale")]
+    list_size = scale // 10
+    review_size = scale // 100
+
+    with django_db_blocker.unblock():
+        ServiceFactory.create(api_type=APITypes.zrc, api_root=DATA.zaken_api_root)
+        user = UserFactory.create(superuser=True)
+
+        seed_zaken(DATA, scale)
+        zaken = Zaak.objects.order_by("pk")
+
+        destruction_list = seed_destruction_list(
+            "Benchmark list", user, zaken[:list_size]
+        )
+        reviewed_list = seed_destruction_list(
+            "Benchmark reviewed list",
+            user,
+            zaken[list_size : list_size + review_size],
+        )
+        seed_review_response(reviewed_list, user)
+        deleted_list = seed_destruction_list(
+            "Benchmark deleted list",
+            user,
+            zaken[list_size + review_size : 2 * list_size + review_size],
+        )
+        seed_destruction_results(deleted_list, user)
+
+        selection_key = "benchmark-selection"
+        seed_selection(selection_key, zaken)
+
+    return BenchmarkData(
+        scale=scale,
+        user=user,
+        destruction_list=destruction_list,
+        reviewed_list=reviewed_list,
+        deleted_list=deleted_list,
+        selection_key=selection_key,
+    )
+
+
+@pytest.fixture
+def api_client(benchmark_data: BenchmarkData) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(user=benchmark_data.user)
+    return client
@@ -0,0 +1,33 @@
+"""Stubs of the ZGW APIs, so that the benchmarks don't depend on a running Open Zaak.
+
+The requests are answered by the fake APIs used for load testing, which serve the
+same synthetic data with which the database is seeded.
+"""
+
+import re
+from contextlib import contextmanager
+from typing import Iterator
+
+from requests_mock import ANY, Mocker
+
+from openarchiefbeheer.utils.load_testing.data import SyntheticData
+from openarchiefbeheer.utils.load_testing.fake_apis import FakeZGWAPIs
+
+BASE_URL = "http://zgw-apis.nl"
+
+DATA = SyntheticData(BASE_URL)
+
+
+@contextmanager
+def stub_zgw_apis(zaken_count: int = 0) -> Iterator[Mocker]:
+    """Stub the ZGW APIs with ``zaken_count`` zaken in the Zaken API."""
+    apis = FakeZGWAPIs(DATA, zaken_count)
+
+    def callback(request, context):
+        body = request.json() if request.body else None
+        context.status_code, data = apis.handle(request.method, request.url, body)
+        return data
+
+    with Mocker() as m:
+        m.register_uri(ANY, re.compile(rf"^{re.escape(BASE_URL)}/"), json=callback)
+        yield m
@@ -1,4 +1,8 @@
+from contextlib import ExitStack
+
 from celery import Celery
+from celery.signals import task_postrun, task_prerun
+from opentelemetry.instrumentation.celery import CeleryInstrumentor
 
 from .setup import setup_env
 
@@ -9,3 +13,24 @@ app = Celery(
 )
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+# Propagate the trace context in the headers of the tasks, so that the spans of a
+# task are correlated with the request or the task that scheduled it.
+CeleryInstrumentor().instrument()
+
+_task_scopes: dict[str, ExitStack] = {}
+
+
+@task_prerun.connect
+def open_local_cache_scope(task_id: str, **kwargs) -> None:
+    from .clients import local_cache_scope
+
+    scope = ExitStack()
+    scope.enter_context(local_cache_scope())
+    _task_scopes[task_id] = scope
+
+
+@task_postrun.connect
+def close_local_cache_scope(task_id: str, **kwargs) -> None:
+    if scope := _task_scopes.pop(task_id, None):
+        scope.close()
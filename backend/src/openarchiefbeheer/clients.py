@@ -1,24 +1,67 @@
 import hashlib
-from functools import cache, lru_cache
-from typing import Callable, NoReturn, TypeVar
-
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache, lru_cache, partial
+from typing import Callable, Iterator, NoReturn, TypeVar
+
+from django.conf import settings
 from django.core.cache import cache as django_cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.core.exceptions import ImproperlyConfigured
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.utils.translation import gettext_lazy as _
 
 from ape_pie import APIClient
-from zgw_consumers.client import build_client
+from zgw_consumers.client import build_client as build_zgw_client
 from zgw_consumers.constants import APITypes
 from zgw_consumers.models import Service
 
+from openarchiefbeheer.config.constants import HEALTH_CHECKS_CACHE_KEY
 from openarchiefbeheer.config.models import APIConfig
+from openarchiefbeheer.external_registers.resolver import (
+    clear_resolver,
+    resolve_service,
+)
+from openarchiefbeheer.utils import cache_metrics
+from openarchiefbeheer.utils.tracing import TracedAPIClient
+
+_response_hooks: ContextVar[tuple[Callable, ...]] = ContextVar(
+    "response_hooks", default=()
+)
+
+
+@contextmanager
+def response_hooks(*hooks: Callable) -> Iterator[None]:
+    """Call the hooks for each response received by the clients built in the context.
+
+    The hooks are called with the client and the response. They are also called for
+    the requests made from other threads with these clients, so they must be
+    thread-safe and must not access the database.
+    """
+    token = _response_hooks.set(_response_hooks.get() + hooks)
+    try:
+        yield
+    finally:
+        _response_hooks.reset(token)
+
+
+def build_client(service: Service) -> TracedAPIClient:
+    """Return the client for the service, which traces the requests made with it."""
+    client = build_zgw_client(service, client_factory=TracedAPIClient)
+    client.service = service
+    for hook in _response_hooks.get():
+        client.hooks["response"].append(partial(hook, client))
+    return client
 
 
-@lru_cache
 def get_service_from_url(url: str) -> Service | None:
-    return Service.get_service(url)
+    if resolved := resolve_service(url):
+        return resolved[0]
 
 
 @lru_cache
@@ -83,48 +126,180 @@ def selectielijst_client() -> APIClient | NoReturn:
 
 @receiver([post_delete, post_save], sender=Service, weak=False)
 def clear_cache_on_service_change(sender, instance, **_):
-    get_service_from_url.cache_clear()
+    clear_resolver()
     _get_service.cache_clear()
     _get_selectielijst_service.cache_clear()
+    django_cache.delete(HEALTH_CHECKS_CACHE_KEY)
 
 
 @receiver([post_delete, post_save], sender=APIConfig, weak=False)
 def clear_cache_on_api_config_change(sender, instance, **_):
     _get_selectielijst_service.cache_clear()
+    django_cache.delete(HEALTH_CHECKS_CACHE_KEY)
 
 
 R = TypeVar("R", covariant=True)
 
+_local = threading.local()
+_sentinel = object()
+
+# Interval (in seconds) at which a worker waiting for a value computed elsewhere polls the cache
+CACHE_LOCK_POLL_INTERVAL = 0.1
+
+
+class _LocalCache:
+    """In-process LRU cache, in front of the shared (Redis) cache.
+
+    The values are stored pickled, so that callers can't modify the cached values.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.entries: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, key: str, default=None):
+        if key not in self.entries:
+            return default
+        self.entries.move_to_end(key)
+        return pickle.loads(self.entries[key])
+
+    def set(self, key: str, value) -> None:
+        self.set_pickled(key, pickle.dumps(value))
+
+    def set_pickled(self, key: str, payload: bytes) -> None:
+        self.entries[key] = payload
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+
+@contextmanager
+def local_cache_scope() -> Iterator[None]:
+    """Memoize the results of the cached functions in-process within the block.
+
+    Used for the duration of a request or a Celery task, so that lookups that are
+    done many times don't need a round trip to the shared cache. Nested blocks
+    share the cache of the outermost block.
+    """
+    if getattr(_local, "cache", None) is not None:
+        yield
+        return
+
+    _local.cache = _LocalCache(settings.CACHE_LOCAL_MAX_SIZE)
+    try:
+        yield
+    finally:
+        _local.cache = None
+
+
+def _compute_once(key: str, compute: Callable[[], R], timeout: int | None) -> R:
+    """Compute and cache a missing value, making sure that it's computed only once.
+
+    When another worker is already computing the value, wait for its result
+    instead of hitting the APIs as well.
+    """
+    lock_key = f"{key}:lock"
+    if django_cache.add(lock_key, True, settings.CACHE_LOCK_TIMEOUT):
+        try:
+            result = compute()
+            django_cache.set(key, result, timeout)
+            return result
+        finally:
+            django_cache.delete(lock_key)
+
+    deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+    # The lock also disappears if the cache can't be reached
+    while django_cache.get(lock_key) and time.monotonic() < deadline:
+        time.sleep(CACHE_LOCK_POLL_INTERVAL)
+        result = django_cache.get(key, _sentinel)
+        if result is not _sentinel:
+            return result
+
+    result = compute()
+    django_cache.set(key, result, timeout)
+    return result
+
+
+def _get_or_compute(
+    function: str,
+    arguments: tuple[str, ...],
+    key: str,
+    compute: Callable[[], R],
+    timeout: int | None,
+) -> R:
+    local_cache: _LocalCache | None = getattr(_local, "cache", None)
+    if local_cache is not None:
+        result = local_cache.get(key, _sentinel)
+        if result is not _sentinel:
+            cache_metrics.record(function, cache_metrics.LOCAL_HITS)
+            return result
+
+    result = django_cache.get(key, _sentinel)
+    if result is not _sentinel:
+        cache_metrics.record(function, cache_metrics.HITS)
+        if local_cache is not None:
+            local_cache.set(key, result)
+        return result
+
+    start = time.monotonic()
+    result = _compute_once(key, compute, timeout)
+    duration = time.monotonic() - start
+
+    # The payload is serialized once, for the size and the local cache
+    payload = pickle.dumps(result)
+    cache_metrics.record_miss(
+        function, arguments, key, duration=duration, size=len(payload)
+    )
+    if local_cache is not None:
+        local_cache.set_pickled(key, payload)
+    return result
+
+
+def _delete(key: str) -> None:
+    django_cache.delete(key)
+    if (local_cache := getattr(_local, "cache", None)) is not None:
+        local_cache.delete(key)
+
+
+def _cached_with_args(
+    f: Callable[..., R] | None = None, *, timeout: int | None = DEFAULT_TIMEOUT
+):
+    """Cache the result of the function, for the given arguments.
+
+    Can be used with a timeout (in seconds): ``@_cached_with_args(timeout=60)``.
+    """
+    if f is None:
+        return partial(_cached_with_args, timeout=timeout)
+
+    cache_metrics.register_function(f.__qualname__)
 
-def _cached_with_args(f: Callable[..., R]) -> Callable[..., R]:
     def wrapped_f(*args: str) -> R:
         # Cannot use the args directly, because they include URLs and the keys shouldn't be longer than 250 chars
         key = hashlib.md5(
             "+".join([f.__qualname__, *args]).encode(), usedforsecurity=False
         ).hexdigest()
 
-        sentinel = object()
-        result = django_cache.get(key, sentinel)
-        if result is not sentinel:
-            return result
-
-        result = f(*args)
-        django_cache.set(key, result)
-        return result
+        return _get_or_compute(f.__qualname__, args, key, lambda: f(*args), timeout)
 
     return wrapped_f
 
 
-def _cached[F: Callable[[], object]](f: F) -> F:
+def _cached[F: Callable[[], object]](
+    f: F | None = None, *, timeout: int | None = 60 * 60 * 24
+) -> F:
+    """Cache the result of the function.
+
+    Can be used with a timeout (in seconds): ``@_cached(timeout=60)``.
+    """
+    if f is None:
+        return partial(_cached, timeout=timeout)
+
     key = f.__qualname__
-    function: F = lambda: django_cache.get_or_set(
-        # type: ignore get_or_set annotation is bad
-        key,
-        default=f,
-        timeout=60 * 60 * 24,
-    )
-    function.clear_cache = lambda: django_cache.delete(  # pyright: ignore[reportFunctionMemberAccess] # noqa
-        key
-    )
+    cache_metrics.register_function(key)
+    function: F = lambda: _get_or_compute(key, (), key, f, timeout)
+    function.clear_cache = lambda: _delete(key)  # pyright: ignore[reportFunctionMemberAccess]
 
     return function
@@ -93,6 +93,18 @@ CACHES = {
     },
 }
 
+# Within a request or a Celery task, cached lookups are also memoized in-process.
+# This is the maximum number of entries kept per request or task.
+CACHE_LOCAL_MAX_SIZE = config("CACHE_LOCAL_MAX_SIZE", default=256)
+# How long (in seconds) a worker waits for a value that another worker is computing,
+# before computing it itself
+CACHE_LOCK_TIMEOUT = config("CACHE_LOCK_TIMEOUT", default=30)
+# How often (in seconds) the cache metrics of a worker are added to the shared cache
+CACHE_METRICS_FLUSH_INTERVAL = config("CACHE_METRICS_FLUSH_INTERVAL", default=10)
+# Token that a metrics scraper sends as "Authorization: Bearer <token>" to read the
+# metrics endpoint. Staff users can read it without token.
+METRICS_TOKEN = config("METRICS_TOKEN", default="")
+
 # Geospatial libraries
 GEOS_LIBRARY_PATH = config("GEOS_LIBRARY_PATH", default=None)
 GDAL_LIBRARY_PATH = config("GDAL_LIBRARY_PATH", default=None)
@@ -165,12 +177,15 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "openarchiefbeheer.middleware.ProfilingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     # 'django.middleware.locale.LocaleMiddleware',
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "openarchiefbeheer.middleware.CsrfTokenMiddleware",
     "openarchiefbeheer.middleware.SessionExpiredMiddleware",
+    "openarchiefbeheer.middleware.AuditLogBufferMiddleware",
+    "openarchiefbeheer.middleware.LocalCacheMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "maykin_2fa.middleware.OTPMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -243,6 +258,13 @@ EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", default="")
 EMAIL_USE_TLS = config("EMAIL_USE_TLS", default=False)
 EMAIL_TIMEOUT = 10
 
+# Emails are queued in the outbox and sent in batches by a Celery task
+EMAIL_BATCH_SIZE = config("EMAIL_BATCH_SIZE", default=50)
+EMAIL_MAX_ATTEMPTS = config("EMAIL_MAX_ATTEMPTS", default=5)
+# Delay (in seconds) before the first retry, doubled with every retry. The retries
+# are sent by the periodic task
+EMAIL_RETRY_BACKOFF = config("EMAIL_RETRY_BACKOFF", default=60)
+
 DEFAULT_FROM_EMAIL = config(
     "DEFAULT_FROM_EMAIL", default="openarchiefbeheer@example.com"
 )
@@ -319,6 +341,11 @@ LOGGING = {
             "level": LOG_LEVEL,
             "propagate": True,
         },
+        "performance": {
+            "handlers": ["performance"] if not LOG_STDOUT else ["console"],
+            "level": "INFO",
+            "propagate": False,
+        },
         "django.request": {
             "handlers": ["django"] if not LOG_STDOUT else ["console"],
             "level": "ERROR",
@@ -418,6 +445,62 @@ REQUESTS_DEFAULT_TIMEOUT = (10, REQUESTS_READ_TIMEOUT)
 
 ZAKEN_CHUNK_SIZE = config("ZAKEN_CHUNK_SIZE", default=10)
 
+# Number of review item responses processed per batch and the number of concurrent
+# requests to Open Zaak used to update the zaken of a batch
+REVIEW_RESPONSE_PROCESSING_BATCH_SIZE = config(
+    "REVIEW_RESPONSE_PROCESSING_BATCH_SIZE", default=100
+)
+REVIEW_RESPONSE_PROCESSING_WORKERS = config(
+    "REVIEW_RESPONSE_PROCESSING_WORKERS", default=8
+)
+
+# Number of concurrent requests to Open Zaak used to retrieve the related objects of the
+# zaken on a page of destruction list items
+RELATED_OBJECTS_PREFETCH_WORKERS = config("RELATED_OBJECTS_PREFETCH_WORKERS", default=8)
+
+# Number of concurrent requests used by the external register plugins to delete the
+# related objects of a zaak
+RELATED_OBJECTS_DELETION_WORKERS = config("RELATED_OBJECTS_DELETION_WORKERS", default=4)
+
+# Profiling of the API requests (see `openarchiefbeheer.middleware.ProfilingMiddleware`).
+# The requests that are slower (in milliseconds), that make more queries or that make
+# the same query more often than the thresholds are logged to the performance log.
+PROFILING_ENABLED = config("PROFILING_ENABLED", default=False)
+PROFILING_SLOW_REQUEST_THRESHOLD = config(
+    "PROFILING_SLOW_REQUEST_THRESHOLD", default=1000
+)
+PROFILING_QUERY_COUNT_THRESHOLD = config("PROFILING_QUERY_COUNT_THRESHOLD", default=50)
+PROFILING_DUPLICATE_QUERIES_THRESHOLD = config(
+    "PROFILING_DUPLICATE_QUERIES_THRESHOLD", default=10
+)
+
+# How often (in seconds) the progress of the destruction of a list is added to its
+# summary by a worker, and over how many seconds the throughput is averaged
+DESTRUCTION_PROGRESS_FLUSH_INTERVAL = config(
+    "DESTRUCTION_PROGRESS_FLUSH_INTERVAL", default=10
+)
+DESTRUCTION_PROGRESS_WINDOW = config("DESTRUCTION_PROGRESS_WINDOW", default=300)
+
+# Number of zaken for which the supported related objects are retrieved and stored at
+# once after the zaken are synced
+RELATED_OBJECTS_ENRICHMENT_BATCH_SIZE = config(
+    "RELATED_OBJECTS_ENRICHMENT_BATCH_SIZE", default=100
+)
+
+# How long (in seconds) the number of selected zaken is cached for a given selection version
+SELECTION_COUNT_CACHE_TIMEOUT = config("SELECTION_COUNT_CACHE_TIMEOUT", default=60)
+
+# Selections that are not modified for this many days are cleaned up, unless they belong to a destruction list
+SELECTION_TTL = config("SELECTION_TTL", default=30)
+# How long (in seconds) a selection of a destruction list is kept after the list changed status
+SELECTION_STALE_GRACE = config("SELECTION_STALE_GRACE", default=60 * 60)
+SELECTION_CLEANUP_CHUNK_SIZE = 100
+
+# Number of seconds after which a health check that did not complete is reported as failed
+HEALTH_CHECK_TIMEOUT = config("HEALTH_CHECK_TIMEOUT", default=5)
+# How long (in seconds) the results of the health checks are cached
+HEALTH_CHECK_CACHE_TIMEOUT = config("HEALTH_CHECK_CACHE_TIMEOUT", default=30)
+
 E2E_SERVE_FRONTEND = False
 
 RETRY_TOTAL = config("RETRY_TOTAL", default=5)
@@ -677,6 +760,18 @@ CELERY_BEAT_SCHEDULE = {
         # run every 24 hours, executing the task at 12:00
         "schedule": crontab(hour="12", minute="0"),
     },
+    "send-queued-emails": {
+        "task": "openarchiefbeheer.emails.tasks.send_queued_emails",
+        # retries the emails that could not be sent and picks up the emails that
+        # could not be queued directly (for example when the broker was
+        # unavailable), runs every 5 minutes
+        "schedule": crontab(minute="*/5"),
+    },
+    "cleanup-expired-selections": {
+        "task": "openarchiefbeheer.selection.tasks.cleanup_expired_selections",
+        # run every 24 hours, executing the task at 03:00
+        "schedule": crontab(hour="3", minute="0"),
+    },
 }
 
 #
@@ -0,0 +1 @@
+HEALTH_CHECKS_CACHE_KEY = "health-checks"
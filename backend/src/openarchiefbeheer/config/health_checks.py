@@ -1,5 +1,12 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import partial
+from typing import Callable
 
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
 from django.utils.translation import gettext as _
 
 from maykin_config_checks import HealthCheck, HealthCheckResult, Slug
@@ -11,10 +18,15 @@ from openarchiefbeheer.external_registers.plugin import AbstractBasePlugin
 from openarchiefbeheer.external_registers.registry import register as registry
 from openarchiefbeheer.utils.health_checks import CheckResult, ExtraInfo
 
+from .constants import HEALTH_CHECKS_CACHE_KEY
 from .models import APIConfig, ArchiveConfig
 
 ZGW_REQUIRED_SERVICE_TYPES = [APITypes.zrc, APITypes.drc, APITypes.ztc, APITypes.brc]
 
+# Shared by the requests to the health checks, so that the number of threads stays
+# bounded when the checks are slow
+_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="health-checks")
+
 
 @dataclass
 class ServiceHealthCheck:
@@ -67,17 +79,37 @@ class ServiceConfigurationHealthCheck:
     verbose_name = _("Services configuration")
 
     def __call__(self) -> CheckResult:
+        # The connections are checked concurrently. The certificates are retrieved
+        # beforehand, the worker threads don't share the database connection.
+        services = list(
+            Service.objects.select_related("client_certificate", "server_certificate")
+        )
+        connection_results = _run_concurrently(
+            [partial(_get_connection_check, service) for service in services],
+            timeout=settings.HEALTH_CHECK_TIMEOUT,
+        )
+
         errors = []
-        for service in Service.objects.all():
-            service_connection_result = service.connection_check
+        for service, future in zip(services, connection_results, strict=True):
+            # The checks that did not start before the timeout were cancelled
+            timed_out = not future.done() or future.cancelled()
+            service_connection_result = (
+                future.result()
+                if not timed_out and future.exception() is None
+                else None
+            )
             if service_connection_result is None or (
                 service_connection_result and not 200 <= service_connection_result < 300
             ):
+                message = (
+                    _("Connection check timed out for Service: %(label)s")
+                    if timed_out
+                    else _("Connection check failed for Service: %(label)s")
+                )
                 errors.append(
                     ExtraInfo(
                         code="improperly_configured_service",
-                        message=_("Connection check failed for Service: %(label)s")
-                        % {"label": service.label},
+                        message=message % {"label": service.label},
                         severity="error",
                         model="zgw_consumers.models.Service",
                     )
@@ -227,6 +259,73 @@ class PluginHealthCheck:
         return self.plugin.check_config()
 
 
+@dataclass
+class CompletedHealthCheck:
+    """A health check of which the result was already computed."""
+
+    identifier: Slug
+    verbose_name: str
+    result: HealthCheckResult
+
+    def __call__(self) -> HealthCheckResult:
+        return self.result
+
+
+def _get_connection_check(service: Service) -> int | None:
+    # The request doesn't outlive the check (the instance is not saved)
+    service.timeout = settings.HEALTH_CHECK_TIMEOUT
+    try:
+        return service.connection_check
+    finally:
+        connections.close_all()
+
+
+def _run_concurrently[R](
+    functions: list[Callable[[], R]], timeout: float
+) -> list[Future[R]]:
+    """Call the functions concurrently and return once all completed or the timeout passed.
+
+    The functions that are still running at that time are not waited for, the ones
+    that did not start yet are cancelled.
+    """
+    futures = [_executor.submit(function) for function in functions]
+    wait(futures, timeout=timeout)
+    for future in futures:
+        future.cancel()
+    return futures
+
+
+def run_and_cache_checks(checks: list[HealthCheck]) -> list[CompletedHealthCheck]:
+    """Run the checks, recording how long each took, and cache their results."""
+    if settings.HEALTH_CHECK_CACHE_TIMEOUT and (
+        results := cache.get(HEALTH_CHECKS_CACHE_KEY)
+    ):
+        return results
+
+    results = []
+    for check in checks:
+        start = time.perf_counter()
+        result = check()
+        if isinstance(result, CheckResult):
+            result.duration = round((time.perf_counter() - start) * 1000)
+
+        results.append(
+            CompletedHealthCheck(
+                identifier=check.identifier,
+                verbose_name=check.verbose_name,
+                result=result,
+            )
+        )
+
+    if settings.HEALTH_CHECK_CACHE_TIMEOUT:
+        cache.set(
+            HEALTH_CHECKS_CACHE_KEY,
+            results,
+            timeout=settings.HEALTH_CHECK_CACHE_TIMEOUT,
+        )
+    return results
+
+
 def checks_collector() -> list[HealthCheck]:
     checks = [
         ServiceHealthCheck(),
@@ -245,4 +344,4 @@ def checks_collector() -> list[HealthCheck]:
         ]
     )
 
-    return checks
+    return run_and_cache_checks(checks)
@@ -1,18 +1,27 @@
-from django.test import TestCase
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from django.test import TestCase, override_settings
+from django.utils.translation import gettext as _
 
 from maykin_config_checks import run_checks
 from zgw_consumers.models import Service
+from zgw_consumers.test.factories import ServiceFactory
 
 from openarchiefbeheer.config.health_checks import (
     APIConfigCheck,
     ArchiveConfigHealthCheck,
     ServiceConfigurationHealthCheck,
     ServiceHealthCheck,
+    run_and_cache_checks,
 )
 from openarchiefbeheer.config.tests.factories import (
     APIConfigFactory,
     ArchiveConfigFactory,
 )
+from openarchiefbeheer.utils.health_checks import CheckResult
+from openarchiefbeheer.utils.tests.mixins import ClearCacheMixin
 
 
 class TestHealthChecks(TestCase):
@@ -71,3 +80,89 @@ class TestHealthChecks(TestCase):
         self.assertFalse(check_result.success)
         self.assertEqual(check_result.extra[0].field, "zaaktype")
         self.assertEqual(check_result.extra[0].code, "invalid_field")
+
+
+class TestRunHealthChecks(ClearCacheMixin, TestCase):
+    @override_settings(HEALTH_CHECK_TIMEOUT=0.1)
+    def test_slow_service_times_out(self):
+        Service.objects.all().delete()
+        service = ServiceFactory.create()
+
+        with patch.object(
+            Service,
+            "connection_check",
+            new_callable=PropertyMock,
+            side_effect=lambda: time.sleep(1),
+        ):
+            start = time.perf_counter()
+            result = ServiceConfigurationHealthCheck()()
+            duration = time.perf_counter() - start
+
+        self.assertLess(duration, 1)
+        self.assertFalse(result.success)
+        self.assertEqual(
+            result.extra[0].message,
+            _("Connection check timed out for Service: %(label)s")
+            % {"label": service.label},
+        )
+
+    @override_settings(HEALTH_CHECK_TIMEOUT=0.1)
+    def test_more_services_than_workers(self):
+        Service.objects.all().delete()
+        service1, service2 = ServiceFactory.create_batch(2)
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+
+        with (
+            patch("openarchiefbeheer.config.health_checks._executor", new=executor),
+            patch.object(
+                Service,
+                "connection_check",
+                new_callable=PropertyMock,
+                side_effect=lambda: time.sleep(0.5),
+            ),
+        ):
+            result = ServiceConfigurationHealthCheck()()
+
+        self.assertFalse(result.success)
+        self.assertCountEqual(
+            [extra.message for extra in result.extra],
+            [
+                _("Connection check timed out for Service: %(label)s")
+                % {"label": service.label}
+                for service in (service1, service2)
+            ],
+        )
+
+    @override_settings(HEALTH_CHECK_CACHE_TIMEOUT=30)
+    def test_results_cached_with_duration(self):
+        check = MagicMock(
+            identifier="dummy",
+            verbose_name="Dummy",
+            return_value=CheckResult(
+                identifier="dummy", verbose_name="Dummy", success=True, message=""
+            ),
+        )
+
+        run_and_cache_checks([check])
+        results = run_and_cache_checks([check])
+
+        check.assert_called_once()
+        self.assertEqual(results[0].identifier, "dummy")
+        self.assertIsInstance(results[0]().duration, int)
+
+    @override_settings(HEALTH_CHECK_CACHE_TIMEOUT=30)
+    def test_cached_results_cleared_when_service_changes(self):
+        check = MagicMock(
+            identifier="dummy",
+            verbose_name="Dummy",
+            return_value=CheckResult(
+                identifier="dummy", verbose_name="Dummy", success=True, message=""
+            ),
+        )
+
+        run_and_cache_checks([check])
+        ServiceFactory.create()
+        run_and_cache_checks([check])
+
+        self.assertEqual(check.call_count, 2)
@@ -1,8 +1,8 @@
-from typing import Any, Iterable
+from typing import Any
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import F, Q, QuerySet
+from django.db.models import Manager, Q, QuerySet
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.plumbing import build_basic_type
@@ -21,6 +21,7 @@ from openarchiefbeheer.zaken.api.serializers import ZaakSerializer
 from openarchiefbeheer.zaken.models import Zaak
 from openarchiefbeheer.zaken.utils import (
     fetch_supported_zaakobjects,
+    fetch_supported_zaakobjects_counts,
     retrieve_selectielijstklasse_resultaat,
 )
 
@@ -53,9 +54,16 @@ class DestructionListKanbanSerializer(serializers.Serializer):
     def to_representation(self, queryset):
         data = {status.label: [] for status in ListStatus}
 
-        for destruction_list in queryset:
+        # Serialize all lists at once, so that the prefetched relations are shared.
+        destruction_lists = list(queryset)
+        serialized_lists = DestructionListReadSerializer(
+            destruction_lists, many=True
+        ).data
+        for destruction_list, serialized_list in zip(
+            destruction_lists, serialized_lists, strict=True
+        ):
             label = ListStatus(destruction_list.status).label
-            data[label].append(DestructionListReadSerializer(destruction_list).data)
+            data[label].append(serialized_list)
 
         # The queryset only includes recently destroyed lists, update the label.
         data[_("recently destroyed")] = data.pop(ListStatus.deleted.label)
@@ -332,6 +340,37 @@ class DestructionListItemWriteSerializer(serializers.ModelSerializer):
         return attrs
 
 
+def _get_stored_supported_count(item: DestructionListItem) -> int | None:
+    """Return the number of supported related objects stored during the sync."""
+    if hasattr(item, "supported_related_objects_count"):
+        return item.supported_related_objects_count
+
+    if item.zaak.supported_zaakobjecten is not None:
+        return len(item.zaak.supported_zaakobjecten)
+
+
+class DestructionListItemReadListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+
+        # Retrieve the related objects of all the zaken at once, instead of one
+        # zaak at a time while serializing the items. Only needed for the zaken
+        # of which the related objects were not stored during the sync.
+        if (
+            not settings.FEATURE_RELATED_COUNT_DISABLED
+            and "supported_related_objects_counts" not in self.context
+        ):
+            self.context["supported_related_objects_counts"] = (
+                fetch_supported_zaakobjects_counts(
+                    item.zaak.url
+                    for item in items
+                    if item.zaak and _get_stored_supported_count(item) is None
+                )
+            )
+
+        return super().to_representation(items)
+
+
 class DestructionListItemReadSerializer(serializers.ModelSerializer):
     zaak = ZaakSerializer(allow_null=True, read_only=True)
     review_advice_ignored = serializers.SerializerMethodField(
@@ -365,6 +404,13 @@ class DestructionListItemReadSerializer(serializers.ModelSerializer):
 
         if item.zaak is None:
             return 0
+
+        if (stored_count := _get_stored_supported_count(item)) is not None:
+            return stored_count
+
+        counts = self.context.get("supported_related_objects_counts", {})
+        if item.zaak.url in counts:
+            return counts[item.zaak.url]
         return len(fetch_supported_zaakobjects(item.zaak.url))
 
     def get_selected_related_objects_count(
@@ -380,6 +426,7 @@ class DestructionListItemReadSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = DestructionListItem
+        list_serializer_class = DestructionListItemReadListSerializer
         fields = (
             "pk",
             "status",
@@ -516,19 +563,26 @@ class DestructionListWriteSerializer(serializers.ModelSerializer):
 
         return attrs
 
-    def _get_zaken(
-        self, zaak_filters: dict, items: list[dict], bulk_select: bool
-    ) -> Iterable[Zaak]:
+    def _add_items(
+        self,
+        destruction_list: DestructionList,
+        zaak_filters: dict,
+        items: list[dict],
+        bulk_select: bool,
+        ignore_conflicts: bool = False,
+    ) -> None:
         if bulk_select:
             zaak_filters.update({"not_in_destruction_list": True})
             filterset = ZaakFilterSet(data=zaak_filters)
             filterset.is_valid()
 
-            zaken = filterset.qs
+            # Insert the items directly from the filtered zaken, without loading
+            # them in memory.
+            destruction_list.add_items_from_queryset(filterset.qs, ignore_conflicts)
         else:
-            zaken = [item["zaak"] for item in items]
-
-        return zaken
+            destruction_list.add_items(
+                [item["zaak"] for item in items], ignore_conflicts
+            )
 
     def create(self, validated_data: dict) -> DestructionList:
         reviewer_data = validated_data.pop("reviewer")
@@ -542,8 +596,7 @@ class DestructionListWriteSerializer(serializers.ModelSerializer):
         validated_data["status"] = ListStatus.new
         destruction_list = DestructionList.objects.create(**validated_data)
 
-        zaken = self._get_zaken(zaak_filters, add, bulk_select)
-        destruction_list.add_items(zaken)
+        self._add_items(destruction_list, zaak_filters, add, bulk_select)
 
         # Create an assignee also for the author
         DestructionListAssignee.objects.create(
@@ -576,8 +629,9 @@ class DestructionListWriteSerializer(serializers.ModelSerializer):
         instance.name = validated_data.pop("name", instance.name)
 
         if add_data or bulk_select:
-            zaken = self._get_zaken(zaak_filters, add_data, bulk_select)
-            self.instance.add_items(zaken, True)
+            self._add_items(
+                instance, zaak_filters, add_data, bulk_select, ignore_conflicts=True
+            )
 
         if remove_data:
             zaken = [item["zaak"] for item in remove_data]
@@ -618,11 +672,52 @@ class DestructionListReadSerializer(serializers.ModelSerializer):
         )
 
     def get_deletable_items_count(self, instance: DestructionList) -> int:
-        succeeded_count = instance.items.filter(
-            processing_status=InternalStatus.succeeded
-        ).count()
-        total_count = instance.items.filter(status=ListItemStatus.suggested).count()
-        return total_count - succeeded_count
+        return instance.get_summary().deletable_items_count
+
+
+class DestructionListProgressSerializer(serializers.Serializer):
+    processing_status = serializers.ChoiceField(choices=InternalStatus.choices)
+    started = serializers.DateTimeField(
+        help_text=_("When the (last attempt of the) destruction started."),
+        allow_null=True,
+    )
+    succeeded_items_count = serializers.IntegerField(
+        help_text=_("Number of items that were successfully deleted.")
+    )
+    failed_items_count = serializers.IntegerField(
+        help_text=_("Number of items whose deletion failed.")
+    )
+    remaining_items_count = serializers.IntegerField(
+        help_text=_("Number of items that still need to be processed.")
+    )
+    requests_counts = serializers.DictField(
+        child=serializers.IntegerField(),
+        help_text=_(
+            "Number of requests made to the APIs during the destruction, "
+            "per resource type."
+        ),
+    )
+    items_per_minute = serializers.FloatField(
+        help_text=_(
+            "Average number of items processed per minute in the last minutes, "
+            "while the destruction is being processed."
+        ),
+        allow_null=True,
+    )
+    estimated_completion = serializers.DateTimeField(
+        help_text=_(
+            "When all the items are expected to be processed, "
+            "based on the current throughput."
+        ),
+        allow_null=True,
+    )
+    last_activity = serializers.DateTimeField(
+        help_text=_(
+            "When the progress was last updated by a worker. The progress is "
+            "updated periodically, so it can lag behind."
+        ),
+        allow_null=True,
+    )
 
 
 class ZakenReviewSerializer(serializers.Serializer):
@@ -690,50 +785,39 @@ class DestructionListReviewSerializer(serializers.ModelSerializer):
             )
 
         if len(zaken_reviews) > 0:
-            destruction_list_items = (
-                attrs["destruction_list"]
-                .items.filter(status=ListItemStatus.suggested)
-                .select_related("zaak")
-                .values_list("zaak__url", flat=True)
+            destruction_list = attrs["destruction_list"]
+            self._item_pks_by_zaak_url = destruction_list.get_item_pks_by_zaak_url(
+                {zaak_review["zaak_url"] for zaak_review in zaken_reviews}
             )
 
-            for zaak_review in zaken_reviews:
-                if zaak_review["zaak_url"] not in destruction_list_items:
-                    raise ValidationError(
-                        {
-                            "zaken_reviews": _(
-                                "You can only provide feedback about cases that are part of the destruction list."
-                            )
-                        }
-                    )
+            if any(
+                zaak_review["zaak_url"] not in self._item_pks_by_zaak_url
+                for zaak_review in zaken_reviews
+            ):
+                raise ValidationError(
+                    {
+                        "zaken_reviews": _(
+                            "You can only provide feedback about cases that are part of the destruction list."
+                        )
+                    }
+                )
 
         return attrs
 
     def create(self, validated_data: dict) -> DestructionListReview:
         zaken_reviews = validated_data.pop("zaken_reviews", [])
-        destruction_list_items_with_changes = (
-            validated_data["destruction_list"]
-            .items.select_related("zaak")
-            .filter(
-                zaak__url__in=[zaak_review["zaak_url"] for zaak_review in zaken_reviews]
-            )
-            .distinct("zaak__url")
-            .annotate(zaak_url=F("zaak__url"))
-        )
 
         validated_data["author"] = self.context["request"].user
         review = DestructionListReview.objects.create(**validated_data)
 
         review_items_data = [
             DestructionListItemReview(
-                **{
-                    "destruction_list_item": destruction_list_items_with_changes.get(
-                        zaak_url=zaak_review["zaak_url"]
-                    ),
-                    "destruction_list": validated_data["destruction_list"],
-                    "review": review,
-                    "feedback": zaak_review["feedback"],
-                }
+                destruction_list_item_id=self._item_pks_by_zaak_url[
+                    zaak_review["zaak_url"]
+                ],
+                destruction_list=validated_data["destruction_list"],
+                review=review,
+                feedback=zaak_review["feedback"],
             )
             for zaak_review in zaken_reviews
         ]
@@ -59,13 +59,7 @@ class DestructionListKanbanView(ListAPIView):
         return (
             DestructionList.objects.active()
             .annotate_user_permissions()
-            .select_related("author", "assignee")
-            .prefetch_related(
-                "assignees",
-                "assignees__user",
-                "assignees__user__groups__permissions",
-                "assignees__user__user_permissions",
-            )
+            .select_related("summary")
         )
 
     def get_serializer(self, qs: DestructionListQuerySet, *args, **kwargs):
@@ -3,7 +3,18 @@ from datetime import date, timedelta
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import Case, OuterRef, Q, QuerySet, Subquery, Value, When
+from django.db.models import (
+    Case,
+    F,
+    Func,
+    IntegerField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
 from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils.translation import gettext_lazy as _
@@ -17,9 +28,9 @@ from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from slugify import slugify
-from zgw_consumers.client import build_client
 from zgw_consumers.models import Service
 
+from openarchiefbeheer.clients import build_client
 from openarchiefbeheer.logging import logevent
 from openarchiefbeheer.utils.paginators import PageNumberPagination
 from openarchiefbeheer.zaken.api.filtersets import ZaakFilterSet
@@ -43,6 +54,7 @@ from ..models import (
     ReviewItemResponse,
     ReviewResponse,
 )
+from ..progress import get_progress
 from ..tasks import delete_destruction_list
 from .backends import NestedFilterBackend, NestedOrderingFilterBackend
 from .filtersets import (
@@ -75,6 +87,7 @@ from .serializers import (
     DestructionListCoReviewSerializer,
     DestructionListItemReadSerializer,
     DestructionListItemReviewSerializer,
+    DestructionListProgressSerializer,
     DestructionListReadSerializer,
     DestructionListReviewSerializer,
     DestructionListWriteSerializer,
@@ -226,6 +239,17 @@ logger = logging.getLogger(__name__)
         request=None,
         responses={200: None},
     ),
+    progress=extend_schema(
+        tags=["Destruction list"],
+        summary=_("Destruction progress"),
+        description=_(
+            "Retrieve the progress of the destruction of the list: the number of "
+            "processed items, the requests made to the APIs, the throughput and "
+            "the estimated completion."
+        ),
+        request=None,
+        responses={200: DestructionListProgressSerializer},
+    ),
 )
 class DestructionListViewSet(
     mixins.RetrieveModelMixin,
@@ -274,7 +298,7 @@ class DestructionListViewSet(
         return (
             DestructionList.objects.permitted_for_user(self.request.user)
             .annotate_user_permissions()
-            .select_related("author", "assignee")
+            .select_related("author", "assignee", "summary")
             .prefetch_related("assignees")
         )
 
@@ -493,6 +517,14 @@ class DestructionListViewSet(
                     status=502,
                 )
 
+    @action(detail=True, methods=["get"], name="progress")
+    def progress(self, request, *args, **kwargs):
+        destruction_list = self.get_object()
+        serializer = DestructionListProgressSerializer(
+            instance=get_progress(destruction_list)
+        )
+        return Response(serializer.data)
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -532,8 +564,14 @@ class DestructionListItemsViewSet(
             # NOTE: `zaakgeometrie` is not used in OAB but costly to retrieve.
             # NOTE: this is disabled to improve performance.
             # NOTE: if restored, make sure to restore `ZaakSerializer` in `serializers.py`.
-            .defer("zaak__zaakgeometrie")
+            .defer("zaak__zaakgeometrie", "zaak__supported_zaakobjecten")
             .annotate(
+                # Only the number of stored related objects is needed
+                supported_related_objects_count=Func(
+                    F("zaak__supported_zaakobjecten"),
+                    function="jsonb_array_length",
+                    output_field=IntegerField(),
+                ),
                 last_review_comment=Subquery(
                     review_response_items.values("comment")[:1]
                 ),
@@ -12,6 +12,7 @@ from openarchiefbeheer.clients import brc_client, drc_client, zrc_client
 from openarchiefbeheer.external_registers.registry import register as registry
 from openarchiefbeheer.external_registers.utils import get_plugin_for_related_object
 from openarchiefbeheer.zaken.utils import (
+    bump_zaken_version,
     get_zaak_metadata,
     pagination_helper,
 )
@@ -218,6 +219,7 @@ def delete_zaak(item: DestructionListItem) -> None:
 
     # Clean up Zaak object in OAB
     item.zaak.delete()
+    bump_zaken_version()
     item.zaak = None
     item._zaak_url = ""
     item.save()
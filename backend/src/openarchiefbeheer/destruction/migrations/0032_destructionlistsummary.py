@@ -0,0 +1,105 @@
+# Generated by Django 5.2.17 on 2026-10-19 15:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("destruction", "0031_alter_destructionlist_destruction_report"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DestructionListSummary",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "suggested_items_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of items that are suggested for destruction.",
+                        verbose_name="suggested items count",
+                    ),
+                ),
+                (
+                    "removed_items_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of items removed from the list during review.",
+                        verbose_name="removed items count",
+                    ),
+                ),
+                (
+                    "succeeded_items_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of suggested items that were successfully deleted.",
+                        verbose_name="succeeded items count",
+                    ),
+                ),
+                (
+                    "min_archiefactiedatum",
+                    models.DateField(
+                        blank=True, null=True, verbose_name="minimum archiefactiedatum"
+                    ),
+                ),
+                (
+                    "max_archiefactiedatum",
+                    models.DateField(
+                        blank=True, null=True, verbose_name="maximum archiefactiedatum"
+                    ),
+                ),
+                (
+                    "zaaktypen",
+                    models.JSONField(
+                        default=list,
+                        help_text="The (most recent version of the) zaaktypen of the zaken.",
+                        verbose_name="zaaktypen",
+                    ),
+                ),
+                (
+                    "resultaten",
+                    models.JSONField(
+                        default=list,
+                        help_text="The distinct resultaten of the zaken.",
+                        verbose_name="resultaten",
+                    ),
+                ),
+                (
+                    "archiefnominaties",
+                    models.JSONField(
+                        default=list,
+                        help_text="The distinct archiefnominaties of the zaken.",
+                        verbose_name="archiefnominaties",
+                    ),
+                ),
+                (
+                    "updated",
+                    models.DateTimeField(auto_now=True, verbose_name="updated"),
+                ),
+                (
+                    "destruction_list",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="summary",
+                        to="destruction.destructionlist",
+                        verbose_name="destruction list",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "destruction list summary",
+                "verbose_name_plural": "destruction list summaries",
+            },
+        ),
+    ]
@@ -0,0 +1,73 @@
+# Generated by Django 5.2.17 on 2026-10-19 16:20
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def populate_failed_items_count(apps, schema_editor):
+    DestructionListItem = apps.get_model("destruction", "DestructionListItem")
+    DestructionListSummary = apps.get_model("destruction", "DestructionListSummary")
+
+    failed_items = (
+        DestructionListItem.objects.filter(
+            destruction_list=OuterRef("destruction_list"),
+            status="suggested",
+            processing_status="failed",
+        )
+        .order_by()
+        .values("destruction_list")
+        .annotate(count=Count("pk"))
+        .values("count")
+    )
+    DestructionListSummary.objects.update(
+        failed_items_count=Coalesce(Subquery(failed_items), 0)
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("destruction", "0032_destructionlistsummary"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="destructionlistsummary",
+            name="failed_items_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of suggested items whose deletion failed.",
+                verbose_name="failed items count",
+            ),
+        ),
+        migrations.AddField(
+            model_name="destructionlistsummary",
+            name="destruction_started",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="When the (last attempt of the) destruction of the list started.",
+                null=True,
+                verbose_name="destruction started",
+            ),
+        ),
+        migrations.AddField(
+            model_name="destructionlistsummary",
+            name="requests_counts",
+            field=models.JSONField(
+                default=dict,
+                help_text="Number of requests made to the APIs during the destruction, per resource type.",
+                verbose_name="requests counts",
+            ),
+        ),
+        migrations.AddField(
+            model_name="destructionlistsummary",
+            name="throughput_samples",
+            field=models.JSONField(
+                default=list,
+                help_text="Pairs of a timestamp and of the number of items processed since the start of the destruction, used to compute the throughput.",
+                verbose_name="throughput samples",
+            ),
+        ),
+        migrations.RunPython(populate_failed_items_count, migrations.RunPython.noop),
+    ]
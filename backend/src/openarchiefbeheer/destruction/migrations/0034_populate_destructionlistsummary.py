@@ -0,0 +1,59 @@
+# Generated by Django 5.2.17 on 2026-10-19 18:05
+
+from django.db import migrations
+from django.db.models import Count, Max, Min, Q
+
+
+def populate_summaries(apps, schema_editor):
+    DestructionList = apps.get_model("destruction", "DestructionList")
+    DestructionListSummary = apps.get_model("destruction", "DestructionListSummary")
+
+    for destruction_list in DestructionList.objects.filter(
+        summary__isnull=True
+    ).iterator():
+        items = destruction_list.items.all()
+        counts = items.aggregate(
+            suggested_items_count=Count("pk", filter=Q(status="suggested")),
+            removed_items_count=Count("pk", filter=Q(status="removed")),
+            succeeded_items_count=Count(
+                "pk", filter=Q(status="suggested", processing_status="succeeded")
+            ),
+            failed_items_count=Count(
+                "pk", filter=Q(status="suggested", processing_status="failed")
+            ),
+            min_archiefactiedatum=Min("zaak__archiefactiedatum"),
+            max_archiefactiedatum=Max("zaak__archiefactiedatum"),
+        )
+        DestructionListSummary.objects.create(
+            destruction_list=destruction_list,
+            **counts,
+            zaaktypen=list(
+                items.order_by(
+                    "zaak___expand__zaaktype__identificatie",
+                    "-zaak___expand__zaaktype__versiedatum",
+                )
+                .distinct("zaak___expand__zaaktype__identificatie")
+                .values_list("zaak___expand__zaaktype", flat=True)
+            ),
+            resultaten=list(
+                items.distinct("zaak__resultaat")
+                .values_list("zaak___expand__resultaat", flat=True)
+                .distinct()
+            ),
+            archiefnominaties=list(
+                items.distinct("zaak__archiefnominatie").values_list(
+                    "zaak__archiefnominatie", flat=True
+                )
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("destruction", "0033_destructionlistsummary_progress"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_summaries, migrations.RunPython.noop),
+    ]
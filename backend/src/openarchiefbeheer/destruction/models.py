@@ -5,8 +5,8 @@ from typing import TYPE_CHECKING, Iterable, Optional
 
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.postgres.fields import ArrayField
-from django.db import models, transaction
-from django.db.models import Q, QuerySet
+from django.db import connection, models, transaction
+from django.db.models import Count, F, Max, Min, Q, QuerySet
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
@@ -147,18 +147,157 @@ class DestructionList(models.Model):
     def add_items(
         self, zaken: Iterable["Zaak"], ignore_conflicts: bool = False
     ) -> list["DestructionListItem"]:
-        return DestructionListItem.objects.bulk_create(
-            [
-                DestructionListItem(
-                    destruction_list=self, zaak=zaak, _zaak_url=zaak.url
-                )
-                for zaak in zaken
-            ],
-            ignore_conflicts=ignore_conflicts,
+        with transaction.atomic():
+            items = DestructionListItem.objects.bulk_create(
+                [
+                    DestructionListItem(
+                        destruction_list=self, zaak=zaak, _zaak_url=zaak.url
+                    )
+                    for zaak in zaken
+                ],
+                ignore_conflicts=ignore_conflicts,
+            )
+            self.refresh_summary()
+        return items
+
+    def add_items_from_queryset(
+        self, zaken: QuerySet["Zaak"], ignore_conflicts: bool = False
+    ) -> int:
+        """Add the zaken to the list with a single ``INSERT ... SELECT`` statement.
+
+        Contrary to ``add_items``, the zaken are never loaded in memory, which
+        makes it suitable for adding a large number of zaken at once (for example
+        when all the zaken matching some filters are selected).
+        Returns the number of items created.
+        """
+        opts = DestructionListItem._meta
+        columns = ", ".join(
+            connection.ops.quote_name(opts.get_field(name).column)
+            for name in (
+                "destruction_list",
+                "zaak",
+                "_zaak_url",
+                "status",
+                "processing_status",
+                "excluded_relations",
+            )
         )
+        select_sql, select_params = zaken.values_list(
+            "pk", "url"
+        ).query.sql_with_params()
+
+        sql = (
+            f"INSERT INTO {connection.ops.quote_name(opts.db_table)} ({columns}) "
+            f"SELECT %s, zaken.pk, zaken.url, %s, %s, '{{}}'::varchar[] "
+            f"FROM ({select_sql}) AS zaken (pk, url)"
+        )
+        if ignore_conflicts:
+            sql += " ON CONFLICT DO NOTHING"
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                sql,
+                (
+                    self.pk,
+                    ListItemStatus.suggested,
+                    InternalStatus.new,
+                    *select_params,
+                ),
+            )
+            self.refresh_summary()
+            return cursor.rowcount
+
+    def get_item_pks_by_zaak_url(
+        self, zaak_urls: Iterable[str], status: str = ListItemStatus.suggested
+    ) -> dict[str, int]:
+        """Map the URLs of the zaken to the primary keys of the items on the list.
+
+        The URLs are passed as a single array parameter and joined with ``unnest``,
+        instead of building a (possibly very long) ``IN`` clause.
+        URLs of zaken that are not on the list with the given status are left out.
+        """
+        items_sql, items_params = (
+            self.items.filter(status=status)
+            .values_list("zaak__url", "pk")
+            .query.sql_with_params()
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT items.url, items.pk "
+                "FROM unnest(%s::text[]) AS urls (url) "
+                f"JOIN ({items_sql}) AS items (url, pk) ON items.url = urls.url",
+                (list(zaak_urls), *items_params),
+            )
+            return dict(cursor.fetchall())
 
     def remove_items(self, zaken: Iterable["Zaak"]) -> tuple[int, dict[str, int]]:
-        return self.items.filter(zaak__in=zaken).delete()
+        with transaction.atomic():
+            deleted = self.items.filter(zaak__in=zaken).delete()
+            self.refresh_summary()
+        return deleted
+
+    def refresh_summary(self) -> "DestructionListSummary":
+        """Recompute the summary statistics of the items on the list.
+
+        Should be called in the same transaction as the changes to the items.
+        """
+        counts = self.items.aggregate(
+            suggested_items_count=Count(
+                "pk", filter=Q(status=ListItemStatus.suggested)
+            ),
+            removed_items_count=Count("pk", filter=Q(status=ListItemStatus.removed)),
+            succeeded_items_count=Count(
+                "pk",
+                filter=Q(
+                    status=ListItemStatus.suggested,
+                    processing_status=InternalStatus.succeeded,
+                ),
+            ),
+            failed_items_count=Count(
+                "pk",
+                filter=Q(
+                    status=ListItemStatus.suggested,
+                    processing_status=InternalStatus.failed,
+                ),
+            ),
+            min_archiefactiedatum=Min("zaak__archiefactiedatum"),
+            max_archiefactiedatum=Max("zaak__archiefactiedatum"),
+        )
+
+        summary, _ = DestructionListSummary.objects.update_or_create(
+            destruction_list=self,
+            defaults={
+                **counts,
+                # The most recent version of each zaaktype
+                "zaaktypen": list(
+                    self.items.order_by(
+                        "zaak___expand__zaaktype__identificatie",
+                        "-zaak___expand__zaaktype__versiedatum",
+                    )
+                    .distinct("zaak___expand__zaaktype__identificatie")
+                    .values_list("zaak___expand__zaaktype", flat=True)
+                ),
+                "resultaten": list(
+                    self.items.distinct("zaak__resultaat")
+                    .values_list("zaak___expand__resultaat", flat=True)
+                    .distinct()
+                ),
+                "archiefnominaties": list(
+                    self.items.distinct("zaak__archiefnominatie").values_list(
+                        "zaak__archiefnominatie", flat=True
+                    )
+                ),
+            },
+        )
+        self.summary = summary
+        return summary
+
+    def get_summary(self) -> "DestructionListSummary":
+        try:
+            return self.summary
+        except DestructionListSummary.DoesNotExist:
+            return self.refresh_summary()
 
     def get_author(self) -> "DestructionListAssignee":
         return self.assignees.get(role=ListRole.author)
@@ -244,6 +383,98 @@ class DestructionList(models.Model):
         )
 
 
+class DestructionListSummary(models.Model):
+    destruction_list = models.OneToOneField(
+        DestructionList,
+        on_delete=models.CASCADE,
+        related_name="summary",
+        verbose_name=_("destruction list"),
+    )
+    suggested_items_count = models.PositiveIntegerField(
+        _("suggested items count"),
+        help_text=_("Number of items that are suggested for destruction."),
+        default=0,
+    )
+    removed_items_count = models.PositiveIntegerField(
+        _("removed items count"),
+        help_text=_("Number of items removed from the list during review."),
+        default=0,
+    )
+    succeeded_items_count = models.PositiveIntegerField(
+        _("succeeded items count"),
+        help_text=_("Number of suggested items that were successfully deleted."),
+        default=0,
+    )
+    failed_items_count = models.PositiveIntegerField(
+        _("failed items count"),
+        help_text=_("Number of suggested items whose deletion failed."),
+        default=0,
+    )
+    min_archiefactiedatum = models.DateField(
+        _("minimum archiefactiedatum"), null=True, blank=True
+    )
+    max_archiefactiedatum = models.DateField(
+        _("maximum archiefactiedatum"), null=True, blank=True
+    )
+    zaaktypen = models.JSONField(
+        _("zaaktypen"),
+        help_text=_("The (most recent version of the) zaaktypen of the zaken."),
+        default=list,
+    )
+    resultaten = models.JSONField(
+        _("resultaten"),
+        help_text=_("The distinct resultaten of the zaken."),
+        default=list,
+    )
+    archiefnominaties = models.JSONField(
+        _("archiefnominaties"),
+        help_text=_("The distinct archiefnominaties of the zaken."),
+        default=list,
+    )
+    destruction_started = models.DateTimeField(
+        _("destruction started"),
+        help_text=_("When the (last attempt of the) destruction of the list started."),
+        null=True,
+        blank=True,
+    )
+    requests_counts = models.JSONField(
+        _("requests counts"),
+        help_text=_(
+            "Number of requests made to the APIs during the destruction, "
+            "per resource type."
+        ),
+        default=dict,
+    )
+    throughput_samples = models.JSONField(
+        _("throughput samples"),
+        help_text=_(
+            "Pairs of a timestamp and of the number of items processed since the "
+            "start of the destruction, used to compute the throughput."
+        ),
+        default=list,
+    )
+    updated = models.DateTimeField(_("updated"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("destruction list summary")
+        verbose_name_plural = _("destruction list summaries")
+
+    def __str__(self):
+        return f"Summary of {self.destruction_list}"
+
+    @property
+    def deletable_items_count(self) -> int:
+        return self.suggested_items_count - self.succeeded_items_count
+
+    @property
+    def remaining_items_count(self) -> int:
+        return (
+            self.suggested_items_count
+            - self.succeeded_items_count
+            - self.failed_items_count
+        )
+
+
 class DestructionListItem(models.Model):
     destruction_list = models.ForeignKey(
         DestructionList,
@@ -308,8 +539,24 @@ class DestructionListItem(models.Model):
         return super().save(*args, **kwargs)
 
     def set_processing_status(self, status: InternalStatus) -> None:
-        self.processing_status = status
-        self.save()
+        counts = {}
+        if self.status == ListItemStatus.suggested and status != self.processing_status:
+            if status == InternalStatus.succeeded:
+                counts["succeeded_items_count"] = F("succeeded_items_count") + 1
+            elif status == InternalStatus.failed:
+                counts["failed_items_count"] = F("failed_items_count") + 1
+            if self.processing_status == InternalStatus.failed:
+                # The item is processed again
+                counts["failed_items_count"] = F("failed_items_count") - 1
+
+        with transaction.atomic():
+            self.processing_status = status
+            self.save()
+
+            if counts:
+                DestructionListSummary.objects.filter(
+                    destruction_list_id=self.destruction_list_id
+                ).update(**counts)
 
 
 class DestructionListAssignee(models.Model):
@@ -559,24 +806,6 @@ class ReviewItemResponse(models.Model):
     def __str__(self):
         return f"Response to {self.review_item}"
 
-    def process(self) -> None:
-        if self.processing_status == InternalStatus.succeeded:
-            return
-
-        self.processing_status = InternalStatus.processing
-        self.save()
-
-        destruction_list_item = self.review_item.destruction_list_item
-
-        if self.action_item == DestructionListItemAction.remove:
-            destruction_list_item.status = ListItemStatus.removed
-            destruction_list_item.save()
-
-            destruction_list_item.zaak.update_data(self.action_zaak)
-
-        self.processing_status = InternalStatus.succeeded
-        self.save()
-
 
 class ResourceDestructionResult(models.Model):
     item = models.ForeignKey(
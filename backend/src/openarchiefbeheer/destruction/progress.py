@@ -0,0 +1,194 @@
+"""Progress and throughput of the destruction of the lists.
+
+The number of succeeded/failed items is kept up to date in the summary of the list
+when the status of an item changes. The requests made to the APIs and the processed
+items are counted in-process and periodically added to the summary, together with a
+sample of the number of processed items, from which the throughput is computed. The
+remaining counts are added at the end of each task (e.g. a chunk of items), so that
+the counts of a worker process are not held back until it processes another item.
+"""
+
+import threading
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from ape_pie import APIClient
+from celery.signals import task_postrun, worker_process_shutdown
+from requests import Response
+
+from openarchiefbeheer.utils.tracing import get_endpoint
+
+from .constants import InternalStatus
+from .models import DestructionList, DestructionListSummary
+
+_pending_requests: defaultdict[int, Counter[str]] = defaultdict(Counter)
+_pending_items: Counter[int] = Counter()
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+@dataclass
+class DestructionProgress:
+    processing_status: str
+    started: datetime | None
+    succeeded_items_count: int
+    failed_items_count: int
+    remaining_items_count: int
+    requests_counts: dict[str, int]
+    items_per_minute: float | None
+    estimated_completion: datetime | None
+    last_activity: datetime | None
+
+
+def start(destruction_list: DestructionList) -> None:
+    """Reset the progress, at the start of (a new attempt of) the destruction."""
+    summary = destruction_list.get_summary()
+    DestructionListSummary.objects.filter(pk=summary.pk).update(
+        destruction_started=timezone.now(),
+        requests_counts={},
+        throughput_samples=[[time.time(), 0]],
+    )
+
+
+def record_request(
+    destruction_list_pk: int, client: APIClient, response: Response, **kwargs
+) -> None:
+    """Response hook (see :func:`openarchiefbeheer.clients.response_hooks`)."""
+    resource_type = get_endpoint(client.base_url, response.request.url).split("/")[0]
+    with _lock:
+        _pending_requests[destruction_list_pk][resource_type] += 1
+
+
+def record_item(destruction_list_pk: int) -> None:
+    """Record that an item was processed and flush the counters when due.
+
+    Must be called from the thread of the task, as flushing accesses the database.
+    """
+    with _lock:
+        _pending_items[destruction_list_pk] += 1
+        should_flush = (
+            time.monotonic() - _last_flush
+            >= settings.DESTRUCTION_PROGRESS_FLUSH_INTERVAL
+        )
+
+    if should_flush:
+        flush()
+
+
+def _add_sample(samples: list[list[float]], timestamp: float, processed: int) -> None:
+    # The samples are (at least) one interval apart, except for the last one which
+    # is replaced until the next interval. The first sample is the start.
+    if (
+        len(samples) > 1
+        and timestamp - samples[-1][0] < settings.DESTRUCTION_PROGRESS_FLUSH_INTERVAL
+    ):
+        samples[-1] = [timestamp, processed]
+    else:
+        samples.append([timestamp, processed])
+
+    # Keep the last sample before the window, to compute the average over the
+    # whole window.
+    window_start = timestamp - settings.DESTRUCTION_PROGRESS_WINDOW
+    while len(samples) > 1 and samples[1][0] <= window_start:
+        samples.pop(0)
+
+
+def flush() -> None:
+    """Add the counters of this process to the summaries of the lists."""
+    global _last_flush
+
+    with _lock:
+        pending_requests = dict(_pending_requests)
+        pending_items = _pending_items.copy()
+        _pending_requests.clear()
+        _pending_items.clear()
+        _last_flush = time.monotonic()
+
+    now = time.time()
+    for destruction_list_pk in pending_requests.keys() | pending_items.keys():
+        with transaction.atomic():
+            summary = (
+                DestructionListSummary.objects.select_for_update()
+                .filter(destruction_list_id=destruction_list_pk)
+                .first()
+            )
+            if summary is None or not summary.throughput_samples:
+                continue
+
+            requests_counts = Counter(summary.requests_counts)
+            requests_counts.update(pending_requests.get(destruction_list_pk, {}))
+            summary.requests_counts = dict(requests_counts)
+
+            processed = summary.throughput_samples[-1][1] + pending_items.get(
+                destruction_list_pk, 0
+            )
+            _add_sample(summary.throughput_samples, now, processed)
+
+            summary.save(update_fields=["requests_counts", "throughput_samples"])
+
+
+@task_postrun.connect
+@worker_process_shutdown.connect
+def flush_remaining(**kwargs) -> None:
+    if _pending_requests or _pending_items:
+        flush()
+
+
+def get_items_per_minute(samples: list[list[float]], now: float) -> float | None:
+    """Return the average number of items processed per minute over the window.
+
+    The average is computed from the number of processed items in the last sample,
+    so that it drops when the processing stalls.
+    """
+    if not samples:
+        return None
+
+    window_start = now - settings.DESTRUCTION_PROGRESS_WINDOW
+    reference = samples[0]
+    for sample in samples[1:]:
+        if sample[0] > window_start:
+            break
+        reference = sample
+
+    elapsed = now - reference[0]
+    if elapsed <= 0:
+        return None
+    return (samples[-1][1] - reference[1]) / elapsed * 60
+
+
+def get_progress(destruction_list: DestructionList) -> DestructionProgress:
+    summary = destruction_list.get_summary()
+    samples = summary.throughput_samples
+    is_processing = destruction_list.processing_status == InternalStatus.processing
+
+    items_per_minute = None
+    estimated_completion = None
+    if is_processing:
+        now = timezone.now()
+        items_per_minute = get_items_per_minute(samples, now.timestamp())
+        if items_per_minute and summary.remaining_items_count:
+            estimated_completion = now + timedelta(
+                minutes=summary.remaining_items_count / items_per_minute
+            )
+
+    return DestructionProgress(
+        processing_status=destruction_list.processing_status,
+        started=summary.destruction_started,
+        succeeded_items_count=summary.succeeded_items_count,
+        failed_items_count=summary.failed_items_count,
+        remaining_items_count=summary.remaining_items_count,
+        requests_counts=summary.requests_counts,
+        items_per_minute=items_per_minute,
+        estimated_completion=estimated_completion,
+        last_activity=(
+            datetime.fromtimestamp(samples[-1][0], tz=timezone.get_current_timezone())
+            if samples
+            else None
+        ),
+    )
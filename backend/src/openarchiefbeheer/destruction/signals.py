@@ -1,17 +1,15 @@
+from functools import partial
+
 import django.dispatch
+from django.db import transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from openarchiefbeheer.emails.models import EmailConfig
 
-from .constants import ListRole, ReviewDecisionChoices
+from .constants import ListRole
 from .models import DestructionList, DestructionListAssignee, DestructionListReview
-from .utils import (
-    notify,
-    notify_author_changes_requested,
-    notify_author_positive_review,
-    notify_reviewer,
-)
+from .utils import notify, notify_reviewer
 
 user_assigned = django.dispatch.Signal()
 deletion_failure = django.dispatch.Signal()
@@ -24,13 +22,19 @@ def notify_author_after_review(sender, instance, created, **kwargs):
     if not created:
         return
 
-    destruction_list = review.destruction_list
-
-    if review.decision == ReviewDecisionChoices.rejected:
-        notify_author_changes_requested(destruction_list.author, destruction_list)
-        return
-
-    notify_author_positive_review(destruction_list.author, destruction_list)
+    # Imported here, since the tasks module depends on the signals defined here
+    from .tasks import send_review_notification
+
+    # The e-mail is rendered and sent in the background. The current assignee is
+    # passed along, because the list will have been assigned to the next reviewer
+    # by then. The reviewer is the author of the review.
+    transaction.on_commit(
+        partial(
+            send_review_notification.delay,
+            review.pk,
+            review.destruction_list.assignee_id,
+        )
+    )
 
 
 @receiver(user_assigned, sender=DestructionListAssignee)
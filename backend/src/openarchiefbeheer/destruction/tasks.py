@@ -1,12 +1,15 @@
 import logging
 import traceback
 from datetime import date
+from functools import partial
 
 from django.conf import settings
 
 from celery import chain
 
+from openarchiefbeheer.accounts.models import User
 from openarchiefbeheer.celery import app
+from openarchiefbeheer.clients import response_hooks
 from openarchiefbeheer.destruction.destruction_logic import (
     delete_besluiten_and_besluiteninformatieobjecten,
     delete_enkelvoudiginformatieobjecten,
@@ -20,18 +23,28 @@ from openarchiefbeheer.destruction.destruction_report import (
 )
 from openarchiefbeheer.logging import logevent
 
-from .constants import InternalStatus, ListItemStatus, ListStatus
+from . import progress
+from .constants import (
+    InternalStatus,
+    ListItemStatus,
+    ListStatus,
+    ReviewDecisionChoices,
+)
 from .exceptions import DeletionProcessingError
 from .models import (
     DestructionList,
     DestructionListItem,
+    DestructionListReview,
     ResourceDestructionResult,
     ReviewResponse,
 )
 from .signals import deletion_failure
 from .utils import (
     notify_assignees_successful_deletion,
+    notify_author_changes_requested,
+    notify_author_positive_review,
     prepopulate_selection_after_review_response,
+    process_review_item_responses,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,18 +61,9 @@ def process_review_response(pk: int) -> None:
         "review_item__destruction_list_item__zaak",
     )
 
-    for item_response in items_review_responses:
-        try:
-            item_response.process()
-        except Exception as exc:  # noqa: PERF203
-            logger.exception(
-                "An error occurred while processing the review item response",
-                exc_info=exc,
-            )
-
-            item_response.processing_status = InternalStatus.failed
-            item_response.save()
-            return
+    process_review_item_responses(items_review_responses)
+    if items_review_responses.filter(processing_status=InternalStatus.failed).exists():
+        return
 
     destruction_list = review_response.review.destruction_list
     prepopulate_selection_after_review_response(
@@ -70,6 +74,34 @@ def process_review_response(pk: int) -> None:
     logevent.destruction_list_review_response_processed(destruction_list)
 
 
+@app.task
+def send_review_notification(
+    review_pk: int, current_reviewer_pk: int | None = None
+) -> None:
+    """Notify the author of the list of the review.
+
+    The reviewer and the assignee at the time of the review are used, since other
+    reviews may have been done and the list reassigned by the time this runs.
+    """
+    review = DestructionListReview.objects.select_related(
+        "author", "destruction_list", "destruction_list__author"
+    ).get(pk=review_pk)
+    destruction_list = review.destruction_list
+
+    if review.decision == ReviewDecisionChoices.rejected:
+        notify_author_changes_requested(destruction_list.author, destruction_list)
+        return
+
+    current_reviewer = (
+        User.objects.filter(pk=current_reviewer_pk).first()
+        if current_reviewer_pk
+        else None
+    )
+    notify_author_positive_review(
+        destruction_list.author, destruction_list, review.author, current_reviewer
+    )
+
+
 def delete_destruction_list(destruction_list: DestructionList) -> None:
     if destruction_list.processing_status == InternalStatus.succeeded:
         logger.info(
@@ -88,6 +120,7 @@ def delete_destruction_list(destruction_list: DestructionList) -> None:
 
     destruction_list.processing_status = InternalStatus.processing
     destruction_list.save()
+    progress.start(destruction_list)
 
     items_pks = [
         (item.pk,)
@@ -124,6 +157,8 @@ def queue_destruction_lists_for_deletion():
 
 @app.task
 def handle_processing_error(pk: int) -> None:
+    progress.flush()
+
     destruction_list = DestructionList.objects.get(pk=pk)
     destruction_list.processing_status = InternalStatus.failed
     destruction_list.save()
@@ -177,21 +212,25 @@ def delete_destruction_list_item(pk: int) -> None:
     item.set_processing_status(InternalStatus.processing)
 
     try:
-        delete_external_relations(item)
-        delete_besluiten_and_besluiteninformatieobjecten(item)
-        delete_zaakinformatieobjecten(item)
-        delete_enkelvoudiginformatieobjecten(item)
-        delete_zaak(item)
+        with response_hooks(partial(progress.record_request, item.destruction_list_id)):
+            delete_external_relations(item)
+            delete_besluiten_and_besluiteninformatieobjecten(item)
+            delete_zaakinformatieobjecten(item)
+            delete_enkelvoudiginformatieobjecten(item)
+            delete_zaak(item)
     except Exception as exc:
         logger.error(msg="".join(traceback.format_exception(exc)))
         item.set_processing_status(InternalStatus.failed)
-        return
-
-    item.set_processing_status(InternalStatus.succeeded)
+    else:
+        item.set_processing_status(InternalStatus.succeeded)
+    finally:
+        progress.record_item(item.destruction_list_id)
 
 
 @app.task
 def complete_and_notify(pk: int) -> None:
+    progress.flush()
+
     destruction_list = DestructionList.objects.get(pk=pk)
     if destruction_list.has_failures():
         raise DeletionProcessingError()
@@ -28,7 +28,10 @@ class DestructionListAbortEndpointTest(APITestCase):
         )
 
         self.client.force_authenticate(user=reviewer)
-        with freezegun.freeze_time("2024-01-05T12:00:00+01:00"):
+        with (
+            freezegun.freeze_time("2024-01-05T12:00:00+01:00"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
             response = self.client.post(
                 reverse(
                     "api:destructionlist-abort",
@@ -51,7 +54,10 @@ class DestructionListAbortEndpointTest(APITestCase):
         )
 
         self.client.force_authenticate(user=record_manager)
-        with freezegun.freeze_time("2024-01-05T12:00:00+01:00"):
+        with (
+            freezegun.freeze_time("2024-01-05T12:00:00+01:00"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
             response = self.client.post(
                 reverse(
                     "api:destructionlist-abort",
@@ -75,7 +81,10 @@ class DestructionListAbortEndpointTest(APITestCase):
         )
 
         self.client.force_authenticate(user=record_manager)
-        with freezegun.freeze_time("2024-01-05T12:00:00+01:00"):
+        with (
+            freezegun.freeze_time("2024-01-05T12:00:00+01:00"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
             response = self.client.post(
                 reverse(
                     "api:destructionlist-abort",
@@ -110,7 +119,10 @@ class DestructionListAbortEndpointTest(APITestCase):
         )
 
         self.client.force_authenticate(user=record_manager)
-        with freezegun.freeze_time("2024-01-05T12:00:00+01:00"):
+        with (
+            freezegun.freeze_time("2024-01-05T12:00:00+01:00"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
             response = self.client.post(
                 reverse(
                     "api:destructionlist-abort",
@@ -166,7 +178,10 @@ class DestructionListAbortEndpointTest(APITestCase):
         )
 
         self.client.force_authenticate(user=record_manager)
-        with freezegun.freeze_time("2024-01-05T12:00:00+01:00"):
+        with (
+            freezegun.freeze_time("2024-01-05T12:00:00+01:00"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
             response = self.client.post(
                 reverse(
                     "api:destructionlist-abort",
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 from django.contrib.auth.models import Group
 from django.core import mail
-from django.test import tag
+from django.test import override_settings, tag
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import status
@@ -57,6 +57,7 @@ class CoReviewersViewSetTest(APITestCase):
             )
         )
 
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
     def test_fully_update_co_reviewers(self):
         destruction_list = DestructionListFactory.create(
             status=ListStatus.ready_to_review, name="A beautiful list"
@@ -95,6 +96,7 @@ class CoReviewersViewSetTest(APITestCase):
                     body_co_review_request_html="You have been invited to co-review.",
                 ),
             ),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             response = self.client.put(
                 reverse(
@@ -148,6 +150,7 @@ class CoReviewersViewSetTest(APITestCase):
             sorted([co_reviewer.email for co_reviewer in new_co_reviewers]),
         )
 
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
     def test_partially_update_co_reviewers(self):
         destruction_list = DestructionListFactory.create(
             status=ListStatus.ready_to_review, name="A beautiful list"
@@ -189,6 +192,7 @@ class CoReviewersViewSetTest(APITestCase):
                     body_co_review_request_html="You have been invited to co-review.",
                 ),
             ),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             response = self.client.patch(
                 reverse(
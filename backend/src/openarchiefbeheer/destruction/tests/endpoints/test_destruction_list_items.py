@@ -83,6 +83,79 @@ class DestructionListItemsViewSetTest(APITestCase):
             "http://zaken.nl/api/v1/zaken/333-333-333",
         )
 
+    @requests_mock.Mocker()
+    def test_related_objects_retrieved_once_per_zaak(self, m: requests_mock.Mocker):
+        ServiceFactory.create(
+            api_root="http://zaken.nl/zaken/api/v1/", api_type=APITypes.zrc
+        )
+        m.get(
+            "http://zaken.nl/zaken/api/v1/zaakobjecten",
+            json={"results": [{"object": "http://unsupported.nl/api/v1/1"}]},
+        )
+
+        record_manager = UserFactory.create(username="record_manager")
+        destruction_list = DestructionListFactory.create()
+        DestructionListItemFactory.create_batch(
+            3, with_zaak=True, destruction_list=destruction_list
+        )
+
+        self.client.force_authenticate(user=record_manager)
+        endpoint = furl(reverse("api:destruction-list-items-list"))
+        endpoint.args["item-destruction_list"] = destruction_list.uuid
+
+        response = self.client.get(endpoint.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+
+        self.assertEqual(len(data), 3)
+        for item in data:
+            self.assertEqual(item["supportedRelatedObjectsCount"], 0)
+            self.assertEqual(item["selectedRelatedObjectsCount"], 0)
+        self.assertEqual(
+            len(
+                [
+                    request
+                    for request in m.request_history
+                    if request.path.endswith("/zaakobjecten")
+                ]
+            ),
+            3,
+        )
+
+    @requests_mock.Mocker()
+    def test_stored_related_objects_used(self, m: requests_mock.Mocker):
+        record_manager = UserFactory.create(username="record_manager")
+        destruction_list = DestructionListFactory.create()
+        DestructionListItemFactory.create(
+            with_zaak=True,
+            zaak__supported_zaakobjecten=[
+                {
+                    "url": "http://zaken.nl/zaken/api/v1/zaakobjecten/1",
+                    "object": "http://openklant.nl/api/v1/onderwerpobjecten/1",
+                    "object_type": "overige",
+                    "plugin": "openklant",
+                }
+            ],
+            excluded_relations=["http://openklant.nl/api/v1/onderwerpobjecten/1"],
+            destruction_list=destruction_list,
+        )
+
+        self.client.force_authenticate(user=record_manager)
+        endpoint = furl(reverse("api:destruction-list-items-list"))
+        endpoint.args["item-destruction_list"] = destruction_list.uuid
+
+        response = self.client.get(endpoint.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()["results"]
+
+        self.assertEqual(data[0]["supportedRelatedObjectsCount"], 1)
+        self.assertEqual(data[0]["selectedRelatedObjectsCount"], 0)
+        self.assertEqual(len(m.request_history), 0)
+
     @requests_mock.Mocker()
     def test_filter_items_on_destruction_list(self, m: requests_mock.Mocker):
         ServiceFactory.create(
@@ -13,9 +13,14 @@ from zgw_consumers.test.factories import ServiceFactory
 
 from openarchiefbeheer.accounts.tests.factories import UserFactory
 
+from ... import progress
 from ...constants import InternalStatus, ListRole, ListStatus
 from ...models import DestructionList, DestructionListAssignee
-from ..factories import DestructionListAssigneeFactory, DestructionListFactory
+from ..factories import (
+    DestructionListAssigneeFactory,
+    DestructionListFactory,
+    DestructionListItemFactory,
+)
 
 
 class DestructionListViewsetTests(APITestCase):
@@ -415,3 +420,58 @@ class DestructionListViewsetTests(APITestCase):
                 destruction_list=destruction_list, user=reviewer1
             ).exists()
         )
+
+    def test_retrieve_progress(self):
+        user = UserFactory.create(post__can_start_destruction=True)
+        destruction_list = DestructionListFactory.create(
+            status=ListStatus.ready_to_delete,
+            processing_status=InternalStatus.processing,
+        )
+        item1, item2, _ = DestructionListItemFactory.create_batch(
+            3, destruction_list=destruction_list, with_zaak=True
+        )
+        destruction_list.refresh_summary()
+
+        with freeze_time("2024-08-29T16:00:00+02:00") as frozen_time:
+            progress.start(destruction_list)
+            item1.set_processing_status(InternalStatus.succeeded)
+            item2.set_processing_status(InternalStatus.failed)
+            progress.record_item(destruction_list.pk)
+            progress.record_item(destruction_list.pk)
+            progress.flush()
+
+            frozen_time.tick(60)
+            self.client.force_authenticate(user=user)
+            response = self.client.get(
+                reverse(
+                    "api:destructionlist-progress",
+                    kwargs={"uuid": destruction_list.uuid},
+                ),
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(data["processingStatus"], InternalStatus.processing)
+        self.assertEqual(data["succeededItemsCount"], 1)
+        self.assertEqual(data["failedItemsCount"], 1)
+        self.assertEqual(data["remainingItemsCount"], 1)
+        self.assertEqual(data["itemsPerMinute"], 2)
+        self.assertEqual(data["estimatedCompletion"], "2024-08-29T16:01:30+02:00")
+
+    def test_cannot_retrieve_progress_if_not_permitted(self):
+        user = UserFactory.create(post__can_start_destruction=False)
+        destruction_list = DestructionListFactory.create(
+            status=ListStatus.ready_to_delete
+        )
+
+        self.client.force_authenticate(user=user)
+        response = self.client.get(
+            reverse(
+                "api:destructionlist-progress",
+                kwargs={"uuid": destruction_list.uuid},
+            ),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
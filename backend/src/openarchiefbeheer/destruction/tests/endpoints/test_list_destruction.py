@@ -231,7 +231,10 @@ class DestructionListStartDestructionEndpointTest(APITestCase):
         )
 
         self.client.force_authenticate(user=record_manager)
-        with freezegun.freeze_time("2024-01-01T21:36:00+02:00"):
+        with (
+            freezegun.freeze_time("2024-01-01T21:36:00+02:00"),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
             response = self.client.post(
                 reverse(
                     "api:destructionlist-queue-destruction",
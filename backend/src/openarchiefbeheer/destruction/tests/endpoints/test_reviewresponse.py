@@ -77,9 +77,12 @@ class ReviewResponsesViewSetTests(APITestCase):
         endpoint = reverse("api:review-responses-list")
         self.client.force_authenticate(user=record_manager)
 
-        with patch(
-            "openarchiefbeheer.destruction.api.serializers.retrieve_selectielijstklasse_resultaat",
-            return_value={"waardering": "vernietigen"},
+        with (
+            patch(
+                "openarchiefbeheer.destruction.api.serializers.retrieve_selectielijstklasse_resultaat",
+                return_value={"waardering": "vernietigen"},
+            ),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             response = self.client.post(
                 endpoint,
@@ -229,14 +232,18 @@ class ReviewResponsesViewSetTests(APITestCase):
             "api:destructionlist-update-assignee",
             kwargs={"uuid": destruction_list.uuid},
         )
-        response = self.client.post(
-            endpoint_reassign,
-            data={
-                "assignee": {"user": other_reviewer.pk, "role": ListRole.main_reviewer},
-                "comment": "Lorem ipsum...",
-            },
-            format="json",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                endpoint_reassign,
+                data={
+                    "assignee": {
+                        "user": other_reviewer.pk,
+                        "role": ListRole.main_reviewer,
+                    },
+                    "comment": "Lorem ipsum...",
+                },
+                format="json",
+            )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         endpoint_audittrail = furl(reverse("api:logs-list"))
@@ -555,14 +555,18 @@ class DestructionListViewSetTest(APITestCase):
             "api:destructionlist-update-assignee",
             kwargs={"uuid": destruction_list.uuid},
         )
-        response = self.client.post(
-            endpoint,
-            data={
-                "assignee": {"user": other_reviewer.pk, "role": ListRole.main_reviewer},
-                "comment": "Lorem ipsum...",
-            },
-            format="json",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                endpoint,
+                data={
+                    "assignee": {
+                        "user": other_reviewer.pk,
+                        "role": ListRole.main_reviewer,
+                    },
+                    "comment": "Lorem ipsum...",
+                },
+                format="json",
+            )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
@@ -674,14 +678,15 @@ class DestructionListViewSetTest(APITestCase):
         endpoint = reverse(
             "api:destructionlist-make-final", kwargs={"uuid": destruction_list.uuid}
         )
-        response = self.client.post(
-            endpoint,
-            data={
-                "user": archivist.pk,
-                "comment": "The list is ready for the archivist",
-            },
-            format="json",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                endpoint,
+                data={
+                    "user": archivist.pk,
+                    "comment": "The list is ready for the archivist",
+                },
+                format="json",
+            )
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
@@ -812,7 +817,9 @@ class DestructionListViewSetTest(APITestCase):
             _("The chosen user does not have the permission to review a final list."),
         )
 
-    @override_settings(FRONTEND_URL="https://openarchiefbeheer.nl/")
+    @override_settings(
+        FRONTEND_URL="https://openarchiefbeheer.nl/", CELERY_TASK_ALWAYS_EAGER=True
+    )
     def test_mark_as_ready_to_review(self):
         record_manager = UserFactory.create(
             username="dolly123",
@@ -848,6 +855,7 @@ class DestructionListViewSetTest(APITestCase):
                     body_review_required_html="Please review the list <a href=\"{% destruction_list_link list_name 'review' %}\">here</a>.",
                 ),
             ),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             response = self.client.post(
                 reverse(
@@ -984,9 +992,10 @@ class DestructionListReviewViewSetTest(APITestCase):
             "list_feedback": "Beautiful!",
         }
         self.client.force_authenticate(user=reviewer)
-        response = self.client.post(
-            reverse("api:destruction-list-reviews-list"), data=data
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("api:destruction-list-reviews-list"), data=data
+            )
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(
@@ -1039,9 +1048,10 @@ class DestructionListReviewViewSetTest(APITestCase):
             ],
         }
         self.client.force_authenticate(user=reviewer)
-        response = self.client.post(
-            reverse("api:destruction-list-reviews-list"), data=data, format="json"
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("api:destruction-list-reviews-list"), data=data, format="json"
+            )
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import patch
 
 from django.test import TestCase
@@ -15,8 +15,13 @@ from openarchiefbeheer.config.tests.factories import ArchiveConfigFactory
 from openarchiefbeheer.destruction.destruction_report import (
     upload_destruction_report_to_openzaak,
 )
-from openarchiefbeheer.destruction.models import ResourceCreationResult
+from openarchiefbeheer.destruction.models import (
+    DestructionListSummary,
+    ResourceCreationResult,
+)
+from openarchiefbeheer.utils.tests.get_queries import executed_queries
 from openarchiefbeheer.utils.tests.mixins import ClearCacheMixin
+from openarchiefbeheer.zaken.models import Zaak
 from openarchiefbeheer.zaken.tests.factories import ZaakFactory
 
 from ...accounts.tests.factories import UserFactory
@@ -311,6 +316,105 @@ class DestructionListTest(TestCase):
             ).exists()
         )
 
+    def test_add_items_from_queryset(self):
+        destruction_list = DestructionListFactory.create()
+        zaken = ZaakFactory.create_batch(3, omschrijving="AAAAA")
+        ZaakFactory.create(omschrijving="BBBBB")
+
+        with executed_queries() as context:
+            created = destruction_list.add_items_from_queryset(
+                Zaak.objects.filter(omschrijving="AAAAA")
+            )
+
+        # The items are created with a single statement (the others update the summary)
+        item_inserts = [
+            query
+            for query in context.captured_queries
+            if query["sql"].startswith('INSERT INTO "destruction_destructionlistitem"')
+        ]
+        self.assertEqual(len(item_inserts), 1)
+        self.assertEqual(created, 3)
+        self.assertEqual(destruction_list.summary.suggested_items_count, 3)
+
+        items = destruction_list.items.order_by("zaak__pk")
+
+        self.assertEqual([item.zaak for item in items], zaken)
+        self.assertEqual([item._zaak_url for item in items], [z.url for z in zaken])
+        for item in items:
+            self.assertEqual(item.status, ListItemStatus.suggested)
+            self.assertEqual(item.processing_status, InternalStatus.new)
+            self.assertEqual(item.excluded_relations, [])
+
+    def test_add_items_from_queryset_ignore_conflicts(self):
+        destruction_list = DestructionListFactory.create()
+        zaak = ZaakFactory.create()
+        DestructionListItemFactory.create(destruction_list=destruction_list, zaak=zaak)
+        ZaakFactory.create()
+
+        created = destruction_list.add_items_from_queryset(
+            Zaak.objects.all(), ignore_conflicts=True
+        )
+
+        self.assertEqual(created, 1)
+        self.assertEqual(destruction_list.items.count(), 2)
+
+    def test_summary_maintained_when_items_change(self):
+        destruction_list = DestructionListFactory.create()
+        zaak1 = ZaakFactory.create(archiefactiedatum=date(2024, 1, 1))
+        zaak2 = ZaakFactory.create(archiefactiedatum=date(2025, 1, 1))
+
+        destruction_list.add_items([zaak1, zaak2])
+
+        summary = DestructionListSummary.objects.get(destruction_list=destruction_list)
+
+        self.assertEqual(summary.suggested_items_count, 2)
+        self.assertEqual(summary.deletable_items_count, 2)
+        self.assertEqual(summary.min_archiefactiedatum, date(2024, 1, 1))
+        self.assertEqual(summary.max_archiefactiedatum, date(2025, 1, 1))
+        self.assertEqual(
+            sorted(summary.archiefnominaties),
+            sorted({zaak1.archiefnominatie, zaak2.archiefnominatie}),
+        )
+
+        item = destruction_list.items.get(zaak=zaak1)
+        item.set_processing_status(InternalStatus.succeeded)
+        summary.refresh_from_db()
+
+        self.assertEqual(summary.succeeded_items_count, 1)
+        self.assertEqual(summary.deletable_items_count, 1)
+
+        destruction_list.remove_items([zaak2])
+        summary.refresh_from_db()
+
+        self.assertEqual(summary.suggested_items_count, 1)
+        self.assertEqual(summary.deletable_items_count, 0)
+        self.assertEqual(summary.max_archiefactiedatum, date(2024, 1, 1))
+
+    def test_get_item_pks_by_zaak_url(self):
+        destruction_list = DestructionListFactory.create()
+        item1, item2 = DestructionListItemFactory.create_batch(
+            2, destruction_list=destruction_list, with_zaak=True
+        )
+        removed_item = DestructionListItemFactory.create(
+            destruction_list=destruction_list,
+            with_zaak=True,
+            status=ListItemStatus.removed,
+        )
+        other_item = DestructionListItemFactory.create(with_zaak=True)
+
+        with self.assertNumQueries(1):
+            item_pks = destruction_list.get_item_pks_by_zaak_url(
+                [
+                    item1.zaak.url,
+                    item2.zaak.url,
+                    removed_item.zaak.url,
+                    other_item.zaak.url,
+                    "http://zaken-api.nl/zaken/api/v1/zaken/unknown",
+                ]
+            )
+
+        self.assertEqual(item_pks, {item1.zaak.url: item1.pk, item2.zaak.url: item2.pk})
+
 
 class DestructionListCoReviewTest(TestCase):
     def test_destruction_list_hierarchy(self):
@@ -0,0 +1,190 @@
+from datetime import datetime
+from functools import partial
+
+from django.test import TestCase, override_settings
+
+from celery.signals import task_postrun
+from freezegun import freeze_time
+from requests_mock import Mocker
+from zgw_consumers.constants import APITypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openarchiefbeheer.clients import build_client, response_hooks
+
+from .. import progress
+from ..constants import InternalStatus, ListItemStatus
+from ..models import DestructionListSummary
+from .factories import DestructionListFactory, DestructionListItemFactory
+
+
+@override_settings(
+    DESTRUCTION_PROGRESS_FLUSH_INTERVAL=10, DESTRUCTION_PROGRESS_WINDOW=300
+)
+class DestructionProgressTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # Discard the counters left by other tests
+        progress.flush()
+
+        self.destruction_list = DestructionListFactory.create(
+            processing_status=InternalStatus.processing
+        )
+        self.items = DestructionListItemFactory.create_batch(
+            4, destruction_list=self.destruction_list, with_zaak=True
+        )
+        self.destruction_list.refresh_summary()
+
+    def test_failed_items_counted(self):
+        item1, item2, *_ = self.items
+        summary = self.destruction_list.summary
+
+        item1.set_processing_status(InternalStatus.failed)
+        item2.set_processing_status(InternalStatus.succeeded)
+        summary.refresh_from_db()
+
+        self.assertEqual(summary.failed_items_count, 1)
+        self.assertEqual(summary.succeeded_items_count, 1)
+        self.assertEqual(summary.remaining_items_count, 2)
+
+        # Processed again (e.g. the destruction is retried)
+        item1.set_processing_status(InternalStatus.processing)
+        summary.refresh_from_db()
+
+        self.assertEqual(summary.failed_items_count, 0)
+        self.assertEqual(summary.remaining_items_count, 3)
+
+    def test_removed_items_not_counted(self):
+        item = self.items[0]
+        item.status = ListItemStatus.removed
+        item.save()
+
+        item.set_processing_status(InternalStatus.failed)
+        summary = self.destruction_list.refresh_summary()
+
+        self.assertEqual(summary.failed_items_count, 0)
+
+    @Mocker()
+    def test_requests_counted_per_resource_type(self, m):
+        service = ServiceFactory.create(
+            api_type=APITypes.zrc,
+            api_root="http://zaken-api.nl/zaken/api/v1/",
+        )
+        m.get("http://zaken-api.nl/zaken/api/v1/zaakobjecten", json={"results": []})
+        m.delete(
+            "http://zaken-api.nl/zaken/api/v1/zaken/75f4c682-1e16-45ea-8f78-99b4474986ac",
+            status_code=204,
+        )
+        progress.start(self.destruction_list)
+
+        with response_hooks(partial(progress.record_request, self.destruction_list.pk)):
+            client = build_client(service)
+
+        with client:
+            client.get("zaakobjecten")
+            client.delete("zaken/75f4c682-1e16-45ea-8f78-99b4474986ac")
+            client.delete("zaken/75f4c682-1e16-45ea-8f78-99b4474986ac")
+
+        # Clients built outside of the context are not tracked
+        with build_client(service) as client:
+            client.get("zaakobjecten")
+
+        progress.flush()
+        summary = DestructionListSummary.objects.get(
+            destruction_list=self.destruction_list
+        )
+
+        self.assertEqual(summary.requests_counts, {"zaakobjecten": 1, "zaken": 2})
+
+    def test_throughput_and_estimated_completion(self):
+        item1, item2, *_ = self.items
+
+        with freeze_time("2024-08-29T16:00:00+02:00") as frozen_time:
+            progress.start(self.destruction_list)
+
+            frozen_time.tick(30)
+            for item in (item1, item2):
+                item.set_processing_status(InternalStatus.succeeded)
+                progress.record_item(self.destruction_list.pk)
+            progress.flush()
+
+            frozen_time.tick(30)
+            result = progress.get_progress(self.destruction_list)
+
+        self.assertEqual(result.succeeded_items_count, 2)
+        self.assertEqual(result.remaining_items_count, 2)
+        self.assertEqual(result.items_per_minute, 2)
+        self.assertEqual(
+            result.started, datetime.fromisoformat("2024-08-29T16:00:00+02:00")
+        )
+        self.assertEqual(
+            result.estimated_completion,
+            datetime.fromisoformat("2024-08-29T16:02:00+02:00"),
+        )
+        self.assertEqual(
+            result.last_activity,
+            datetime.fromisoformat("2024-08-29T16:00:30+02:00"),
+        )
+
+    def test_throughput_drops_when_stalled(self):
+        with freeze_time("2024-08-29T16:00:00+02:00") as frozen_time:
+            progress.start(self.destruction_list)
+
+            frozen_time.tick(60)
+            self.items[0].set_processing_status(InternalStatus.succeeded)
+            progress.record_item(self.destruction_list.pk)
+            progress.flush()
+
+            frozen_time.tick(600)
+            result = progress.get_progress(self.destruction_list)
+
+        self.assertEqual(result.items_per_minute, 0)
+        self.assertIsNone(result.estimated_completion)
+
+    def test_no_throughput_when_not_processing(self):
+        self.destruction_list.processing_status = InternalStatus.succeeded
+        self.destruction_list.save()
+
+        progress.start(self.destruction_list)
+        result = progress.get_progress(self.destruction_list)
+
+        self.assertIsNone(result.items_per_minute)
+        self.assertIsNone(result.estimated_completion)
+
+    def test_samples_limited_to_window(self):
+        samples = [[0, 0]]
+        for timestamp in range(10, 1000, 10):
+            progress._add_sample(samples, timestamp, timestamp)
+
+        self.assertEqual(samples[0], [690, 690])
+        self.assertEqual(samples[-1], [990, 990])
+        # One item per second
+        self.assertEqual(progress.get_items_per_minute(samples, 990), 60)
+
+    def test_progress_not_flushed_without_start(self):
+        progress.record_item(self.destruction_list.pk)
+        progress.flush()
+
+        summary = DestructionListSummary.objects.get(
+            destruction_list=self.destruction_list
+        )
+
+        self.assertEqual(summary.throughput_samples, [])
+        self.assertIsNone(progress.get_progress(self.destruction_list).last_activity)
+
+    def test_counters_flushed_at_end_of_task(self):
+        progress.start(self.destruction_list)
+
+        with override_settings(DESTRUCTION_PROGRESS_FLUSH_INTERVAL=3600):
+            progress.flush()
+            progress.record_item(self.destruction_list.pk)
+
+        summary = DestructionListSummary.objects.get(
+            destruction_list=self.destruction_list
+        )
+        self.assertEqual(summary.throughput_samples[-1][1], 0)
+
+        task_postrun.send(sender=None)
+
+        summary.refresh_from_db()
+        self.assertEqual(summary.throughput_samples[-1][1], 1)
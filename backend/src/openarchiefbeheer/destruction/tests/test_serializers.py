@@ -789,6 +789,7 @@ class DestructionListSerializerTests(TestCase):
 
 
 class DestructionListReviewSerializerTests(TestCase):
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
     def test_create_review_accepted(self):
         reviewer = UserFactory.create(
             username="reviewer",
@@ -824,13 +825,16 @@ class DestructionListReviewSerializerTests(TestCase):
 
         self.assertTrue(serializer.is_valid())
 
-        with patch(
-            "openarchiefbeheer.destruction.utils.EmailConfig.get_solo",
-            return_value=EmailConfig(
-                subject_positive_review="Review accepted",
-                body_positive_review_text="Yuppiii reviewer accepted!",
-                body_positive_review_html="Yuppiii reviewer accepted!",
+        with (
+            patch(
+                "openarchiefbeheer.destruction.utils.EmailConfig.get_solo",
+                return_value=EmailConfig(
+                    subject_positive_review="Review accepted",
+                    body_positive_review_text="Yuppiii reviewer accepted!",
+                    body_positive_review_html="Yuppiii reviewer accepted!",
+                ),
             ),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             serializer.save()
 
@@ -15,6 +15,7 @@ from .factories import (
 
 
 class SignalsTests(TestCase):
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
     @patch(
         "openarchiefbeheer.destruction.utils.EmailConfig.get_solo",
         return_value=EmailConfig(
@@ -24,15 +25,17 @@ class SignalsTests(TestCase):
         ),
     )
     def test_no_email_sent_if_not_review_created(self, m):
-        review = DestructionListReviewFactory.create(
-            decision=ReviewDecisionChoices.rejected,
-            destruction_list__author__email="record_manager@oab.nl",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            review = DestructionListReviewFactory.create(
+                decision=ReviewDecisionChoices.rejected,
+                destruction_list__author__email="record_manager@oab.nl",
+            )
 
         self.assertEqual(len(mail.outbox), 1)
 
-        review.comment = "Tralala some change"
-        review.save()
+        with self.captureOnCommitCallbacks(execute=True):
+            review.comment = "Tralala some change"
+            review.save()
 
         # No extra email sent on update event
         self.assertEqual(len(mail.outbox), 1)
@@ -57,6 +60,7 @@ class SignalsTests(TestCase):
                     body_error_during_deletion_html="ERROR AAAh!",
                 ),
             ),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             delete_destruction_list(destruction_list)
 
@@ -23,6 +23,7 @@ from openarchiefbeheer.logging import logevent
 from openarchiefbeheer.selection.models import SelectionItem
 from openarchiefbeheer.utils.tests.mixins import ClearCacheMixin
 from openarchiefbeheer.zaken.tests.factories import ZaakFactory
+from openarchiefbeheer.zaken.utils import get_zaken_version
 
 from ..constants import (
     DestructionListItemAction,
@@ -40,6 +41,7 @@ from ..tasks import (
     delete_destruction_list_item,
     process_review_response,
     queue_destruction_lists_for_deletion,
+    send_review_notification,
 )
 from ..utils import get_selection_key_for_review
 from .factories import (
@@ -94,6 +96,122 @@ class ProcessReviewResponseTests(TestCase):
         self.assertEqual(review_response.processing_status, InternalStatus.failed)
         self.assertEqual(review_item_response.processing_status, InternalStatus.failed)
 
+    def test_failure_does_not_stop_processing_of_other_items(self, m):
+        ServiceFactory.create(
+            api_type=APITypes.zrc,
+            api_root="http://zaken-api.nl/",
+        )
+
+        review_response = ReviewResponseFactory.create(
+            review__destruction_list__status=ListStatus.changes_requested,
+        )
+        zaak1, zaak2 = ZaakFactory.create_batch(2, archiefactiedatum="2025-01-01")
+        item_response1, item_response2 = [
+            ReviewItemResponseFactory.create(
+                review_item__destruction_list_item__zaak=zaak,
+                review_item__review=review_response.review,
+                action_item=DestructionListItemAction.remove,
+                action_zaak_type=ZaakActionType.bewaartermijn,
+                action_zaak={"archiefactiedatum": "2026-01-01"},
+            )
+            for zaak in (zaak1, zaak2)
+        ]
+        review_response.review.destruction_list.assignees.all().delete()
+        DestructionListAssigneeFactory.create(
+            user=review_response.review.author,
+            destruction_list=review_response.review.destruction_list,
+            role=ListRole.main_reviewer,
+        )
+
+        m.patch(zaak1.url, status_code=500)
+        m.patch(zaak2.url, json={"archiefactiedatum": "2026-01-01"})
+
+        process_review_response(review_response.pk)
+
+        item_response1.refresh_from_db()
+        item_response2.refresh_from_db()
+        zaak2.refresh_from_db()
+
+        self.assertEqual(item_response1.processing_status, InternalStatus.failed)
+        self.assertEqual(item_response2.processing_status, InternalStatus.succeeded)
+        self.assertEqual(zaak2.archiefactiedatum.isoformat(), "2026-01-01")
+        self.assertEqual(
+            item_response2.review_item.destruction_list_item.status,
+            ListItemStatus.removed,
+        )
+        self.assertEqual(
+            item_response1.review_item.destruction_list_item.status,
+            ListItemStatus.suggested,
+        )
+        # The list is not passed on while some items failed
+        review_response.review.destruction_list.refresh_from_db()
+        self.assertEqual(
+            review_response.review.destruction_list.status,
+            ListStatus.changes_requested,
+        )
+
+        # Resuming only retries the failed item
+        m.reset_mock()
+        m.patch(zaak1.url, json={"archiefactiedatum": "2026-01-01"})
+
+        process_review_response(review_response.pk)
+
+        item_response1.refresh_from_db()
+
+        self.assertEqual(item_response1.processing_status, InternalStatus.succeeded)
+        self.assertEqual(len(m.request_history), 1)
+        self.assertEqual(m.last_request.url, zaak1.url)
+
+    def test_zaken_version_bumped(self, m):
+        ServiceFactory.create(
+            api_type=APITypes.zrc,
+            api_root="http://zaken-api.nl/",
+        )
+
+        review_response = ReviewResponseFactory.create()
+        zaak = ZaakFactory.create(archiefactiedatum="2025-01-01")
+        ReviewItemResponseFactory.create(
+            review_item__destruction_list_item__zaak=zaak,
+            review_item__review=review_response.review,
+            action_item=DestructionListItemAction.remove,
+            action_zaak_type=ZaakActionType.bewaartermijn,
+            action_zaak={"archiefactiedatum": "2026-01-01"},
+        )
+        version = get_zaken_version()
+
+        m.patch(zaak.url, json={"archiefactiedatum": "2026-01-01"})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            process_review_response(review_response.pk)
+
+        self.assertNotEqual(get_zaken_version(), version)
+
+    def test_invalid_changes_not_sent(self, m):
+        ServiceFactory.create(
+            api_type=APITypes.zrc,
+            api_root="http://zaken-api.nl/",
+        )
+
+        review_response = ReviewResponseFactory.create(
+            review__destruction_list__status=ListStatus.changes_requested,
+        )
+        zaak = ZaakFactory.create(archiefactiedatum="2025-01-01")
+        item_response = ReviewItemResponseFactory.create(
+            review_item__destruction_list_item__zaak=zaak,
+            review_item__review=review_response.review,
+            action_item=DestructionListItemAction.remove,
+            action_zaak_type=ZaakActionType.bewaartermijn,
+            action_zaak={"archiefactiedatum": "invalid"},
+        )
+
+        process_review_response(review_response.pk)
+
+        item_response.refresh_from_db()
+
+        self.assertEqual(item_response.processing_status, InternalStatus.failed)
+        self.assertEqual(len(m.request_history), 0)
+
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
     def test_changes_to_both_zaak_and_destruction_list_item(self, m):
         ServiceFactory.create(
             api_type=APITypes.zrc,
@@ -127,13 +245,16 @@ class ProcessReviewResponseTests(TestCase):
 
         m.patch(zaak.url, json={"archiefactiedatum": "2026-01-01"})
 
-        with patch(
-            "openarchiefbeheer.destruction.utils.EmailConfig.get_solo",
-            return_value=EmailConfig(
-                subject_review_required="Destruction list review request",
-                body_review_required_text="Please review the list",
-                body_review_required_html="Please review the list",
+        with (
+            patch(
+                "openarchiefbeheer.destruction.utils.EmailConfig.get_solo",
+                return_value=EmailConfig(
+                    subject_review_required="Destruction list review request",
+                    body_review_required_text="Please review the list",
+                    body_review_required_html="Please review the list",
+                ),
             ),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             process_review_response(review_response.pk)
 
@@ -313,6 +434,30 @@ class ProcessReviewResponseTests(TestCase):
         )
 
 
+class SendReviewNotificationTests(TestCase):
+    def test_reviewers_at_time_of_review_used(self):
+        destruction_list = DestructionListFactory.create()
+        review = DestructionListReviewFactory.create(
+            destruction_list=destruction_list,
+            decision=ReviewDecisionChoices.accepted,
+        )
+        current_reviewer = UserFactory.create()
+        # The list was reviewed again before the notification was sent
+        DestructionListReviewFactory.create(
+            destruction_list=destruction_list,
+            decision=ReviewDecisionChoices.accepted,
+        )
+
+        with patch(
+            "openarchiefbeheer.destruction.tasks.notify_author_positive_review"
+        ) as m_notify:
+            send_review_notification(review.pk, current_reviewer.pk)
+
+        m_notify.assert_called_once_with(
+            destruction_list.author, destruction_list, review.author, current_reviewer
+        )
+
+
 @temp_private_root()
 class ProcessDeletingZakenTests(ClearCacheMixin, TestCase):
     @log_capture(level=logging.INFO)
@@ -367,6 +512,7 @@ class ProcessDeletingZakenTests(ClearCacheMixin, TestCase):
             logs[0],
         )
 
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
     def test_complete_and_notify(self):
         record_manager = UserFactory.create(
             first_name="John",
@@ -446,6 +592,7 @@ class ProcessDeletingZakenTests(ClearCacheMixin, TestCase):
                 "openarchiefbeheer.destruction.tasks.upload_destruction_report_to_openzaak"
             ),
             freeze_time("2024-10-09T12:00:00+02:00"),
+            self.captureOnCommitCallbacks(execute=True),
         ):
             complete_and_notify(destruction_list.pk)
 
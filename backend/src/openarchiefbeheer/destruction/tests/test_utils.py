@@ -1,14 +1,21 @@
+from datetime import date
+
 from django.core.exceptions import ObjectDoesNotExist
 from django.test import TestCase
 
 from timeline_logger.models import TimelineLog
 
 from openarchiefbeheer.accounts.tests.factories import UserFactory
+from openarchiefbeheer.zaken.models import Zaak
 from openarchiefbeheer.zaken.tests.factories import ZaakFactory
 
 from ..constants import ListRole
-from ..models import DestructionListItem
-from ..utils import replace_assignee, resync_items_and_zaken
+from ..models import DestructionListItem, DestructionListSummary
+from ..utils import (
+    get_items_zaak_fingerprints,
+    replace_assignee,
+    resync_items_and_zaken,
+)
 from .factories import (
     DestructionListAssigneeFactory,
     DestructionListFactory,
@@ -77,3 +84,24 @@ class UtilsTest(TestCase):
         self.assertEqual(logs.count(), 1)
         self.assertEqual(logs[0].extra_data["number_deleted_items"], 1)
         self.assertEqual(logs[0].extra_data["number_of_zaken"], 0)
+
+    def test_resync_zaken_refreshes_only_changed_lists(self):
+        item1 = DestructionListItemFactory.create(with_zaak=True)
+        item2 = DestructionListItemFactory.create(with_zaak=True)
+        summary1 = item1.destruction_list.refresh_summary()
+        summary2 = item2.destruction_list.refresh_summary()
+        fingerprints = get_items_zaak_fingerprints()
+
+        # The items are unlinked when the zaken are deleted during the resync
+        Zaak.objects.filter(pk=item2.zaak.pk).update(archiefactiedatum=date(2030, 1, 1))
+        DestructionListItem.objects.update(zaak=None)
+        DestructionListSummary.objects.update(suggested_items_count=10)
+
+        resync_items_and_zaken(fingerprints)
+
+        summary1.refresh_from_db()
+        summary2.refresh_from_db()
+
+        self.assertEqual(summary1.suggested_items_count, 10)
+        self.assertEqual(summary2.suggested_items_count, 1)
+        self.assertEqual(summary2.max_archiefactiedatum, date(2030, 1, 1))
@@ -16,8 +16,14 @@ from zgw_consumers.constants import APITypes, AuthTypes
 from zgw_consumers.test.factories import ServiceFactory
 
 from openarchiefbeheer.accounts.tests.factories import UserFactory
-from openarchiefbeheer.destruction.constants import ListStatus
+from openarchiefbeheer.destruction.constants import (
+    InternalStatus,
+    ListItemStatus,
+    ListRole,
+    ListStatus,
+)
 from openarchiefbeheer.destruction.tests.factories import (
+    DestructionListAssigneeFactory,
     DestructionListFactory,
     DestructionListItemFactory,
 )
@@ -25,6 +31,7 @@ from openarchiefbeheer.external_registers.contrib.openklant.constants import (
     OPENKLANT_IDENTIFIER,
 )
 from openarchiefbeheer.external_registers.models import ExternalRegisterConfig
+from openarchiefbeheer.utils.tests.get_queries import executed_queries
 from openarchiefbeheer.utils.tests.resources_client import (
     OpenZaakDataCreationHelper,
 )
@@ -75,6 +82,66 @@ class DestructionListKanbanViewTest(APITestCase):
             data[_("recently destroyed")][0]["uuid"], str(recent_deleted.uuid)
         )
 
+    def _create_lists(self, start: int, amount: int) -> None:
+        for index in range(start, start + amount):
+            destruction_list = DestructionListFactory.create(
+                name=f"List {index}", status=ListStatus.ready_to_review
+            )
+            DestructionListAssigneeFactory.create(
+                destruction_list=destruction_list, role=ListRole.main_reviewer
+            )
+            DestructionListAssigneeFactory.create(
+                destruction_list=destruction_list, role=ListRole.co_reviewer
+            )
+            DestructionListItemFactory.create_batch(
+                2, destruction_list=destruction_list
+            )
+            destruction_list.refresh_summary()
+
+    def _get_kanban(self) -> tuple[dict, int]:
+        with executed_queries() as context:
+            response = self.client.get(reverse("api:destruction-list-kanban"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.json(), len(context.captured_queries)
+
+    def test_number_of_queries_does_not_grow_with_lists(self):
+        record_manager = UserFactory.create(post__can_start_destruction=True)
+        self.client.force_authenticate(user=record_manager)
+
+        self._create_lists(0, 2)
+        data, queries_few_lists = self._get_kanban()
+
+        self.assertEqual(len(data[ListStatus.ready_to_review.label]), 2)
+
+        self._create_lists(2, 8)
+        data, queries_many_lists = self._get_kanban()
+
+        self.assertEqual(len(data[ListStatus.ready_to_review.label]), 10)
+        self.assertEqual(queries_few_lists, queries_many_lists)
+        self.assertLessEqual(queries_many_lists, 20)
+
+    def test_deletable_items_count(self):
+        record_manager = UserFactory.create(post__can_start_destruction=True)
+        destruction_list = DestructionListFactory.create(status=ListStatus.new)
+        DestructionListItemFactory.create_batch(
+            3, destruction_list=destruction_list, status=ListItemStatus.suggested
+        )
+        DestructionListItemFactory.create(
+            destruction_list=destruction_list,
+            status=ListItemStatus.suggested,
+            processing_status=InternalStatus.succeeded,
+        )
+        DestructionListItemFactory.create(
+            destruction_list=destruction_list, status=ListItemStatus.removed
+        )
+        destruction_list.refresh_summary()
+
+        self.client.force_authenticate(user=record_manager)
+        data, _queries = self._get_kanban()
+
+        self.assertEqual(data[ListStatus.new.label][0]["deletableItemsCount"], 3)
+
 
 class StatusViewTests(APITestCase):
     def test_not_authenticated(self):
@@ -1,20 +1,33 @@
+import contextlib
+import logging
+from itertools import batched
 from typing import Protocol
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
 from django.db import transaction
-from django.db.models import OuterRef, Q, QuerySet, Subquery
+from django.db.models import CharField, OuterRef, Q, QuerySet, Subquery, Value
+from django.db.models.functions import MD5, Cast, Concat
+
+from ape_pie import APIClient
+from requests.adapters import HTTPAdapter
+from rest_framework.exceptions import ValidationError
+from zgw_consumers.concurrent import parallel
 
 from openarchiefbeheer.accounts.models import User
 from openarchiefbeheer.clients import (
     _cached_with_args,
+    zrc_client,
     ztc_client,
 )
 from openarchiefbeheer.emails.models import EmailConfig
-from openarchiefbeheer.emails.render_backend import get_sandboxed_backend
+from openarchiefbeheer.emails.render_backend import get_compiled_template
+from openarchiefbeheer.emails.utils import queue_email
 from openarchiefbeheer.logging import logevent
 from openarchiefbeheer.selection.models import SelectionItem
+from openarchiefbeheer.selection.utils import bump_selection_version
+from openarchiefbeheer.zaken.api.serializers import ZaakSerializer
 from openarchiefbeheer.zaken.models import Zaak
+from openarchiefbeheer.zaken.utils import bump_zaken_version
 
 from .constants import (
     DestructionListItemAction,
@@ -29,6 +42,8 @@ from .models import (
     ReviewItemResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 
 def notify(
     subject: str, body_html: str, body_text: str, context: dict, recipients: list[str]
@@ -36,21 +51,15 @@ def notify(
     if body_text == "" or body_html == "" or subject == "" or len(recipients) == 0:
         return
 
-    backend = get_sandboxed_backend()
+    html_content = get_compiled_template(body_html).render(context=context)
+    text_content = get_compiled_template(body_text).render(context=context)
 
-    template_html = backend.from_string(body_html)
-    template_text = backend.from_string(body_text)
-    html_content = template_html.render(context=context)
-    text_content = template_text.render(context=context)
-
-    message = EmailMultiAlternatives(
+    queue_email(
         subject=subject,
-        body=text_content,
-        from_email=settings.DEFAULT_FROM_EMAIL,
-        to=recipients,
+        body_text=text_content,
+        body_html=html_content,
+        recipients=list(recipients),
     )
-    message.attach_alternative(html_content, "text/html")
-    message.send()
 
 
 def notify_reviewer(
@@ -71,11 +80,11 @@ def notify_reviewer(
 def notify_author_positive_review(
     user: User,
     destruction_list: DestructionList,
+    reviewer: User,
+    current_reviewer: User | None,
 ) -> None:
     config = EmailConfig.get_solo()
 
-    last_reviewer = destruction_list.reviews.all().order_by("created").last().author
-
     notify(
         subject=config.subject_positive_review,
         body_text=config.body_positive_review_text,
@@ -83,8 +92,8 @@ def notify_author_positive_review(
         context={
             "user_name": user.get_full_name(),
             "list_name": destruction_list.name,
-            "reviewer": last_reviewer,
-            "current_reviewer": destruction_list.assignee,
+            "reviewer": reviewer,
+            "current_reviewer": current_reviewer,
         },
         recipients=[user.email],
     )
@@ -144,7 +153,39 @@ def replace_assignee(
     return new_assignee
 
 
-def resync_items_and_zaken() -> None:
+def get_items_zaak_fingerprints() -> set[tuple[int, int, str]]:
+    """Return a fingerprint of the data of the zaak of each item used in the summaries.
+
+    Comparing the fingerprints from before and after a resync of the zaken gives the
+    lists whose summary needs to be refreshed.
+    """
+    fields = (
+        "zaak__archiefactiedatum",
+        "zaak__archiefnominatie",
+        "zaak___expand__zaaktype",
+        "zaak___expand__resultaat",
+    )
+    separated_fields = []
+    for field in fields:
+        separated_fields += [Cast(field, output_field=CharField()), Value("|")]
+
+    return set(
+        DestructionListItem.objects.exclude(destruction_list__status=ListStatus.deleted)
+        .filter(zaak__isnull=False)
+        .annotate(fingerprint=MD5(Concat(*separated_fields)))
+        .values_list("destruction_list", "pk", "fingerprint")
+    )
+
+
+def resync_items_and_zaken(
+    previous_fingerprints: set[tuple[int, int, str]] | None = None,
+) -> None:
+    """Link the items to the resynced zaken and refresh the summaries of the lists.
+
+    :param previous_fingerprints: the result of :func:`get_items_zaak_fingerprints`
+        from before the resync. Only the summaries of the lists of which the data of
+        the zaken changed are refreshed. If not given, all summaries are refreshed.
+    """
     # Using the _zaak_url field, link the item to the zaak again
     DestructionListItem.objects.filter(~Q(_zaak_url=""), zaak__isnull=True).update(
         zaak_id=Subquery(
@@ -162,15 +203,34 @@ def resync_items_and_zaken() -> None:
             "destruction_list", flat=True
         )
     )
+    refreshed_lists = set()
     for destruction_list in destruction_lists:
         items_in_list = orphan_items.filter(destruction_list=destruction_list)
 
-        number_deleted_items, _ = items_in_list.delete()
+        with transaction.atomic():
+            number_deleted_items, _ = items_in_list.delete()
+            destruction_list.refresh_summary()
+        refreshed_lists.add(destruction_list.pk)
 
         logevent.destruction_list_items_deleted(destruction_list, number_deleted_items)
 
+    # The data of the zaken may have changed
+    changed_lists = DestructionList.objects.exclude(
+        Q(status=ListStatus.deleted) | Q(pk__in=refreshed_lists)
+    )
+    if previous_fingerprints is not None:
+        changed_fingerprints = previous_fingerprints ^ get_items_zaak_fingerprints()
+        changed_lists = changed_lists.filter(
+            pk__in={
+                destruction_list_pk for destruction_list_pk, *_ in changed_fingerprints
+            }
+        )
+
+    for destruction_list in changed_lists.iterator():
+        destruction_list.refresh_summary()
 
-@_cached_with_args
+
+@_cached_with_args(timeout=60 * 60 * 24)
 def get_selectielijstklasse(resultaattype_url: str) -> str:
     with ztc_client() as client:
         response = client.get(resultaattype_url)
@@ -236,3 +296,173 @@ def prepopulate_selection_after_review_response(
     ]
 
     SelectionItem.objects.bulk_create(other_selection_items_to_create)
+
+    bump_selection_version(selection_key)
+
+
+def _update_zaak_in_openzaak(client: APIClient, zaak: Zaak, data: dict) -> dict:
+    response = client.patch(
+        f"zaken/{zaak.uuid}",
+        headers={
+            "Accept-Crs": "EPSG:4326",
+            "Content-Crs": "EPSG:4326",
+        },
+        json=data,
+        timeout=settings.REQUESTS_DEFAULT_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _resize_connection_pools(client: APIClient, maxsize: int) -> None:
+    """Make the connection pools of the client hold at least ``maxsize`` connections.
+
+    The adapters of the client are kept, with their configuration (e.g. retries).
+    """
+    for adapter in {client.get_adapter("http://"), client.get_adapter("https://")}:
+        if not isinstance(adapter, HTTPAdapter) or adapter._pool_maxsize >= maxsize:
+            continue
+
+        adapter.init_poolmanager(
+            adapter._pool_connections, maxsize, block=adapter._pool_block
+        )
+
+
+def _update_zaken_concurrently(
+    client: APIClient, items_responses: list[ReviewItemResponse]
+) -> dict[ReviewItemResponse, tuple[dict | None, Exception | None]]:
+    def update_zaak(
+        item_response: ReviewItemResponse,
+    ) -> tuple[dict | None, Exception | None]:
+        zaak = item_response.review_item.destruction_list_item.zaak
+        try:
+            return _update_zaak_in_openzaak(
+                client, zaak, item_response.action_zaak
+            ), None
+        except Exception as exc:
+            return None, exc
+
+    with parallel(max_workers=settings.REVIEW_RESPONSE_PROCESSING_WORKERS) as executor:
+        return dict(
+            zip(
+                items_responses, executor.map(update_zaak, items_responses), strict=True
+            )
+        )
+
+
+def _validate_zaken_changes(
+    items_responses: list[ReviewItemResponse],
+) -> tuple[
+    list[ReviewItemResponse],
+    dict[ReviewItemResponse, tuple[dict | None, Exception | None]],
+]:
+    """Return the item responses with valid changes to the zaak, and the errors.
+
+    The changes are validated before updating the zaken in Open Zaak, so that a
+    zaak is not changed there if the change can't be stored here afterwards.
+    """
+    valid_items_responses = []
+    errors = {}
+    for item_response in items_responses:
+        if item_response.action_item != DestructionListItemAction.remove:
+            continue
+
+        serializer = ZaakSerializer(
+            data=item_response.action_zaak or {},
+            partial=True,
+            instance=item_response.review_item.destruction_list_item.zaak,
+        )
+        if serializer.is_valid():
+            valid_items_responses.append(item_response)
+        else:
+            errors[item_response] = (None, ValidationError(serializer.errors))
+
+    return valid_items_responses, errors
+
+
+def _process_review_item_responses_batch(
+    client: APIClient | None, items_responses: list[ReviewItemResponse]
+) -> None:
+    for item_response in items_responses:
+        item_response.processing_status = InternalStatus.processing
+    ReviewItemResponse.objects.bulk_update(items_responses, ["processing_status"])
+
+    to_update, results = _validate_zaken_changes(items_responses)
+    results.update(_update_zaken_concurrently(client, to_update))
+
+    zaken_to_update = []
+    zaak_fields_to_update = set()
+    destruction_list_items_to_update = []
+    for item_response in items_responses:
+        item_response.processing_status = InternalStatus.succeeded
+        if item_response not in results:
+            continue
+
+        destruction_list_item = item_response.review_item.destruction_list_item
+        updated_zaak, exc = results[item_response]
+        if exc is None:
+            serializer = ZaakSerializer(
+                data=updated_zaak, partial=True, instance=destruction_list_item.zaak
+            )
+            if not serializer.is_valid():
+                exc = ValidationError(serializer.errors)
+
+        if exc is not None:
+            logger.error(
+                "An error occurred while processing the review item response %s",
+                item_response.pk,
+                exc_info=exc,
+            )
+            item_response.processing_status = InternalStatus.failed
+            continue
+
+        for attr, value in serializer.validated_data.items():
+            setattr(destruction_list_item.zaak, attr, value)
+        zaak_fields_to_update.update(serializer.validated_data.keys())
+        zaken_to_update.append(destruction_list_item.zaak)
+
+        destruction_list_item.status = ListItemStatus.removed
+        destruction_list_items_to_update.append(destruction_list_item)
+
+    with transaction.atomic():
+        if zaak_fields_to_update:
+            Zaak.objects.bulk_update(zaken_to_update, zaak_fields_to_update)
+            bump_zaken_version()
+        DestructionListItem.objects.bulk_update(
+            destruction_list_items_to_update, ["status"]
+        )
+        ReviewItemResponse.objects.bulk_update(items_responses, ["processing_status"])
+        if destruction_list_items_to_update:
+            destruction_list_items_to_update[0].destruction_list.refresh_summary()
+
+
+def process_review_item_responses(
+    items_responses: QuerySet[ReviewItemResponse],
+) -> None:
+    """Process the responses of the author to the feedback of a reviewer.
+
+    The zaken are updated concurrently in Open Zaak, in batches of
+    ``REVIEW_RESPONSE_PROCESSING_BATCH_SIZE`` items. If updating a zaak fails, the
+    corresponding item response is marked as failed and the other items are still
+    processed. Item responses that were already processed successfully are skipped,
+    so the processing can safely be resumed.
+    """
+    to_process = items_responses.exclude(processing_status=InternalStatus.succeeded)
+    pks = list(to_process.values_list("pk", flat=True))
+    if not pks:
+        return
+
+    needs_client = to_process.filter(
+        action_item=DestructionListItemAction.remove
+    ).exists()
+    with zrc_client() if needs_client else contextlib.nullcontext() as client:
+        if client is not None:
+            # Allow one connection per worker, so that they can be reused
+            _resize_connection_pools(
+                client, settings.REVIEW_RESPONSE_PROCESSING_WORKERS
+            )
+
+        for batch_pks in batched(pks, settings.REVIEW_RESPONSE_PROCESSING_BATCH_SIZE):
+            _process_review_item_responses_batch(
+                client, list(to_process.filter(pk__in=batch_pks))
+            )
@@ -3,7 +3,7 @@ from django.utils.translation import gettext_lazy as _
 
 from solo.admin import SingletonModelAdmin
 
-from .models import EmailConfig
+from .models import EmailConfig, OutgoingEmail
 
 
 @admin.register(EmailConfig)
@@ -73,3 +73,18 @@ class EmailConfigAdmin(SingletonModelAdmin):
             },
         ),
     ]
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "subject",
+        "status",
+        "attempts",
+        "next_attempt_at",
+        "created",
+        "sent",
+    )
+    list_filter = ("status",)
+    search_fields = ("subject", "recipients")
+    readonly_fields = ("created", "sent", "attempts", "next_attempt_at", "last_error")
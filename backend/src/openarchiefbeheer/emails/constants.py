@@ -0,0 +1,8 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class OutgoingEmailStatus(models.TextChoices):
+    queued = "queued", _("queued")
+    sent = "sent", _("sent")
+    failed = "failed", _("failed")
@@ -0,0 +1,81 @@
+# Generated by Django 5.2.17 on 2026-10-19 14:12
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("emails", "0007_remove_emailconfig_body_changes_requested_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutgoingEmail",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("subject", models.CharField(max_length=250, verbose_name="subject")),
+                ("body_text", models.TextField(verbose_name="text body")),
+                ("body_html", models.TextField(verbose_name="HTML body")),
+                ("from_email", models.EmailField(max_length=254, verbose_name="from")),
+                (
+                    "recipients",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.EmailField(max_length=254),
+                        size=None,
+                        verbose_name="recipients",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "queued"),
+                            ("sent", "sent"),
+                            ("failed", "failed"),
+                        ],
+                        default="queued",
+                        max_length=80,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0,
+                        help_text="How many times sending the email was attempted.",
+                        verbose_name="attempts",
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True,
+                        help_text="The error of the last failed attempt to send the email.",
+                        verbose_name="last error",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+                (
+                    "sent",
+                    models.DateTimeField(blank=True, null=True, verbose_name="sent"),
+                ),
+            ],
+            options={
+                "verbose_name": "outgoing email",
+                "verbose_name_plural": "outgoing emails",
+            },
+        ),
+    ]
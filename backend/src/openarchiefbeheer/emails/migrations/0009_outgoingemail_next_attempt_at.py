@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-10-19 17:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("emails", "0008_outgoingemail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="outgoingemail",
+            name="next_attempt_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Sending the email is not attempted (again) before this moment. Empty if the email can be sent immediately.",
+                null=True,
+                verbose_name="next attempt at",
+            ),
+        ),
+    ]
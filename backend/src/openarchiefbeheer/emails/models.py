@@ -1,8 +1,12 @@
+from django.contrib.postgres.fields import ArrayField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from solo.models import SingletonModel
 
+from .constants import OutgoingEmailStatus
+from .render_backend import get_compiled_template
+
 
 class EmailConfig(SingletonModel):
     subject_review_required = models.CharField(
@@ -187,3 +191,52 @@ class EmailConfig(SingletonModel):
 
     def __str__(self):
         return "Email configuration"
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        get_compiled_template.cache_clear()
+
+
+class OutgoingEmail(models.Model):
+    subject = models.CharField(_("subject"), max_length=250)
+    body_text = models.TextField(_("text body"))
+    body_html = models.TextField(_("HTML body"))
+    from_email = models.EmailField(_("from"))
+    recipients = ArrayField(
+        models.EmailField(),
+        verbose_name=_("recipients"),
+    )
+    status = models.CharField(
+        _("status"),
+        choices=OutgoingEmailStatus.choices,
+        max_length=80,
+        default=OutgoingEmailStatus.queued,
+    )
+    attempts = models.PositiveSmallIntegerField(
+        _("attempts"),
+        help_text=_("How many times sending the email was attempted."),
+        default=0,
+    )
+    last_error = models.TextField(
+        _("last error"),
+        help_text=_("The error of the last failed attempt to send the email."),
+        blank=True,
+    )
+    next_attempt_at = models.DateTimeField(
+        _("next attempt at"),
+        help_text=_(
+            "Sending the email is not attempted (again) before this moment. "
+            "Empty if the email can be sent immediately."
+        ),
+        null=True,
+        blank=True,
+    )
+    created = models.DateTimeField(_("created"), auto_now_add=True)
+    sent = models.DateTimeField(_("sent"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _("outgoing email")
+        verbose_name_plural = _("outgoing emails")
+
+    def __str__(self):
+        return self.subject
@@ -1,4 +1,6 @@
-from django.template.backends.django import DjangoTemplates
+from functools import lru_cache
+
+from django.template.backends.django import DjangoTemplates, Template
 
 
 class SandboxedTemplates(DjangoTemplates):
@@ -27,6 +29,7 @@ class SandboxedTemplates(DjangoTemplates):
         return []
 
 
+@lru_cache
 def get_sandboxed_backend() -> SandboxedTemplates:
     return SandboxedTemplates(
         {
@@ -37,3 +40,14 @@ def get_sandboxed_backend() -> SandboxedTemplates:
             }
         }
     )
+
+
+@lru_cache(maxsize=128)
+def get_compiled_template(source: str) -> Template:
+    """Compile the template with the sandboxed backend.
+
+    The compiled templates are cached on their source, so a changed template in the
+    email configuration is compiled again (also in other processes). The cache is
+    cleared when the email configuration is saved, to drop the outdated templates.
+    """
+    return get_sandboxed_backend().from_string(source)
@@ -0,0 +1,56 @@
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from openarchiefbeheer.celery import app
+
+from .constants import OutgoingEmailStatus
+from .models import OutgoingEmail
+from .utils import send_emails
+
+logger = logging.getLogger(__name__)
+
+# The claimed emails are not picked up by other workers in the meantime. If the
+# worker dies while sending, they are sent again once the claim expires.
+CLAIM_DURATION = timedelta(minutes=10)
+
+
+def claim_due_emails() -> list[OutgoingEmail]:
+    now = timezone.now()
+    with transaction.atomic():
+        # Skip the emails that are being claimed by another worker
+        emails = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now),
+                status=OutgoingEmailStatus.queued,
+            )
+            .order_by("pk")[: settings.EMAIL_BATCH_SIZE]
+        )
+        OutgoingEmail.objects.filter(pk__in=[email.pk for email in emails]).update(
+            next_attempt_at=now + CLAIM_DURATION
+        )
+    return emails
+
+
+@app.task
+def send_queued_emails() -> None:
+    """Send the queued emails that are due.
+
+    The emails that could not be sent are attempted again by the periodic run of
+    this task, once their backoff has passed.
+    """
+    emails = claim_due_emails()
+    if not emails:
+        return
+
+    to_retry = send_emails(emails)
+    if to_retry:
+        logger.warning("Failed to send %d email(s), retrying later.", len(to_retry))
+
+    if len(emails) == settings.EMAIL_BATCH_SIZE:
+        send_queued_emails.delay()
@@ -0,0 +1,28 @@
+from django.test import TestCase
+
+from ..models import EmailConfig
+from ..render_backend import get_compiled_template
+
+
+class CompiledTemplateCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        get_compiled_template.cache_clear()
+        self.addCleanup(get_compiled_template.cache_clear)
+
+    def test_template_compiled_once(self):
+        template = get_compiled_template("Hello {{ user_name }}")
+
+        self.assertIs(get_compiled_template("Hello {{ user_name }}"), template)
+        self.assertEqual(template.render(context={"user_name": "Jane"}), "Hello Jane")
+        self.assertEqual(get_compiled_template.cache_info().misses, 1)
+
+    def test_cache_cleared_when_config_saved(self):
+        get_compiled_template("Hello {{ user_name }}")
+
+        config = EmailConfig.get_solo()
+        config.subject_review_required = "Please review"
+        config.save()
+
+        self.assertEqual(get_compiled_template.cache_info().currsize, 0)
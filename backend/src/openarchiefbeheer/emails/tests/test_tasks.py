@@ -0,0 +1,128 @@
+from smtplib import SMTPException
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.mail import get_connection
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+
+from ..constants import OutgoingEmailStatus
+from ..models import OutgoingEmail
+from ..tasks import send_queued_emails
+from ..utils import queue_email, send_emails
+
+
+class SendQueuedEmailsTests(TestCase):
+    @override_settings(CELERY_TASK_ALWAYS_EAGER=True)
+    def test_queued_email_is_sent_after_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            email = queue_email(
+                subject="Hello",
+                body_text="Hello text",
+                body_html="<p>Hello html</p>",
+                recipients=["record_manager@oab.nl"],
+            )
+
+        self.assertEqual(len(mail.outbox), 0)
+
+        callbacks[0]()
+        email.refresh_from_db()
+
+        self.assertEqual(email.status, OutgoingEmailStatus.sent)
+        self.assertIsNotNone(email.sent)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].subject, "Hello")
+        self.assertEqual(mail.outbox[0].body, "Hello text")
+        self.assertEqual(mail.outbox[0].to, ["record_manager@oab.nl"])
+        self.assertEqual(
+            mail.outbox[0].alternatives[0], ("<p>Hello html</p>", "text/html")
+        )
+
+    def test_batch_sent_over_single_connection(self):
+        for index in range(3):
+            OutgoingEmail.objects.create(
+                subject=f"Email {index}",
+                body_text="Text",
+                body_html="Html",
+                from_email="oab@example.com",
+                recipients=["reviewer@oab.nl"],
+            )
+
+        with patch(
+            "openarchiefbeheer.emails.utils.get_connection", wraps=get_connection
+        ) as m_get_connection:
+            send_queued_emails()
+
+        m_get_connection.assert_called_once()
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertFalse(
+            OutgoingEmail.objects.exclude(status=OutgoingEmailStatus.sent).exists()
+        )
+
+    @override_settings(EMAIL_MAX_ATTEMPTS=2)
+    def test_failing_email_is_retried_until_max_attempts(self):
+        email = OutgoingEmail.objects.create(
+            subject="Hello",
+            body_text="Text",
+            body_html="Html",
+            from_email="oab@example.com",
+            recipients=["reviewer@oab.nl"],
+        )
+
+        with patch("openarchiefbeheer.emails.utils.get_connection") as m_get_connection:
+            m_get_connection.return_value.open.side_effect = SMTPException("Down")
+
+            to_retry = send_emails([email])
+
+            self.assertEqual(to_retry, [email])
+            email.refresh_from_db()
+            self.assertEqual(email.status, OutgoingEmailStatus.queued)
+            self.assertEqual(email.attempts, 1)
+            self.assertEqual(email.last_error, "Down")
+            self.assertIsNotNone(email.next_attempt_at)
+
+            to_retry = send_emails([email])
+
+        self.assertEqual(to_retry, [])
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmailStatus.failed)
+        self.assertEqual(email.attempts, 2)
+        self.assertEqual(len(mail.outbox), 0)
+
+    @override_settings(EMAIL_RETRY_BACKOFF=60)
+    def test_failed_email_not_resent_before_backoff(self):
+        email = OutgoingEmail.objects.create(
+            subject="Hello",
+            body_text="Text",
+            body_html="Html",
+            from_email="oab@example.com",
+            recipients=["reviewer@oab.nl"],
+        )
+
+        with freeze_time("2024-08-29T16:00:00+02:00") as frozen_time:
+            with patch(
+                "openarchiefbeheer.emails.utils.get_connection"
+            ) as m_get_connection:
+                m_get_connection.return_value.open.side_effect = SMTPException("Down")
+
+                send_queued_emails()
+
+            email.refresh_from_db()
+            self.assertEqual(email.attempts, 1)
+
+            # Not due yet, e.g. when another email is queued
+            send_queued_emails()
+
+            email.refresh_from_db()
+            self.assertEqual(email.attempts, 1)
+            self.assertEqual(len(mail.outbox), 0)
+
+            frozen_time.tick(60)
+            send_queued_emails()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmailStatus.sent)
+        self.assertEqual(email.attempts, 2)
+        self.assertIsNone(email.next_attempt_at)
+        self.assertEqual(len(mail.outbox), 1)
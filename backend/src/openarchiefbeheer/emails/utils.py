@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .constants import OutgoingEmailStatus
+from .models import OutgoingEmail
+
+
+def queue_email(
+    subject: str, body_text: str, body_html: str, recipients: list[str]
+) -> OutgoingEmail:
+    """Store the email in the outbox and send it in the background."""
+    from .tasks import send_queued_emails
+
+    email = OutgoingEmail.objects.create(
+        subject=subject,
+        body_text=body_text,
+        body_html=body_html,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipients=recipients,
+    )
+    transaction.on_commit(send_queued_emails.delay)
+    return email
+
+
+def send_emails(emails: list[OutgoingEmail]) -> list[OutgoingEmail]:
+    """Send the emails over a single connection and update their status.
+
+    Returns the emails that could not be sent and should be retried. They are
+    attempted again after a backoff that doubles with every attempt.
+    """
+    to_retry = []
+    try:
+        connection = get_connection()
+        connection.open()
+    except Exception as exc:
+        # Nothing can be sent without a connection
+        connection, error = None, exc
+    else:
+        error = None
+
+    for email in emails:
+        email.attempts += 1
+        if connection is not None:
+            message = EmailMultiAlternatives(
+                subject=email.subject,
+                body=email.body_text,
+                from_email=email.from_email,
+                to=email.recipients,
+                connection=connection,
+            )
+            message.attach_alternative(email.body_html, "text/html")
+            try:
+                message.send()
+            except Exception as exc:
+                error = exc
+            else:
+                email.status = OutgoingEmailStatus.sent
+                email.sent = timezone.now()
+                email.last_error = ""
+                email.next_attempt_at = None
+                continue
+
+        email.last_error = str(error)
+        if email.attempts >= settings.EMAIL_MAX_ATTEMPTS:
+            email.status = OutgoingEmailStatus.failed
+            email.next_attempt_at = None
+        else:
+            email.next_attempt_at = timezone.now() + timedelta(
+                seconds=settings.EMAIL_RETRY_BACKOFF * 2 ** (email.attempts - 1)
+            )
+            to_retry.append(email)
+
+    if connection is not None:
+        connection.close()
+
+    OutgoingEmail.objects.bulk_update(
+        emails, ["status", "attempts", "last_error", "sent", "next_attempt_at"]
+    )
+    return to_retry
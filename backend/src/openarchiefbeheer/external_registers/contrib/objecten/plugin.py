@@ -1,15 +1,10 @@
-from collections.abc import Iterable
 from typing import NoReturn
 
-from django.db.models.functions import Length
-
-from zgw_consumers.client import build_client
+from ape_pie import APIClient
+from zgw_consumers.models import Service
 
 from openarchiefbeheer.destruction.constants import ResourceDestructionResultStatus
-from openarchiefbeheer.destruction.models import (
-    DestructionListItem,
-    ResourceDestructionResult,
-)
+from openarchiefbeheer.destruction.models import DestructionListItem
 from openarchiefbeheer.external_registers.plugin import (
     AbstractBasePlugin,
 )
@@ -27,48 +22,30 @@ class ObjectenPlugin(AbstractBasePlugin):
     verbose_name = "Objecten"
     setup_configuration_model = ExternalRegisterConfigurationModel
     setup_configuration_step = ObjectenPluginConfigurartionStep
+    resource_type = "objecten"
 
     def get_admin_url(self, resource_url: str) -> str:
         """From the URL of the resource in the API, return the URL to the resource in the admin of the register."""
         raise NotImplementedError()
 
-    def delete_related_resources(
-        self, item: DestructionListItem, related_resources: Iterable[str]
-    ) -> None | NoReturn:
+    def delete_resource(
+        self,
+        client: APIClient,
+        service: Service,
+        item: DestructionListItem,
+        resource_url: str,
+    ) -> ResourceDestructionResultStatus | NoReturn:
         assert item.zaak
 
-        config = self.get_or_create_config()
-        services_candidates = (
-            config.services.all()
-            .annotate(api_root_length=Length("api_root"))
-            .order_by("-api_root_length")
+        response = client.delete(
+            resource_url.replace(service.api_root, ""),
+            params={"zaak": item.zaak.url},
         )
-        clients = {
-            service.slug: build_client(service) for service in services_candidates
-        }
-
-        for resource_url in related_resources:
-            for service in services_candidates:
-                if not resource_url.startswith(service.api_root):
-                    continue
+        if response.status_code != 404:
+            response.raise_for_status()
 
-                response = clients[service.slug].delete(
-                    resource_url.replace(service.api_root, ""),
-                    params={"zaak": item.zaak.url},
-                )
-                if response.status_code != 404:
-                    response.raise_for_status()
-
-                status_resource = (
-                    ResourceDestructionResultStatus.deleted
-                    if response.status_code == 204
-                    else ResourceDestructionResultStatus.unlinked
-                )
-
-                ResourceDestructionResult.objects.create(
-                    item=item,
-                    resource_type="objecten",
-                    url=resource_url,
-                    status=status_resource,
-                )
-                break
+        return (
+            ResourceDestructionResultStatus.deleted
+            if response.status_code == 204
+            else ResourceDestructionResultStatus.unlinked
+        )
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import ExitStack
 from typing import (
     Iterable,
     NoReturn,
@@ -6,16 +7,25 @@ from typing import (
     TypeVar,
 )
 
+from django.conf import settings
 from django.utils.translation import gettext as _
 
+from ape_pie import APIClient
 from django_setup_configuration import BaseConfigurationStep, ConfigurationModel
 from maykin_config_checks import HealthCheckResult
+from zgw_consumers.concurrent import parallel
 from zgw_consumers.models import Service
 
-from openarchiefbeheer.destruction.models import DestructionListItem
+from openarchiefbeheer.clients import build_client
+from openarchiefbeheer.destruction.constants import ResourceDestructionResultStatus
+from openarchiefbeheer.destruction.models import (
+    DestructionListItem,
+    ResourceDestructionResult,
+)
 from openarchiefbeheer.utils.health_checks import CheckResult, ExtraInfo
 
 from .models import ExternalRegisterConfig
+from .resolver import resolve_plugin_service
 
 type Identifier = str
 type ServiceSlug = str
@@ -36,10 +46,26 @@ class AbstractBasePlugin[T](ABC):
     """
     setup_configuration_model: type[ConfigurationModel] | None = None
     setup_configuration_step: type[BaseConfigurationStep] | None = None
+    resource_type: str = ""
+    """
+    The type of the deleted resources, as shown in the destruction report.
+    """
 
     def __init__(self, identifier: Identifier):
         self.identifier = identifier
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if (
+            cls.delete_resource is AbstractBasePlugin.delete_resource
+            and cls.delete_related_resources
+            is AbstractBasePlugin.delete_related_resources
+        ):
+            raise TypeError(
+                f"{cls.__name__} must implement delete_resource or "
+                "delete_related_resources."
+            )
+
     def get_label(self) -> str:
         return self.verbose_name
 
@@ -49,6 +75,10 @@ class AbstractBasePlugin[T](ABC):
         )
         return config
 
+    def get_service_for_resource(self, resource_url: str) -> Service | None:
+        """Return the service of the plugin with the longest API root matching the URL."""
+        return resolve_plugin_service(resource_url, self.identifier)
+
     @property
     def is_automatically_configurable(self):
         return (
@@ -98,12 +128,75 @@ class AbstractBasePlugin[T](ABC):
         """From the URL of the resource in the API, return the URL to the resource in the admin of the register."""
         raise NotImplementedError()
 
-    @abstractmethod
+    def delete_resource(
+        self,
+        client: APIClient,
+        service: Service,
+        item: DestructionListItem,
+        resource_url: str,
+    ) -> ResourceDestructionResultStatus | NoReturn:
+        """Delete/Unlink a single resource from the register.
+
+        The resources of a zaak are deleted concurrently, so this must not access
+        the database. The client is shared with the other deletions for the same
+        service. Raise an error if something goes wrong.
+        """
+        raise NotImplementedError()
+
     def delete_related_resources(
         self, item: DestructionListItem, related_resources: Iterable[str]
     ) -> None | NoReturn:
         """Delete/Unlink the resources from the register that are related to the zaak.
 
-        Raise an error if something goes wrong.
+        The resources are deleted concurrently with :meth:`delete_resource`, with one
+        client per service. The results of the successful deletions are recorded,
+        after which the first error (if any) is raised.
         """
-        raise NotImplementedError()
+        resources = [
+            (resource_url, service)
+            for resource_url in related_resources
+            if (service := self.get_service_for_resource(resource_url))
+        ]
+        if not resources:
+            return
+
+        futures = []
+        with ExitStack() as stack:
+            clients: dict[int, APIClient] = {}
+            for _resource_url, service in resources:
+                if service.pk not in clients:
+                    clients[service.pk] = stack.enter_context(build_client(service))
+
+            with parallel(
+                max_workers=settings.RELATED_OBJECTS_DELETION_WORKERS
+            ) as executor:
+                for resource_url, service in resources:
+                    futures.append(
+                        executor.submit(
+                            self.delete_resource,
+                            clients[service.pk],
+                            service,
+                            item,
+                            resource_url,
+                        )
+                    )
+
+        results = []
+        error = None
+        for (resource_url, _service), future in zip(resources, futures, strict=True):
+            if (exception := future.exception()) is not None:
+                error = error or exception
+                continue
+
+            results.append(
+                ResourceDestructionResult(
+                    item=item,
+                    resource_type=self.resource_type,
+                    url=resource_url,
+                    status=future.result(),
+                )
+            )
+        ResourceDestructionResult.objects.bulk_create(results)
+
+        if error is not None:
+            raise error
@@ -0,0 +1,58 @@
+import logging
+from functools import cache
+
+from zgw_consumers.models import Service
+
+from openarchiefbeheer.utils.datastructure import PrefixTrie
+
+from .models import ExternalRegisterConfig
+
+logger = logging.getLogger(__name__)
+
+type ResolvedService = tuple[Service, str | None]
+
+
+@cache
+def _get_services_tries() -> tuple[
+    PrefixTrie[ResolvedService], dict[str, PrefixTrie[Service]]
+]:
+    """Return the services (and the identifier of their plugin) by API root, and
+    the services of each plugin by API root.
+
+    The tries are built once per process and cleared when a service or a plugin
+    configuration changes.
+    """
+    identifiers: dict[int, str] = {}
+    plugin_tries: dict[str, PrefixTrie[Service]] = {}
+    configs = ExternalRegisterConfig.objects.prefetch_related("services").order_by("pk")
+    for config in configs:
+        plugin_trie = plugin_tries.setdefault(config.identifier, PrefixTrie())
+        for service in config.services.all():
+            plugin_trie.insert(service.api_root, service)
+            if service.pk in identifiers:
+                logger.error("Multiple configurations reference the same service.")
+                continue
+            identifiers[service.pk] = config.identifier
+
+    trie = PrefixTrie()
+    for service in Service.objects.all():
+        trie.insert(service.api_root, (service, identifiers.get(service.pk)))
+    return trie, plugin_tries
+
+
+def resolve_service(url: str) -> ResolvedService | None:
+    """Return the service with the longest API root matching the URL."""
+    trie, _plugin_tries = _get_services_tries()
+    return trie.longest_prefix(url)
+
+
+def resolve_plugin_service(url: str, identifier: str) -> Service | None:
+    """Return the service of the plugin with the longest API root matching the URL."""
+    _trie, plugin_tries = _get_services_tries()
+    if (plugin_trie := plugin_tries.get(identifier)) is None:
+        return
+    return plugin_trie.longest_prefix(url)
+
+
+def clear_resolver() -> None:
+    _get_services_tries.cache_clear()
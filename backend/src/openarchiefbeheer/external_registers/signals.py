@@ -1,5 +1,56 @@
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from openarchiefbeheer.config.constants import HEALTH_CHECKS_CACHE_KEY
+from openarchiefbeheer.zaken.models import Zaak
+
+from .models import ExternalRegisterConfig
+from .resolver import clear_resolver
+
+
 def populate_config_models(sender, **kwargs) -> None:
     from .registry import register as registry
 
     for _identifier, plugin in registry.iterate():
         plugin.get_or_create_config()
+
+
+@receiver([post_delete, post_save], sender=ExternalRegisterConfig)
+def clear_resolver_on_config_change(sender, instance, **kwargs) -> None:
+    clear_resolver()
+    cache.delete(HEALTH_CHECKS_CACHE_KEY)
+
+
+@receiver(m2m_changed, sender=ExternalRegisterConfig.services.through)
+def clear_resolver_on_services_change(sender, action: str, **kwargs) -> None:
+    if action in ("post_add", "post_remove", "post_clear"):
+        clear_resolver()
+        cache.delete(HEALTH_CHECKS_CACHE_KEY)
+
+
+@receiver(post_save, sender=ExternalRegisterConfig)
+def reset_supported_zaakobjecten_on_config_change(
+    sender, instance: ExternalRegisterConfig, created: bool, **kwargs
+) -> None:
+    # Creating a config (e.g. on migrate) doesn't change which objects are supported
+    if created:
+        return
+
+    reset_supported_zaakobjecten()
+
+
+@receiver(m2m_changed, sender=ExternalRegisterConfig.services.through)
+def reset_supported_zaakobjecten_on_services_change(
+    sender, action: str, **kwargs
+) -> None:
+    if action in ("post_add", "post_remove", "post_clear"):
+        reset_supported_zaakobjecten()
+
+
+def reset_supported_zaakobjecten() -> None:
+    # The stored related objects may no longer match the configured plugins. They
+    # are looked up when needed until the zaken are synced again.
+    Zaak.objects.filter(supported_zaakobjecten__isnull=False).update(
+        supported_zaakobjecten=None
+    )
@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+import requests_mock
+from ape_pie import APIClient
+from requests import HTTPError
+from zgw_consumers.client import build_client
+from zgw_consumers.models import Service
+from zgw_consumers.test.factories import ServiceFactory
+
+from openarchiefbeheer.destruction.constants import ResourceDestructionResultStatus
+from openarchiefbeheer.destruction.models import (
+    DestructionListItem,
+    ResourceDestructionResult,
+)
+from openarchiefbeheer.destruction.tests.factories import DestructionListItemFactory
+
+from ..plugin import AbstractBasePlugin
+from ..resolver import clear_resolver
+
+
+class DummyPlugin(AbstractBasePlugin):
+    resource_type = "dummies"
+
+    def get_admin_url(self, resource_url: str) -> str:
+        return ""
+
+    def delete_resource(
+        self,
+        client: APIClient,
+        service: Service,
+        item: DestructionListItem,
+        resource_url: str,
+    ) -> ResourceDestructionResultStatus:
+        response = client.delete(resource_url.replace(service.api_root, ""))
+        response.raise_for_status()
+        return ResourceDestructionResultStatus.deleted
+
+
+@requests_mock.Mocker()
+class DeleteRelatedResourcesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_resolver()
+        self.addCleanup(clear_resolver)
+
+        self.plugin = DummyPlugin("dummy")
+        service = ServiceFactory.create(api_root="http://register.nl/api/v1/")
+        self.plugin.get_or_create_config().services.add(service)
+
+    def test_resources_deleted_with_one_client_per_service(self, m):
+        m.delete("http://register.nl/api/v1/resources/1", status_code=204)
+        m.delete("http://register.nl/api/v1/resources/2", status_code=204)
+        item = DestructionListItemFactory.create(with_zaak=True)
+
+        with patch(
+            "openarchiefbeheer.external_registers.plugin.build_client",
+            side_effect=build_client,
+        ) as m_build_client:
+            self.plugin.delete_related_resources(
+                item,
+                related_resources=[
+                    "http://register.nl/api/v1/resources/1",
+                    "http://register.nl/api/v1/resources/2",
+                    "http://unknown.nl/api/v1/resources/3",
+                ],
+            )
+
+        m_build_client.assert_called_once()
+        self.assertEqual(len(m.request_history), 2)
+        self.assertEqual(
+            set(
+                ResourceDestructionResult.objects.filter(
+                    item=item, resource_type="dummies"
+                ).values_list("url", flat=True)
+            ),
+            {
+                "http://register.nl/api/v1/resources/1",
+                "http://register.nl/api/v1/resources/2",
+            },
+        )
+
+    def test_successful_deletions_recorded_on_error(self, m):
+        m.delete("http://register.nl/api/v1/resources/1", status_code=204)
+        m.delete("http://register.nl/api/v1/resources/2", status_code=500)
+        item = DestructionListItemFactory.create(with_zaak=True)
+
+        with self.assertRaises(HTTPError):
+            self.plugin.delete_related_resources(
+                item,
+                related_resources=[
+                    "http://register.nl/api/v1/resources/1",
+                    "http://register.nl/api/v1/resources/2",
+                ],
+            )
+
+        result = ResourceDestructionResult.objects.get(item=item)
+
+        self.assertEqual(result.url, "http://register.nl/api/v1/resources/1")
+        self.assertEqual(result.status, ResourceDestructionResultStatus.deleted)
+
+
+class PluginDefinitionTests(TestCase):
+    def test_plugin_must_delete_resources(self):
+        with self.assertRaises(TypeError):
+
+            class IncompletePlugin(AbstractBasePlugin):
+                def get_admin_url(self, resource_url: str) -> str:
+                    return ""
@@ -6,10 +6,12 @@ from django.test import TestCase
 
 from zgw_consumers.test.factories import ServiceFactory
 
+from openarchiefbeheer.clients import get_service_from_url
 from openarchiefbeheer.destruction.models import DestructionListItem
 
 from ..plugin import AbstractBasePlugin
 from ..registry import Registry
+from ..resolver import clear_resolver
 from ..utils import get_plugin_for_related_object
 
 
@@ -24,6 +26,12 @@ class DummyPlugin(AbstractBasePlugin):
 
 
 class UtilsTest(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_resolver()
+        self.addCleanup(clear_resolver)
+
     def test_retrieve_plugin_for_zaakobject_no_plugin(self):
         ServiceFactory.create(api_root="http://register.nl/api/v1/")
 
@@ -54,3 +62,65 @@ class UtilsTest(TestCase):
 
         assert retrieved_plugin
         self.assertEqual(retrieved_plugin.identifier, "dummy")
+
+    def test_retrieve_plugin_without_queries(self):
+        registry = Registry()
+        registry("dummy")(DummyPlugin)
+        service = ServiceFactory.create(api_root="http://register.nl/api/v1/")
+        registry["dummy"].get_or_create_config().services.add(service)
+
+        with patch("openarchiefbeheer.external_registers.utils.registry", new=registry):
+            get_plugin_for_related_object("http://register.nl/api/v1/resource/1")
+
+            with self.assertNumQueries(0):
+                retrieved_plugin = get_plugin_for_related_object(
+                    "http://register.nl/api/v1/resource/2"
+                )
+
+        assert retrieved_plugin
+        self.assertEqual(retrieved_plugin.identifier, "dummy")
+
+    def test_service_with_longest_api_root_used(self):
+        ServiceFactory.create(api_root="http://register.nl/")
+        service = ServiceFactory.create(api_root="http://register.nl/api/v1/")
+        ServiceFactory.create(api_root="http://register.nl/api/v1/other/")
+
+        self.assertEqual(
+            get_service_from_url("http://register.nl/api/v1/resource/1"), service
+        )
+        self.assertIsNone(get_service_from_url("https://register.nl/api/v1/"))
+
+    def test_resolver_cleared_when_services_change(self):
+        self.assertIsNone(get_service_from_url("http://register.nl/api/v1/resource/1"))
+
+        service = ServiceFactory.create(api_root="http://register.nl/api/v1/")
+
+        self.assertEqual(
+            get_service_from_url("http://register.nl/api/v1/resource/1"), service
+        )
+
+        service.delete()
+
+        self.assertIsNone(get_service_from_url("http://register.nl/api/v1/resource/1"))
+
+    def test_service_of_plugin_used(self):
+        plugin = DummyPlugin("dummy")
+        service = ServiceFactory.create(api_root="http://register.nl/api/v1/")
+        plugin.get_or_create_config().services.add(service)
+        # A service with a longer API root, which belongs to another plugin
+        other_service = ServiceFactory.create(
+            api_root="http://register.nl/api/v1/other/"
+        )
+        DummyPlugin("other").get_or_create_config().services.add(other_service)
+
+        self.assertEqual(
+            plugin.get_service_for_resource(
+                "http://register.nl/api/v1/other/resource/1"
+            ),
+            service,
+        )
+        self.assertIsNone(
+            DummyPlugin("unconfigured").get_service_for_resource(
+                "http://register.nl/api/v1/resource/1"
+            )
+        )
@@ -1,24 +1,14 @@
-import logging
-
-from zgw_consumers.models import Service
-
 from .plugin import AbstractBasePlugin
 from .registry import register as registry
-
-logger = logging.getLogger(__name__)
+from .resolver import resolve_service
 
 
 def get_plugin_for_related_object(related_object_url: str) -> AbstractBasePlugin | None:
-    service = Service.get_service(related_object_url)
-
-    if service is None:
+    if (resolved := resolve_service(related_object_url)) is None:
         return
 
-    configs = service.externalregisterconfig_set.all()
-    if (count := configs.count()) == 0:
+    _service, identifier = resolved
+    if identifier is None or identifier not in registry:
         return
-    elif count > 1:
-        logger.error("Multiple configurations reference the same service.")
 
-    config = configs.first()
-    return registry[config.identifier]
+    return registry[identifier]
@@ -6,18 +6,31 @@ from rest_framework import mixins
 from rest_framework.viewsets import GenericViewSet
 from timeline_logger.models import TimelineLog
 
+from openarchiefbeheer.utils.paginators import OptionalCursorPagination
+
 from .filtersets import LogsFilterset
 from .serializers import AuditTrailItemSerializer
 
 
+class LogsPagination(OptionalCursorPagination):
+    # The cursor only holds the timestamp (the first field), logs with the same
+    # timestamp are skipped with an offset. The pk keeps their order stable.
+    ordering = ("timestamp", "pk")
+
+
 @extend_schema_view(
     list=extend_schema(
         tags=["Logs"],
         summary=_("List logs"),
+        description=_(
+            "The logs are ordered by timestamp. They are paginated only when the "
+            "`cursor` or `page_size` query parameter is given."
+        ),
     ),
 )
 class LogsViewset(mixins.ListModelMixin, GenericViewSet):
-    queryset = TimelineLog.objects.order_by("timestamp")
+    queryset = TimelineLog.objects.order_by("timestamp", "pk")
     serializer_class = AuditTrailItemSerializer
     filter_backends = (DjangoFilterBackend,)
     filterset_class = LogsFilterset
+    pagination_class = LogsPagination
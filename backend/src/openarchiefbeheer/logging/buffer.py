@@ -0,0 +1,80 @@
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Iterator
+
+from django.db import transaction
+
+from timeline_logger.models import TimelineLog
+
+from openarchiefbeheer.accounts.api.serializers import UserSerializer
+from openarchiefbeheer.accounts.models import User
+
+_local = threading.local()
+
+
+class AuditLogBuffer:
+    def __init__(self):
+        self.logs: list[TimelineLog] = []
+        self.user_snapshots: dict[int, dict] = {}
+
+
+def get_current_buffer() -> AuditLogBuffer | None:
+    return getattr(_local, "buffer", None)
+
+
+@contextmanager
+def buffered_audit_log() -> Iterator[AuditLogBuffer]:
+    """Collect the audit logs created within the block and write them at once.
+
+    The logs are written with a single query when the current transaction is
+    committed (or directly, if there is no transaction). Like the logs written
+    without a buffer, the logs are also written if an exception is raised in the
+    block, but the logs recorded in an atomic block that is rolled back are
+    discarded. Nested blocks share the buffer of the outermost block.
+    """
+    if (buffer := get_current_buffer()) is not None:
+        yield buffer
+        return
+
+    buffer = _local.buffer = AuditLogBuffer()
+    try:
+        yield buffer
+    finally:
+        _local.buffer = None
+
+        # Registered after the logs are added to the buffer (see record_log)
+        transaction.on_commit(partial(write_logs, buffer.logs))
+
+
+def write_logs(logs: list[TimelineLog]) -> None:
+    if logs:
+        TimelineLog.objects.bulk_create(logs)
+
+
+def get_user_snapshot(user: User) -> dict:
+    """Return the data of the user that is stored with the log.
+
+    Within a buffered block, the data is only computed once per user.
+    """
+    buffer = get_current_buffer()
+    if buffer is not None and user.pk in buffer.user_snapshots:
+        return buffer.user_snapshots[user.pk]
+
+    snapshot = {
+        "user": UserSerializer(user).data,
+        "user_groups": sorted([group.name for group in user.groups.all()]),
+    }
+    if buffer is not None:
+        buffer.user_snapshots[user.pk] = snapshot
+    return snapshot
+
+
+def record_log(log: TimelineLog) -> None:
+    if (buffer := get_current_buffer()) is not None:
+        # The log is only added once the atomic block in which it was recorded is
+        # committed, so that it's discarded if the block is rolled back.
+        transaction.on_commit(partial(buffer.logs.append, log))
+        return
+
+    log.save()
@@ -1,12 +1,10 @@
 import traceback
 
-from django.db.models import Max, Min, Model
+from django.db.models import Model
 
 from timeline_logger.models import TimelineLog
 
-from openarchiefbeheer.accounts.api.serializers import UserSerializer
 from openarchiefbeheer.accounts.models import User
-from openarchiefbeheer.destruction.constants import ListItemStatus
 from openarchiefbeheer.destruction.models import (
     DestructionList,
     DestructionListAssignee,
@@ -14,6 +12,7 @@ from openarchiefbeheer.destruction.models import (
     DestructionListReview,
     ReviewDecisionChoices,
 )
+from openarchiefbeheer.logging.buffer import get_user_snapshot, record_log
 from openarchiefbeheer.zaken.utils import (
     format_resultaten_choices,
     format_zaaktype_choices,
@@ -30,16 +29,16 @@ def _create_log(
         extra_data = {}
 
     if user:
-        serializer = UserSerializer(user)
-        user_groups = sorted([group.name for group in user.groups.all()])
-        extra_data.update({"user": serializer.data, "user_groups": user_groups})
+        extra_data.update(get_user_snapshot(user))
 
-    return TimelineLog.objects.create(
+    log = TimelineLog(
         content_object=model,
         template=TEMPLATE_FORMAT % {"event": event},
         extra_data=extra_data,
         user=user,
     )
+    record_log(log)
+    return log
 
 
 def destruction_list_created(
@@ -64,39 +63,20 @@ def destruction_list_created(
 def destruction_list_ready_for_first_review(
     destruction_list: DestructionList, user: User
 ) -> None:
+    summary = destruction_list.get_summary()
     extra_data = {
-        "zaaktypen": format_zaaktype_choices(
-            destruction_list.items.order_by(
-                "zaak___expand__zaaktype__identificatie",
-                "-zaak___expand__zaaktype__versiedatum",
-            )
-            .distinct("zaak___expand__zaaktype__identificatie")
-            .values_list("zaak___expand__zaaktype", flat=True)
-        ),
-        "resultaten": format_resultaten_choices(
-            destruction_list.items.distinct("zaak__resultaat")
-            .values_list("zaak___expand__resultaat", flat=True)
-            .distinct()
-        ),
-        "archiefnominaties": list(
-            destruction_list.items.distinct("zaak__archiefnominatie").values_list(
-                "zaak__archiefnominatie", flat=True
-            )
-        ),
+        "zaaktypen": format_zaaktype_choices(summary.zaaktypen),
+        "resultaten": format_resultaten_choices(summary.resultaten),
+        "archiefnominaties": summary.archiefnominaties,
         "comment": destruction_list.comment,
-        "number_of_zaken": destruction_list.items.filter(
-            status=ListItemStatus.suggested
-        ).count(),
+        "number_of_zaken": summary.suggested_items_count,
     }
 
-    items_max_min = destruction_list.items.aggregate(
-        Min("zaak__archiefactiedatum"), Max("zaak__archiefactiedatum")
-    )
-    if archiefactiedatum_min := items_max_min.get("zaak__archiefactiedatum__min"):
-        extra_data["min_archiefactiedatum"] = archiefactiedatum_min
+    if summary.min_archiefactiedatum:
+        extra_data["min_archiefactiedatum"] = summary.min_archiefactiedatum
 
-    if archiefactiedatum_max := items_max_min.get("zaak__archiefactiedatum__max"):
-        extra_data["max_archiefactiedatum"] = archiefactiedatum_max
+    if summary.max_archiefactiedatum:
+        extra_data["max_archiefactiedatum"] = summary.max_archiefactiedatum
 
     _create_log(
         model=destruction_list,
@@ -123,9 +103,7 @@ def destruction_list_review_response_processed(
         model=destruction_list,
         event="destruction_list_review_response_processed",
         extra_data={
-            "number_of_zaken": destruction_list.items.filter(
-                status=ListItemStatus.suggested
-            ).count(),
+            "number_of_zaken": destruction_list.get_summary().suggested_items_count,
         },
     )
 
@@ -272,28 +250,26 @@ def destruction_list_items_deleted(
         event="destruction_list_items_deleted",
         extra_data={
             "number_deleted_items": number_deleted_items,
-            "number_of_zaken": destruction_list.items.filter(
-                status=ListItemStatus.suggested
-            ).count(),
+            "number_of_zaken": destruction_list.get_summary().suggested_items_count,
         },
     )
 
 
 def resync_started() -> None:
-    return TimelineLog.objects.create(
-        template="logging/resync_started.txt",
-    )
+    log = TimelineLog(template="logging/resync_started.txt")
+    record_log(log)
+    return log
 
 
 def resync_successful() -> None:
-    return TimelineLog.objects.create(
-        template="logging/resync_successful.txt",
-    )
+    log = TimelineLog(template="logging/resync_successful.txt")
+    record_log(log)
+    return log
 
 
 def resync_failed(exc: Exception) -> None:
     error = traceback.format_exception_only(exc)[0]
 
-    return TimelineLog.objects.create(
-        template="logging/resync_failed.txt", extra_data={"error": error}
-    )
+    log = TimelineLog(template="logging/resync_failed.txt", extra_data={"error": error})
+    record_log(log)
+    return log
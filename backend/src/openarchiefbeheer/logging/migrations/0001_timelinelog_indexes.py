@@ -0,0 +1,27 @@
+from django.db import migrations
+
+# The timeline log model is provided by django-timeline-logger, so the indexes
+# used by the audit log endpoint are managed here.
+INDEXES = {
+    "timelinelog_object_timestamp_idx": "(content_type_id, object_id, timestamp)",
+    "timelinelog_template_timestamp_idx": "(template, timestamp)",
+    # Logs are only appended, so a BRIN index keeps time range queries cheap
+    # at a fraction of the size of a B-tree index.
+    "timelinelog_timestamp_brin_idx": "USING brin (timestamp)",
+}
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("timeline_logger", "__latest__"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=f"CREATE INDEX IF NOT EXISTS {name} ON timeline_logger_timelinelog {columns};",
+            reverse_sql=f"DROP INDEX IF EXISTS {name};",
+        )
+        for name, columns in INDEXES.items()
+    ]
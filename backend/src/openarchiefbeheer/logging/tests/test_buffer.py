@@ -0,0 +1,113 @@
+from contextlib import suppress
+
+from django.db import transaction
+from django.test import TestCase
+
+from timeline_logger.models import TimelineLog
+
+from openarchiefbeheer.accounts.tests.factories import UserFactory
+from openarchiefbeheer.destruction.tests.factories import DestructionListFactory
+from openarchiefbeheer.logging import logevent
+from openarchiefbeheer.logging.buffer import buffered_audit_log
+from openarchiefbeheer.utils.tests.get_queries import executed_queries
+
+
+class BufferedAuditLogTests(TestCase):
+    def test_logs_written_directly_without_buffer(self):
+        user = UserFactory.create()
+        destruction_list = DestructionListFactory.create()
+
+        logevent.destruction_list_updated(destruction_list, user)
+
+        self.assertEqual(TimelineLog.objects.for_object(destruction_list).count(), 1)
+
+    def test_logs_written_at_once_on_commit(self):
+        user = UserFactory.create()
+        destruction_lists = DestructionListFactory.create_batch(3)
+
+        with self.captureOnCommitCallbacks() as callbacks, buffered_audit_log():
+            for destruction_list in destruction_lists:
+                logevent.destruction_list_updated(destruction_list, user)
+
+        self.assertEqual(TimelineLog.objects.count(), 0)
+
+        with executed_queries() as context:
+            for callback in callbacks:
+                callback()
+
+        self.assertEqual(len(context.captured_queries), 1)
+        for destruction_list in destruction_lists:
+            self.assertEqual(
+                TimelineLog.objects.for_object(destruction_list).count(), 1
+            )
+
+    def test_user_serialized_once_per_buffer(self):
+        user = UserFactory.create()
+        destruction_list = DestructionListFactory.create()
+
+        with self.captureOnCommitCallbacks(execute=True), buffered_audit_log():
+            logevent.destruction_list_updated(destruction_list, user)
+
+            with executed_queries() as context:
+                logevent.destruction_list_updated(destruction_list, user)
+
+        self.assertEqual(len(context.captured_queries), 0)
+        logs = TimelineLog.objects.for_object(destruction_list)
+        self.assertEqual(logs.count(), 2)
+        self.assertEqual(logs[1].extra_data["user"]["pk"], user.pk)
+
+    def test_logs_written_on_error(self):
+        user = UserFactory.create()
+        destruction_list = DestructionListFactory.create()
+
+        with (
+            self.captureOnCommitCallbacks(execute=True),
+            self.assertRaises(ValueError),
+            buffered_audit_log(),
+        ):
+            logevent.destruction_list_updated(destruction_list, user)
+            raise ValueError
+
+        self.assertEqual(TimelineLog.objects.for_object(destruction_list).count(), 1)
+
+    def test_logs_discarded_on_rollback(self):
+        user = UserFactory.create()
+        destruction_list = DestructionListFactory.create()
+
+        with (
+            self.captureOnCommitCallbacks(execute=True) as callbacks,
+            self.assertRaises(ValueError),
+            transaction.atomic(),
+            buffered_audit_log(),
+        ):
+            logevent.destruction_list_updated(destruction_list, user)
+            raise ValueError
+
+        self.assertEqual(len(callbacks), 0)
+        self.assertEqual(TimelineLog.objects.count(), 0)
+
+    def test_resync_logs_buffered(self):
+        with self.captureOnCommitCallbacks() as callbacks, buffered_audit_log():
+            logevent.resync_started()
+            logevent.resync_successful()
+
+        self.assertEqual(TimelineLog.objects.count(), 0)
+
+        for callback in callbacks:
+            callback()
+
+        self.assertEqual(TimelineLog.objects.count(), 2)
+
+    def test_logs_of_rolled_back_block_discarded(self):
+        user = UserFactory.create()
+        destruction_list1, destruction_list2 = DestructionListFactory.create_batch(2)
+
+        with self.captureOnCommitCallbacks(execute=True), buffered_audit_log():
+            logevent.destruction_list_updated(destruction_list1, user)
+
+            with suppress(ValueError), transaction.atomic():
+                logevent.destruction_list_updated(destruction_list2, user)
+                raise ValueError
+
+        self.assertEqual(TimelineLog.objects.for_object(destruction_list1).count(), 1)
+        self.assertEqual(TimelineLog.objects.for_object(destruction_list2).count(), 0)
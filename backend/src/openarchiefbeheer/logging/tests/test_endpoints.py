@@ -97,3 +97,35 @@ class LogsViewsetTest(APITestCase):
         self.assertEqual(data[0]["pk"], log_two_days_ago.pk)
         self.assertEqual(data[1]["pk"], log_yesterday.pk)
         self.assertEqual(data[2]["pk"], log_today.pk)
+
+    def test_keyset_pagination(self):
+        record_manager = UserFactory.create(post__can_start_destruction=True)
+        destruction_list = DestructionListFactory.create()
+        logs = [
+            TimelineLog.objects.create(
+                content_object=destruction_list,
+                template="logging/destruction_list_updated.txt",
+                extra_data={},
+                user=record_manager,
+            )
+            for _ in range(5)
+        ]
+
+        endpoint = furl(reverse("api:logs-list"))
+        endpoint.args["destruction_list"] = destruction_list.uuid
+        endpoint.args["page_size"] = 2
+
+        self.client.force_login(record_manager)
+        pks = []
+        next_url = endpoint.url
+        while next_url:
+            response = self.client.get(next_url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+            data = response.json()
+            self.assertLessEqual(len(data["results"]), 2)
+            pks += [log["pk"] for log in data["results"]]
+            next_url = data["next"]
+
+        self.assertEqual(pks, [log.pk for log in logs])
@@ -1,10 +1,20 @@
+import logging
+from collections import Counter
+
 from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
 from django.http import HttpRequest, JsonResponse
 from django.middleware.csrf import get_token
 from django.utils.translation import gettext as _
 
+from openarchiefbeheer.clients import local_cache_scope
+from openarchiefbeheer.logging.buffer import buffered_audit_log
+from openarchiefbeheer.utils.profiling import RequestProfile, profile_request
+
 CSRF_TOKEN_HEADER_NAME = "X-CSRFToken"
 
+performance_logger = logging.getLogger("performance")
+
 
 class CsrfTokenMiddleware:
     """
@@ -56,3 +66,90 @@ class SessionExpiredMiddleware:
             },
             status=403,
         )
+
+
+class AuditLogBufferMiddleware:
+    """
+    Collect the audit logs created during the request and write them at once when the transaction is committed.
+
+    The logs are also written if the request fails, like the logs written without the buffer.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        with buffered_audit_log():
+            return self.get_response(request)
+
+
+class LocalCacheMiddleware:
+    """
+    Memoize the cached lookups in-process for the duration of the request
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        with local_cache_scope():
+            return self.get_response(request)
+
+
+class ProfilingMiddleware:
+    """
+    Profile the queries and the requests to the external APIs made for the API requests
+
+    The timings are added in a ``Server-Timing`` header, and the slow requests and the
+    requests with many (duplicate) queries are logged to the performance log.
+    Only enabled with the ``PROFILING_ENABLED`` setting.
+    """
+
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed()
+
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        if not request.path_info.startswith("/api"):
+            return self.get_response(request)
+
+        with profile_request() as profile:
+            response = self.get_response(request)
+
+        response["Server-Timing"] = profile.get_server_timing()
+
+        duplicate_queries = profile.get_duplicate_queries(
+            settings.PROFILING_DUPLICATE_QUERIES_THRESHOLD
+        )
+        if (
+            profile.duration * 1000 >= settings.PROFILING_SLOW_REQUEST_THRESHOLD
+            or profile.query_count >= settings.PROFILING_QUERY_COUNT_THRESHOLD
+            or duplicate_queries
+        ):
+            self.log_outlier(request, response.status_code, profile)
+
+        return response
+
+    def log_outlier(
+        self, request: HttpRequest, status_code: int, profile: RequestProfile
+    ) -> None:
+        lines = [
+            f"{request.method} {request.path_info} {status_code} "
+            f"{profile.duration * 1000:.0f}ms | "
+            f"{profile.query_count} queries {profile.query_duration * 1000:.0f}ms | "
+            f"{len(profile.http_calls)} API calls {profile.http_duration * 1000:.0f}ms"
+        ]
+        for fingerprint, count in profile.get_duplicate_queries(
+            settings.PROFILING_DUPLICATE_QUERIES_THRESHOLD
+        ):
+            lines.append(f"  {count}x query: {fingerprint}")
+
+        http_calls = Counter(
+            (call.method, call.endpoint) for call in profile.http_calls
+        )
+        for (method, endpoint), count in http_calls.most_common():
+            lines.append(f"  {count}x API call: {method} {endpoint}")
+
+        performance_logger.info("\n".join(lines))
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import SelectionItem
+from .models import SelectionItem, SelectionKey
 
 
 @admin.register(SelectionItem)
@@ -12,3 +12,11 @@ class SelectionItemAdmin(admin.ModelAdmin):
     )
     list_filter = ("key",)
     search_fields = ("zaak_url", "key")
+
+
+@admin.register(SelectionKey)
+class SelectionKeyAdmin(admin.ModelAdmin):
+    list_display = ("key", "destruction_list", "status", "last_modified")
+    list_filter = ("status",)
+    search_fields = ("key",)
+    raw_id_fields = ("destruction_list",)
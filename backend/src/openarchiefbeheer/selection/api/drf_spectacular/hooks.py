@@ -24,6 +24,13 @@ def update_schema_for_dynamic_keys(
         "application/json"
     ]["examples"] = build_examples_list(openapi_response_schema.examples)
 
+    result["paths"]["/api/v1/selections/{key}/"]["get"]["responses"]["200"]["content"][
+        "application/json"
+    ]["schema"] = openapi_response_schema.response
+    result["paths"]["/api/v1/selections/{key}/"]["get"]["responses"]["200"]["content"][
+        "application/json"
+    ]["examples"] = build_examples_list(openapi_response_schema.examples)
+
     result["paths"]["/api/v1/selections/{key}/count/"]["get"]["responses"]["200"][
         "content"
     ]["application/json"]["schema"] = build_object_type(
@@ -29,6 +29,37 @@ SCHEMA_RESPONSE = OpenApiResponse(
     ],
 )
 
+SCHEMA_PATCH_RESPONSE = OpenApiResponse(
+    response={
+        "oneOf": [
+            SCHEMA_RESPONSE.response,
+            {
+                "type": "object",
+                "description": "Response in delta mode",
+                "properties": {
+                    "version": {"type": "integer"},
+                    "items": SCHEMA_RESPONSE.response,
+                },
+            },
+        ]
+    },
+    examples=[
+        *SCHEMA_RESPONSE.examples,
+        OpenApiExample(
+            "Delta mode",
+            value={
+                "version": 12,
+                "items": {
+                    "http://zaken.nl/api/v1/zaken/111-111-111": {
+                        "selected": True,
+                        "detail": {},
+                    },
+                },
+            },
+        ),
+    ],
+)
+
 SCHEMA_REQUEST = OpenApiRequest(
     request={
         "type": "object",
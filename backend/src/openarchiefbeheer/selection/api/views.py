@@ -1,16 +1,33 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.http import parse_etags, quote_etag
 from django.utils.translation import gettext_lazy as _
 
-from drf_spectacular.utils import extend_schema
-from rest_framework import status
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema, inline_serializer
+from rest_framework import serializers, status
 from rest_framework.generics import GenericAPIView
 from rest_framework.parsers import FormParser, JSONParser
 from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from openarchiefbeheer.zaken.api.filtersets import ZaakFilterBackend, ZaakFilterSet
+from openarchiefbeheer.zaken.models import Zaak
+from openarchiefbeheer.zaken.utils import get_zaken_version
+
 from ..models import AllSelectedToggle, SelectionItem
+from ..utils import bump_selection_version, count_selected, get_selection_version
 from .filtersets import SelectionItemBackend, SelectionItemFilterset
-from .schemas import SCHEMA_REQUEST, SCHEMA_RESPONSE, SCHEMA_SELECTION_REQUEST
+from .schemas import (
+    SCHEMA_PATCH_RESPONSE,
+    SCHEMA_REQUEST,
+    SCHEMA_RESPONSE,
+    SCHEMA_SELECTION_REQUEST,
+)
 from .serializers import (
     SelectAllToggleSerializer,
     SelectionItemDataReadSerializer,
@@ -40,6 +57,49 @@ class SelectionView(GenericAPIView):
         read_serialiser = SelectionReadSerializer(instance=qs)
         return read_serialiser.data
 
+    def _get_etag(self, version: int) -> str:
+        return quote_etag(str(version))
+
+    def _is_not_modified(self, version: int) -> bool:
+        if_none_match = self.request.headers.get("If-None-Match")
+        if not if_none_match:
+            return False
+
+        etags = [etag.removeprefix("W/") for etag in parse_etags(if_none_match)]
+        return "*" in etags or self._get_etag(version) in etags
+
+    def _get_response(self, data: dict, version: int) -> Response:
+        return Response(
+            data=data,
+            status=status.HTTP_200_OK,
+            headers={"ETag": self._get_etag(version)},
+        )
+
+    @extend_schema(
+        tags=["Selection"],
+        summary=_("Get selection (conditional)"),
+        description=_(
+            "Get the zaken in a selection and whether they are checked or not. "
+            "The response contains an ETag header with the version of the selection. "
+            "If the version passed in the If-None-Match header is still the current "
+            "one, a 304 response is returned without body."
+        ),
+        # This is not the right serializer, but we need to specify a ListSerializer,
+        # otherwise the filter backends are not picked up. The right response is added by using
+        # DRF spectacular post processing hooks.
+        responses={200: SelectionItemDataReadSerializer(many=True), 304: None},
+    )
+    def get(self, request, *args, **kwargs):
+        version = get_selection_version(self.kwargs["key"])
+        if self._is_not_modified(version):
+            return Response(
+                status=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": self._get_etag(version)},
+            )
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return self._get_response(self._get_selection_representation(queryset), version)
+
     @extend_schema(
         tags=["Selection"],
         summary=_("Get selection"),
@@ -53,9 +113,10 @@ class SelectionView(GenericAPIView):
         request=SCHEMA_SELECTION_REQUEST,
     )
     def post(self, request, *args, **kwargs):
+        version = get_selection_version(self.kwargs["key"])
         queryset = self.filter_queryset(self.get_queryset())
 
-        return Response(self._get_selection_representation(queryset))
+        return self._get_response(self._get_selection_representation(queryset), version)
 
     @extend_schema(
         tags=["Selection"],
@@ -72,16 +133,28 @@ class SelectionView(GenericAPIView):
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        version = bump_selection_version(self.kwargs["key"])
 
-        return Response(
-            data=self._get_selection_representation(), status=status.HTTP_200_OK
-        )
+        return self._get_response(self._get_selection_representation(), version)
 
     @extend_schema(
         tags=["Selection"],
         summary=_("Partial update to selection"),
-        description=_("Partially update a selection."),
-        responses={200: SCHEMA_RESPONSE},
+        description=_(
+            "Partially update a selection. "
+            "By default the whole selection is returned. In delta mode, only the "
+            "updated items are returned together with the new version of the selection."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name="delta",
+                type=OpenApiTypes.BOOL,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description=_("Only return the items that were updated."),
+            )
+        ],
+        responses={200: SCHEMA_PATCH_RESPONSE},
         request=SCHEMA_REQUEST,
     )
     def patch(self, request, *args, **kwargs):
@@ -92,9 +165,18 @@ class SelectionView(GenericAPIView):
         )
         serializer.is_valid(raise_exception=True)
         serializer.save()
-
-        return Response(
-            data=self._get_selection_representation(), status=status.HTTP_200_OK
+        version = bump_selection_version(self.kwargs["key"])
+
+        if request.query_params.get("delta") not in ("true", "True", "1"):
+            return self._get_response(self._get_selection_representation(), version)
+
+        updated_items = self.get_queryset().filter(zaak_url__in=list(request.data))
+        return self._get_response(
+            {
+                "version": version,
+                "items": self._get_selection_representation(updated_items),
+            },
+            version,
         )
 
     @extend_schema(
@@ -107,6 +189,7 @@ class SelectionView(GenericAPIView):
     def delete(self, request, *args, **kwargs):
         instances = SelectionItem.objects.filter(key=self.kwargs["key"])
         instances.delete()
+        bump_selection_version(self.kwargs["key"])
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
@@ -142,6 +225,54 @@ class SelectionCountView(GenericAPIView):
         return Response(data={"count": qs.count()}, status=status.HTTP_200_OK)
 
 
+class SelectionSelectedCountView(GenericAPIView):
+    filter_backends = (ZaakFilterBackend,)
+    filterset_class = ZaakFilterSet
+
+    def get_queryset(self):
+        return Zaak.objects.all()
+
+    def _get_cache_key(self, version: int) -> str:
+        filters = urlencode(sorted(self.request.query_params.lists()), doseq=True)
+        # The zaken matching the filters change when the zaken are synced
+        digest = hashlib.md5(
+            "+".join(
+                [self.kwargs["key"], str(version), get_zaken_version(), filters]
+            ).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return f"selection-selected-count:{digest}"
+
+    @extend_schema(
+        tags=["Selection"],
+        summary=_("Count selected zaken"),
+        description=_(
+            "Retrieve how many zaken are selected, taking into account the "
+            "'selected all' toggle. If all zaken are selected, the count is the number "
+            "of zaken matching the zaken filters passed as query parameters minus the "
+            "zaken that were explicitly deselected. Otherwise, it is the number of "
+            "zaken that were explicitly selected."
+        ),
+        responses={
+            200: inline_serializer(
+                name="SelectionSelectedCount",
+                fields={"count": serializers.IntegerField()},
+            )
+        },
+        request=None,
+    )
+    def get(self, request, *args, **kwargs):
+        key = self.kwargs["key"]
+        cache_key = self._get_cache_key(get_selection_version(key))
+
+        count = cache.get(cache_key)
+        if count is None:
+            count = count_selected(key, self.filter_queryset(self.get_queryset()))
+            cache.set(cache_key, count, timeout=settings.SELECTION_COUNT_CACHE_TIMEOUT)
+
+        return Response(data={"count": count}, status=status.HTTP_200_OK)
+
+
 class SelectionSelectAllView(APIView):
     @extend_schema(
         tags=["Selection"],
@@ -159,6 +290,7 @@ class SelectionSelectAllView(APIView):
 
         toggle.all_selected = True
         toggle.save()
+        bump_selection_version(key)
 
         return Response(status=status.HTTP_200_OK)
 
@@ -178,6 +310,7 @@ class SelectionSelectAllView(APIView):
 
         toggle.all_selected = False
         toggle.save()
+        bump_selection_version(key)
 
         return Response(status=status.HTTP_204_NO_CONTENT)
 
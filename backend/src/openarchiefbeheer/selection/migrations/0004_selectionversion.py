@@ -0,0 +1,48 @@
+# Generated by Django 5.2.17 on 2026-10-19 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("selection", "0003_alter_allselectedtoggle_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SelectionVersion",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="The key to access this selection.",
+                        max_length=250,
+                        unique=True,
+                        verbose_name="key",
+                    ),
+                ),
+                (
+                    "version",
+                    models.PositiveBigIntegerField(
+                        default=0,
+                        help_text="Increases every time that the selection is modified.",
+                        verbose_name="version",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "selection version",
+                "verbose_name_plural": "selection versions",
+            },
+        ),
+    ]
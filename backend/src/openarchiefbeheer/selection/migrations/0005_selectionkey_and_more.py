@@ -0,0 +1,94 @@
+# Generated by Django 5.2.17 on 2026-10-19 12:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def register_existing_keys(apps, schema_editor):
+    SelectionItem = apps.get_model("selection", "SelectionItem")
+    AllSelectedToggle = apps.get_model("selection", "AllSelectedToggle")
+    SelectionKey = apps.get_model("selection", "SelectionKey")
+
+    # The existing selections start their time to live now. They are linked to
+    # their destruction list the next time that they are modified.
+    keys = (
+        set(SelectionItem.objects.values_list("key", flat=True).distinct())
+        | set(AllSelectedToggle.objects.values_list("key", flat=True))
+    )
+    SelectionKey.objects.bulk_create(
+        [SelectionKey(key=key) for key in keys], ignore_conflicts=True
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("destruction", "0031_alter_destructionlist_destruction_report"),
+        ("selection", "0004_selectionversion"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="selectionitem",
+            index=models.Index(
+                fields=["key", "zaak_url"], name="selection_key_zaak_url_idx"
+            ),
+        ),
+        migrations.CreateModel(
+            name="SelectionKey",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "key",
+                    models.CharField(
+                        help_text="The key to access this selection.",
+                        max_length=250,
+                        unique=True,
+                        verbose_name="key",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        blank=True,
+                        help_text="The status of the destruction list for which this selection is used. Once the destruction list has another status (or is deleted), the selection can be cleaned up.",
+                        max_length=80,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "last_modified",
+                    models.DateTimeField(
+                        auto_now=True,
+                        help_text="When the selection was last modified. Selections that are not modified for a long time are cleaned up.",
+                        verbose_name="last modified",
+                    ),
+                ),
+                (
+                    "destruction_list",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The destruction list to which this selection belongs.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="selection_keys",
+                        to="destruction.destructionlist",
+                        verbose_name="destruction list",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "selection key",
+                "verbose_name_plural": "selection keys",
+            },
+        ),
+        migrations.RunPython(register_existing_keys, migrations.RunPython.noop),
+    ]
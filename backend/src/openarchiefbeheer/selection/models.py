@@ -23,6 +23,9 @@ class SelectionItem(models.Model):
     class Meta:
         verbose_name = _("selection item")
         verbose_name_plural = _("selection items")
+        indexes = [
+            models.Index(fields=["key", "zaak_url"], name="selection_key_zaak_url_idx")
+        ]
 
 
 class AllSelectedToggle(models.Model):
@@ -41,3 +44,61 @@ class AllSelectedToggle(models.Model):
     class Meta:
         verbose_name = _("all selected toggle")
         verbose_name_plural = _("all selected toggles")
+
+
+class SelectionVersion(models.Model):
+    key = models.CharField(
+        _("key"),
+        help_text=_("The key to access this selection."),
+        max_length=250,
+        unique=True,
+    )
+    version = models.PositiveBigIntegerField(
+        _("version"),
+        help_text=_("Increases every time that the selection is modified."),
+        default=0,
+    )
+
+    class Meta:
+        verbose_name = _("selection version")
+        verbose_name_plural = _("selection versions")
+
+
+class SelectionKey(models.Model):
+    key = models.CharField(
+        _("key"),
+        help_text=_("The key to access this selection."),
+        max_length=250,
+        unique=True,
+    )
+    destruction_list = models.ForeignKey(
+        "destruction.DestructionList",
+        on_delete=models.SET_NULL,
+        verbose_name=_("destruction list"),
+        help_text=_("The destruction list to which this selection belongs."),
+        related_name="selection_keys",
+        null=True,
+        blank=True,
+    )
+    status = models.CharField(
+        _("status"),
+        help_text=_(
+            "The status of the destruction list for which this selection is used. "
+            "Once the destruction list has another status (or is deleted), "
+            "the selection can be cleaned up."
+        ),
+        max_length=80,
+        blank=True,
+    )
+    last_modified = models.DateTimeField(
+        _("last modified"),
+        help_text=_(
+            "When the selection was last modified. "
+            "Selections that are not modified for a long time are cleaned up."
+        ),
+        auto_now=True,
+    )
+
+    class Meta:
+        verbose_name = _("selection key")
+        verbose_name_plural = _("selection keys")
@@ -0,0 +1,19 @@
+import logging
+
+from django.conf import settings
+
+from openarchiefbeheer.celery import app
+
+from .utils import delete_selections, get_expired_selection_keys
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def cleanup_expired_selections() -> None:
+    keys = list(get_expired_selection_keys().values_list("key", flat=True))
+
+    for index in range(0, len(keys), settings.SELECTION_CLEANUP_CHUNK_SIZE):
+        delete_selections(keys[index : index + settings.SELECTION_CLEANUP_CHUNK_SIZE])
+
+    logger.info("Cleaned up %d expired selections.", len(keys))
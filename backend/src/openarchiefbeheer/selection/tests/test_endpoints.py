@@ -9,6 +9,9 @@ from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from openarchiefbeheer.accounts.tests.factories import UserFactory
+from openarchiefbeheer.utils.tests.mixins import ClearCacheMixin
+from openarchiefbeheer.zaken.tests.factories import ZaakFactory
+from openarchiefbeheer.zaken.utils import bump_zaken_version
 
 from ..models import AllSelectedToggle, SelectionItem
 from .factories import SelectionItemFactory
@@ -523,3 +526,182 @@ class SelectionAPITests(APITestCase):
         response = self.client.options(reverse("api:selections", args=[key]))
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_partial_update_delta_mode(self):
+        key = "some-key"
+        SelectionItemFactory.create(
+            key=key,
+            is_selected=False,
+            zaak_url="http://zaken.nl/api/v1/zaken/111-111-111",
+        )
+        SelectionItemFactory.create(
+            key=key,
+            is_selected=False,
+            zaak_url="http://zaken.nl/api/v1/zaken/222-222-222",
+        )
+
+        self.client.force_login(self.user)
+
+        endpoint = furl(reverse("api:selections", args=[key]))
+        endpoint.args["delta"] = "true"
+        response = self.client.patch(
+            endpoint.url,
+            data={"http://zaken.nl/api/v1/zaken/111-111-111": {"selected": True}},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.json()
+
+        self.assertEqual(data["version"], 1)
+        self.assertEqual(response["ETag"], '"1"')
+        self.assertEqual(
+            data["items"],
+            {
+                "http://zaken.nl/api/v1/zaken/111-111-111": {
+                    "selected": True,
+                    "detail": {},
+                }
+            },
+        )
+
+    def test_version_increases_on_changes(self):
+        key = "some-key"
+
+        self.client.force_login(self.user)
+
+        self.client.put(
+            reverse("api:selections", args=[key]),
+            data={"http://zaken.nl/api/v1/zaken/111-111-111": {"selected": True}},
+            format="json",
+        )
+        self.client.post(reverse("api:selections-select-all", args=[key]))
+        self.client.delete(reverse("api:selections", args=[key]))
+
+        response = self.client.get(reverse("api:selections", args=[key]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["ETag"], '"3"')
+
+    def test_conditional_get_not_modified(self):
+        key = "some-key"
+        SelectionItemFactory.create(
+            key=key,
+            is_selected=True,
+            zaak_url="http://zaken.nl/api/v1/zaken/111-111-111",
+        )
+
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("api:selections", args=[key]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(
+            response.json()["http://zaken.nl/api/v1/zaken/111-111-111"]["selected"]
+        )
+
+        etag = response["ETag"]
+
+        response = self.client.get(
+            reverse("api:selections", args=[key]), headers={"If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch(
+            reverse("api:selections", args=[key]),
+            data={"http://zaken.nl/api/v1/zaken/111-111-111": {"selected": False}},
+            format="json",
+        )
+
+        response = self.client.get(
+            reverse("api:selections", args=[key]), headers={"If-None-Match": etag}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class SelectionSelectedCountTests(ClearCacheMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.user = UserFactory.create(is_staff=True, is_superuser=True)
+        cls.zaak1 = ZaakFactory.create(omschrijving="AAAAA")
+        cls.zaak2 = ZaakFactory.create(omschrijving="AAAAA")
+        cls.zaak3 = ZaakFactory.create(omschrijving="AAAAA")
+        ZaakFactory.create(omschrijving="BBBBB")
+
+    def test_count_explicit_selection(self):
+        key = "some-key"
+        SelectionItemFactory.create(key=key, is_selected=True, zaak_url=self.zaak1.url)
+        SelectionItemFactory.create(key=key, is_selected=False, zaak_url=self.zaak2.url)
+
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("api:selections-selected-count", args=[key]))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 1)
+
+    def test_count_all_selected_with_filters(self):
+        key = "some-key"
+        AllSelectedToggle.objects.create(key=key, all_selected=True)
+        SelectionItemFactory.create(key=key, is_selected=False, zaak_url=self.zaak2.url)
+
+        self.client.force_login(self.user)
+        endpoint = furl(reverse("api:selections-selected-count", args=[key]))
+        endpoint.args["omschrijving"] = "AAAAA"
+
+        response = self.client.get(endpoint.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_count_is_cached_per_version(self):
+        key = "some-key"
+        AllSelectedToggle.objects.create(key=key, all_selected=True)
+
+        self.client.force_login(self.user)
+        endpoint = reverse("api:selections-selected-count", args=[key])
+
+        response = self.client.get(endpoint)
+
+        self.assertEqual(response.json()["count"], 4)
+
+        with patch(
+            "openarchiefbeheer.selection.api.views.count_selected"
+        ) as m_count_selected:
+            response = self.client.get(endpoint)
+
+        m_count_selected.assert_not_called()
+        self.assertEqual(response.json()["count"], 4)
+
+        self.client.patch(
+            reverse("api:selections", args=[key]),
+            data={self.zaak1.url: {"selected": False}},
+            format="json",
+        )
+        response = self.client.get(endpoint)
+
+        self.assertEqual(response.json()["count"], 3)
+
+    def test_count_is_cached_per_zaken_version(self):
+        key = "some-key"
+        AllSelectedToggle.objects.create(key=key, all_selected=True)
+
+        self.client.force_login(self.user)
+        endpoint = reverse("api:selections-selected-count", args=[key])
+
+        response = self.client.get(endpoint)
+
+        self.assertEqual(response.json()["count"], 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            ZaakFactory.create()
+            bump_zaken_version()
+
+        response = self.client.get(endpoint)
+
+        self.assertEqual(response.json()["count"], 5)
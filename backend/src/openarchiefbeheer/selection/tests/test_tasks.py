@@ -0,0 +1,103 @@
+from django.test import TestCase, override_settings
+
+from freezegun import freeze_time
+
+from openarchiefbeheer.destruction.constants import ListStatus
+from openarchiefbeheer.destruction.tests.factories import DestructionListFactory
+from openarchiefbeheer.destruction.utils import get_selection_key_for_review
+
+from ..models import AllSelectedToggle, SelectionItem, SelectionKey
+from ..tasks import cleanup_expired_selections
+from ..utils import bump_selection_version, get_selection_version
+from .factories import SelectionItemFactory
+
+
+@override_settings(SELECTION_TTL=30, SELECTION_STALE_GRACE=3600)
+class CleanupExpiredSelectionsTests(TestCase):
+    def test_selection_of_list_is_linked(self):
+        destruction_list = DestructionListFactory.create(
+            status=ListStatus.ready_to_review
+        )
+        key = get_selection_key_for_review(destruction_list, "review")
+
+        bump_selection_version(key)
+
+        selection_key = SelectionKey.objects.get(key=key)
+        self.assertEqual(selection_key.destruction_list, destruction_list)
+        self.assertEqual(selection_key.status, ListStatus.ready_to_review)
+
+    def test_cleanup_selection_after_status_change(self):
+        destruction_list = DestructionListFactory.create(
+            status=ListStatus.ready_to_review
+        )
+        key = get_selection_key_for_review(destruction_list, "review")
+
+        with freeze_time("2024-10-01T10:00:00+02:00"):
+            SelectionItemFactory.create(key=key, is_selected=True)
+            version = bump_selection_version(key)
+
+        destruction_list.status = ListStatus.internally_reviewed
+        destruction_list.save()
+
+        # Still within the grace period
+        with freeze_time("2024-10-01T10:30:00+02:00"):
+            cleanup_expired_selections()
+
+        self.assertTrue(SelectionItem.objects.filter(key=key).exists())
+
+        with freeze_time("2024-10-01T11:30:00+02:00"):
+            cleanup_expired_selections()
+
+        self.assertFalse(SelectionItem.objects.filter(key=key).exists())
+        self.assertFalse(SelectionKey.objects.filter(key=key).exists())
+        # The version changed to avoid stale responses on conditional requests
+        self.assertGreater(get_selection_version(key), version)
+
+    def test_cleanup_selection_of_deleted_list(self):
+        destruction_list = DestructionListFactory.create(
+            status=ListStatus.ready_to_review
+        )
+        key = get_selection_key_for_review(destruction_list, "review")
+
+        with freeze_time("2024-10-01T10:00:00+02:00"):
+            SelectionItemFactory.create(key=key, is_selected=True)
+            AllSelectedToggle.objects.create(key=key, all_selected=True)
+            bump_selection_version(key)
+
+        destruction_list.delete()
+
+        with freeze_time("2024-10-02T10:00:00+02:00"):
+            cleanup_expired_selections()
+
+        self.assertFalse(SelectionItem.objects.filter(key=key).exists())
+        self.assertFalse(AllSelectedToggle.objects.filter(key=key).exists())
+
+    def test_cleanup_unmodified_selections(self):
+        with freeze_time("2024-10-01T10:00:00+02:00"):
+            SelectionItemFactory.create(key="old-selection", is_selected=True)
+            bump_selection_version("old-selection")
+
+        with freeze_time("2024-10-25T10:00:00+02:00"):
+            SelectionItemFactory.create(key="recent-selection", is_selected=True)
+            bump_selection_version("recent-selection")
+
+        with freeze_time("2024-11-01T10:00:00+02:00"):
+            cleanup_expired_selections()
+
+        self.assertFalse(SelectionItem.objects.filter(key="old-selection").exists())
+        self.assertTrue(SelectionItem.objects.filter(key="recent-selection").exists())
+
+    def test_selection_of_list_not_expired_while_list_has_status(self):
+        destruction_list = DestructionListFactory.create(
+            status=ListStatus.ready_to_review
+        )
+        key = get_selection_key_for_review(destruction_list, "review")
+
+        with freeze_time("2024-10-01T10:00:00+02:00"):
+            SelectionItemFactory.create(key=key, is_selected=True)
+            bump_selection_version(key)
+
+        with freeze_time("2024-12-01T10:00:00+02:00"):
+            cleanup_expired_selections()
+
+        self.assertTrue(SelectionItem.objects.filter(key=key).exists())
@@ -0,0 +1,45 @@
+from django.test import TestCase
+
+from openarchiefbeheer.zaken.models import Zaak
+from openarchiefbeheer.zaken.tests.factories import ZaakFactory
+
+from ..models import AllSelectedToggle
+from ..utils import bump_selection_version, count_selected, get_selection_version
+from .factories import SelectionItemFactory
+
+
+class SelectionVersionTests(TestCase):
+    def test_bump_version(self):
+        self.assertEqual(get_selection_version("some-key"), 0)
+
+        bump_selection_version("some-key")
+        version = bump_selection_version("some-key")
+
+        self.assertEqual(version, 2)
+        self.assertEqual(get_selection_version("some-key"), 2)
+        self.assertEqual(get_selection_version("other-key"), 0)
+
+
+class CountSelectedTests(TestCase):
+    def test_count_selected_single_query(self):
+        zaken = ZaakFactory.create_batch(3)
+        AllSelectedToggle.objects.create(key="some-key", all_selected=True)
+        SelectionItemFactory.create(
+            key="some-key", is_selected=False, zaak_url=zaken[0].url
+        )
+
+        with self.assertNumQueries(1):
+            count = count_selected("some-key", Zaak.objects.all())
+
+        self.assertEqual(count, 2)
+
+    def test_count_selected_without_toggle(self):
+        zaken = ZaakFactory.create_batch(3)
+        SelectionItemFactory.create(
+            key="some-key", is_selected=True, zaak_url=zaken[0].url
+        )
+        SelectionItemFactory.create(
+            key="some-key", is_selected=False, zaak_url=zaken[1].url
+        )
+
+        self.assertEqual(count_selected("some-key", Zaak.objects.all()), 1)
@@ -0,0 +1,143 @@
+import re
+from datetime import timedelta
+from typing import TYPE_CHECKING, Iterable
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q, QuerySet
+from django.utils import timezone
+
+from openarchiefbeheer.destruction.models import DestructionList
+
+from .models import (
+    AllSelectedToggle,
+    SelectionItem,
+    SelectionKey,
+    SelectionVersion,
+)
+
+if TYPE_CHECKING:
+    from openarchiefbeheer.zaken.models import Zaak
+
+
+def get_selection_version(key: str) -> int:
+    version = (
+        SelectionVersion.objects.filter(key=key)
+        .values_list("version", flat=True)
+        .first()
+    )
+    return version or 0
+
+
+def bump_selection_version(key: str) -> int:
+    """Mark the selection as modified and return its new version."""
+    with transaction.atomic():
+        register_selection_key(key)
+        SelectionVersion.objects.get_or_create(key=key)
+        SelectionVersion.objects.filter(key=key).update(version=F("version") + 1)
+        return get_selection_version(key)
+
+
+# Keys have the format "destruction-list-<context>-<uuid>-<status>"
+# (see also get_selection_key_for_review).
+DESTRUCTION_LIST_KEY_RE = re.compile(
+    r"^destruction-list-.+-"
+    r"(?P<uuid>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})-"
+    r"(?P<status>[a-z_]+)$"
+)
+
+
+def register_selection_key(key: str) -> None:
+    """Keep track of when a selection was last modified and to which list it belongs."""
+    destruction_list = None
+    status = ""
+    if match := DESTRUCTION_LIST_KEY_RE.match(key):
+        destruction_list = DestructionList.objects.filter(uuid=match["uuid"]).first()
+        status = match["status"]
+
+    SelectionKey.objects.update_or_create(
+        key=key,
+        defaults={"destruction_list": destruction_list, "status": status},
+    )
+
+
+def get_expired_selection_keys() -> QuerySet[SelectionKey]:
+    """Return the keys of the selections that are no longer needed.
+
+    A selection that doesn't belong to a destruction list is expired if it was not
+    modified within the ``SELECTION_TTL``. A selection of a destruction list is
+    expired if the list was deleted or no longer has the status for which the
+    selection was made. For the latter, a grace period is taken into account,
+    since selections can be prepared right before the status of the list changes
+    (see ``prepopulate_selection_after_review_response``).
+    """
+    now = timezone.now()
+    is_outdated = Q(
+        destruction_list__isnull=True,
+        status="",
+        last_modified__lt=now - timedelta(days=settings.SELECTION_TTL),
+    )
+    is_stale = ~Q(status="") & (
+        Q(destruction_list__isnull=True) | ~Q(destruction_list__status=F("status"))
+    )
+    is_out_of_grace = Q(
+        last_modified__lt=now - timedelta(seconds=settings.SELECTION_STALE_GRACE)
+    )
+
+    return SelectionKey.objects.filter(is_outdated | (is_stale & is_out_of_grace))
+
+
+def delete_selections(keys: Iterable[str]) -> None:
+    """Delete all the data of the selections with the given keys.
+
+    The version is bumped (and kept), so that clients that cached the selection
+    don't get a stale response.
+    """
+    keys = list(keys)
+    with transaction.atomic():
+        SelectionItem.objects.filter(key__in=keys).delete()
+        AllSelectedToggle.objects.filter(key__in=keys).delete()
+        SelectionKey.objects.filter(key__in=keys).delete()
+
+        SelectionVersion.objects.bulk_create(
+            [SelectionVersion(key=key) for key in keys], ignore_conflicts=True
+        )
+        SelectionVersion.objects.filter(key__in=keys).update(version=F("version") + 1)
+
+
+def _count_sql(queryset: QuerySet) -> tuple[str, tuple]:
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    return f"SELECT COUNT(*) FROM ({sql}) AS subquery", params
+
+
+def count_selected(key: str, zaken: QuerySet["Zaak"]) -> int:
+    """Count the selected items, taking into account the 'select all' toggle.
+
+    If all items are selected, the count is the number of zaken (normally the
+    zaken matching the filters on the page) minus the ones that were explicitly
+    deselected. Otherwise, it is the number of explicitly selected items.
+    The count is done with a single query.
+    """
+    toggle_sql, toggle_params = (
+        AllSelectedToggle.objects.filter(key=key, all_selected=True)
+        .values("pk")
+        .query.sql_with_params()
+    )
+    all_selected_sql, all_selected_params = _count_sql(
+        zaken.exclude(
+            url__in=SelectionItem.objects.filter(
+                key=key, selection_data__selected=False
+            ).values("zaak_url")
+        )
+    )
+    explicit_sql, explicit_params = _count_sql(
+        SelectionItem.objects.filter(key=key, selection_data__selected=True)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT CASE WHEN EXISTS ({toggle_sql}) "
+            f"THEN ({all_selected_sql}) ELSE ({explicit_sql}) END",
+            (*toggle_params, *all_selected_params, *explicit_params),
+        )
+        return cursor.fetchone()[0]
@@ -12,6 +12,7 @@ from maykin_2fa.urls import urlpatterns, webauthn_urlpatterns
 from mozilla_django_oidc_db.views import AdminLoginFailure
 
 from openarchiefbeheer.accounts.views.password_reset import PasswordResetView
+from openarchiefbeheer.utils.views import cache_metrics_admin, metrics
 
 # Configure admin
 
@@ -39,6 +40,11 @@ urlpatterns = [
     path("admin/", include((urlpatterns, "maykin_2fa"))),
     path("admin/", include((webauthn_urlpatterns, "two_factor"))),
     path("admin/hijack/", include("hijack.urls")),
+    path(
+        "admin/cache-metrics/",
+        admin.site.admin_view(cache_metrics_admin),
+        name="admin-cache-metrics",
+    ),
     path("admin/", admin.site.urls),
     path("admin/login/failure/", AdminLoginFailure.as_view(), name="admin-oidc-error"),
     path(
@@ -53,6 +59,7 @@ urlpatterns = [
     ),
     path("oidc/", include("mozilla_django_oidc.urls")),
     path("api/", include("openarchiefbeheer.api.urls", namespace="api")),
+    path("metrics", metrics, name="metrics"),
     # Simply show the master template.
     path("", TemplateView.as_view(template_name="master.html"), name="root"),
 ]
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class UtilsConfig(AppConfig):
@@ -7,3 +8,6 @@ class UtilsConfig(AppConfig):
     def ready(self):
         from . import checks  # noqa
         from .drf_spectacular import extensions  # noqa
+        from .tracing import install_query_tracing
+
+        connection_created.connect(install_query_tracing)
@@ -0,0 +1,134 @@
+"""Metrics of the cached functions (see ``openarchiefbeheer.clients``).
+
+The counters and the largest keys are aggregated in-process and periodically added
+to the shared cache, so that the metrics of all the web and Celery workers can be
+reported together.
+"""
+
+import threading
+import time
+from collections import Counter
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache as django_cache
+
+METRICS_KEY_PREFIX = "cache-metrics"
+TOP_KEYS_KEY = f"{METRICS_KEY_PREFIX}:top-keys"
+TOP_KEYS_SIZE = 50
+
+LOCAL_HITS = "local_hits"
+HITS = "hits"
+MISSES = "misses"
+MISS_MILLISECONDS = "miss_milliseconds"
+PAYLOAD_BYTES = "payload_bytes"
+COUNTERS = (LOCAL_HITS, HITS, MISSES, MISS_MILLISECONDS, PAYLOAD_BYTES)
+
+_functions: set[str] = set()
+_pending: Counter[tuple[str, str]] = Counter()
+_pending_top_keys: dict[str, dict] = {}
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def register_function(function: str) -> None:
+    _functions.add(function)
+
+
+def get_registered_functions() -> list[str]:
+    return sorted(_functions)
+
+
+def _get_key(function: str, counter: str) -> str:
+    return f"{METRICS_KEY_PREFIX}:{function}:{counter}"
+
+
+def _flush_if_due() -> None:
+    with _lock:
+        should_flush = (
+            time.monotonic() - _last_flush >= settings.CACHE_METRICS_FLUSH_INTERVAL
+        )
+
+    if should_flush:
+        flush()
+
+
+def record(function: str, counter: str, value: int = 1) -> None:
+    with _lock:
+        _pending[(function, counter)] += value
+
+    _flush_if_due()
+
+
+def record_miss(
+    function: str, arguments: Iterable[str], key: str, duration: float, size: int
+) -> None:
+    with _lock:
+        _pending[(function, MISSES)] += 1
+        _pending[(function, MISS_MILLISECONDS)] += round(duration * 1000)
+        _pending[(function, PAYLOAD_BYTES)] += size
+
+        _pending_top_keys[key] = {
+            "function": function,
+            "arguments": list(arguments),
+            "size": size,
+        }
+        # Trimmed in batches, to not sort the keys on every miss
+        if len(_pending_top_keys) > 2 * TOP_KEYS_SIZE:
+            largest = _get_largest(_pending_top_keys)
+            _pending_top_keys.clear()
+            _pending_top_keys.update(largest)
+
+    _flush_if_due()
+
+
+def _get_largest(top_keys: dict[str, dict]) -> dict[str, dict]:
+    """Only keep track of the largest keys."""
+    largest = sorted(top_keys.items(), key=lambda item: item[1]["size"], reverse=True)
+    return dict(largest[:TOP_KEYS_SIZE])
+
+
+def flush() -> None:
+    """Add the counters of this process to the shared cache."""
+    global _last_flush
+
+    with _lock:
+        pending = _pending.copy()
+        pending_top_keys = _pending_top_keys.copy()
+        _pending.clear()
+        _pending_top_keys.clear()
+        _last_flush = time.monotonic()
+
+    for (function, counter), value in pending.items():
+        key = _get_key(function, counter)
+        django_cache.add(key, 0, timeout=None)
+        try:
+            django_cache.incr(key, value)
+        except ValueError:
+            # The key was evicted in the meantime
+            django_cache.set(key, value, timeout=None)
+
+    if pending_top_keys:
+        top_keys: dict[str, dict] = django_cache.get(TOP_KEYS_KEY) or {}
+        top_keys.update(pending_top_keys)
+        django_cache.set(TOP_KEYS_KEY, _get_largest(top_keys), timeout=None)
+
+
+def get_counters() -> dict[str, dict[str, int]]:
+    """Return the counters of all the registered functions."""
+    keys = {
+        _get_key(function, counter): (function, counter)
+        for function in get_registered_functions()
+        for counter in COUNTERS
+    }
+    values = django_cache.get_many(keys.keys())
+
+    counters = {}
+    for key, (function, counter) in keys.items():
+        counters.setdefault(function, {})[counter] = values.get(key, 0)
+    return counters
+
+
+def get_top_keys() -> list[dict]:
+    top_keys: dict[str, dict] = django_cache.get(TOP_KEYS_KEY) or {}
+    return [{"key": key, **data} for key, data in top_keys.items()]
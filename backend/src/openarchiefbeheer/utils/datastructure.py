@@ -6,3 +6,25 @@ from django.core.serializers.json import DjangoJSONEncoder
 class HashableDict(dict):
     def __hash__(self):
         return hash(json.dumps(self, cls=DjangoJSONEncoder, sort_keys=True))
+
+
+class PrefixTrie[T]:
+    """Map string prefixes to values, with a lookup of the longest matching prefix."""
+
+    def __init__(self) -> None:
+        self._root: dict = {}
+
+    def insert(self, prefix: str, value: T) -> None:
+        node = self._root
+        for character in prefix:
+            node = node.setdefault(character, {})
+        node[None] = value
+
+    def longest_prefix(self, key: str) -> T | None:
+        node = self._root
+        match = node.get(None)
+        for character in key:
+            if (node := node.get(character)) is None:
+                break
+            match = node.get(None, match)
+        return match
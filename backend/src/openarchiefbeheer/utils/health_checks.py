@@ -20,6 +20,8 @@ class CheckResult(Struct):
     success: bool
     message: str
     extra: list[ExtraInfo] | UnsetType = UNSET
+    duration: int | UnsetType = UNSET
+    """Time (in milliseconds) it took to run the check."""
 
     def to_builtins(self) -> JSONValue:
         return to_builtins(self)
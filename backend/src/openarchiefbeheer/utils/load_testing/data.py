@@ -0,0 +1,345 @@
+"""Deterministic synthetic data for load testing and benchmarks.
+
+The data is inserted with ``bulk_create`` in batches instead of with the factories
+of the tests, so that millions of zaken can be seeded in a reasonable time. The
+same number always results in the same zaak, so that the data in the database
+matches the data served by the fake APIs (see :mod:`.fake_apis`) and the results
+of different runs can be compared.
+"""
+
+import datetime
+import uuid
+from itertools import batched, cycle
+
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from openarchiefbeheer.accounts.models import User
+from openarchiefbeheer.destruction.constants import (
+    DestructionListItemAction,
+    ListItemStatus,
+    ListStatus,
+    ResourceDestructionResultStatus,
+    ReviewDecisionChoices,
+)
+from openarchiefbeheer.destruction.models import (
+    DestructionList,
+    DestructionListItem,
+    DestructionListItemReview,
+    DestructionListReview,
+    ResourceDestructionResult,
+    ReviewItemResponse,
+    ReviewResponse,
+)
+from openarchiefbeheer.logging import logevent
+from openarchiefbeheer.selection.models import SelectionItem
+from openarchiefbeheer.zaken.models import Zaak
+
+DEFAULT_BASE_URL = "http://localhost:8010"
+LIST_NAME_PREFIX = "Load testing list"
+
+ZAAKTYPEN_COUNT = 50
+BATCH_SIZE = 5000
+
+
+def get_uuid(number: int) -> uuid.UUID:
+    return uuid.UUID(int=number + 1)
+
+
+def _get_dates(number: int) -> tuple[datetime.date, datetime.date, datetime.date]:
+    startdatum = datetime.date(2000, 1, 1) + datetime.timedelta(days=number % 7000)
+    einddatum = startdatum + datetime.timedelta(days=365)
+    archiefactiedatum = einddatum + datetime.timedelta(days=365)
+    return startdatum, einddatum, archiefactiedatum
+
+
+class SyntheticData:
+    """The resources of the ZGW APIs and of the Selectielijst API.
+
+    All the APIs are served from the same ``base_url``, under the same paths as
+    in Open Zaak.
+    """
+
+    def __init__(self, base_url: str = DEFAULT_BASE_URL):
+        base_url = base_url.rstrip("/")
+        self.zaken_api_root = f"{base_url}/zaken/api/v1/"
+        self.catalogi_api_root = f"{base_url}/catalogi/api/v1/"
+        self.besluiten_api_root = f"{base_url}/besluiten/api/v1/"
+        self.documenten_api_root = f"{base_url}/documenten/api/v1/"
+        self.selectielijst_api_root = f"{base_url}/selectielijst/api/v1/"
+
+    def get_zaak_url(self, number: int) -> str:
+        return f"{self.zaken_api_root}zaken/{get_uuid(number)}"
+
+    def get_procestype(self, number: int) -> dict:
+        return {
+            "url": f"{self.selectielijst_api_root}procestypen/{get_uuid(number)}",
+            "nummer": number % 10 + 1,
+            "naam": f"Procestype {number}",
+            "omschrijving": f"Procestype {number}",
+            "jaar": 2020,
+        }
+
+    def get_selectielijst_resultaat(self, number: int) -> dict:
+        procestype = self.get_procestype(number)
+        return {
+            "url": f"{self.selectielijst_api_root}resultaten/{get_uuid(number)}",
+            "procesType": procestype["url"],
+            "nummer": 1,
+            "volledigNummer": f"{procestype['nummer']}.1",
+            "naam": f"Resultaat {number}",
+            "omschrijving": f"Resultaat {number}",
+            "waardering": "vernietigen",
+            "bewaartermijn": f"P{number % 20 + 1}Y",
+        }
+
+    def get_zaaktype(self, number: int) -> dict:
+        return {
+            "url": f"{self.catalogi_api_root}zaaktypen/{get_uuid(number)}",
+            "omschrijving": f"Zaaktype {number}",
+            "identificatie": f"ZAAKTYPE-{number}",
+            "versiedatum": "2024-01-01",
+            "selectielijstProcestype": self.get_procestype(number)["url"],
+        }
+
+    def get_zaak_expand(self, number: int) -> dict:
+        zaaktype_number = number % ZAAKTYPEN_COUNT
+        zaaktype = self.get_zaaktype(zaaktype_number)
+        resultaattype_url = (
+            f"{self.catalogi_api_root}resultaattypen/{get_uuid(zaaktype_number)}"
+        )
+        return {
+            "zaaktype": {
+                "url": zaaktype["url"],
+                "selectielijst_procestype": self.get_procestype(zaaktype_number),
+                "omschrijving": zaaktype["omschrijving"],
+                "identificatie": zaaktype["identificatie"],
+                "versiedatum": zaaktype["versiedatum"],
+            },
+            "resultaat": {
+                "url": f"{self.zaken_api_root}resultaten/{get_uuid(number)}",
+                "resultaattype": resultaattype_url,
+                "_expand": {
+                    "resultaattype": {
+                        "url": resultaattype_url,
+                        "archiefactietermijn": f"P{zaaktype_number % 20 + 1}Y",
+                        "omschrijving": f"Resultaattype {zaaktype_number}",
+                        "selectielijstklasse": self.get_selectielijst_resultaat(
+                            zaaktype_number
+                        )["url"],
+                    }
+                },
+            },
+        }
+
+    def get_zaak_data(self, number: int) -> dict:
+        """Return the zaak as it is returned by the Zaken API (with the expansions)."""
+        startdatum, einddatum, archiefactiedatum = _get_dates(number)
+        expand = self.get_zaak_expand(number)
+        return {
+            "url": self.get_zaak_url(number),
+            "uuid": str(get_uuid(number)),
+            "identificatie": f"ZAAK-{number}",
+            "omschrijving": f"Zaak {number}",
+            "bronorganisatie": "000000000",
+            "verantwoordelijkeOrganisatie": "000000000",
+            "zaaktype": expand["zaaktype"]["url"],
+            "resultaat": expand["resultaat"]["url"],
+            "startdatum": startdatum.isoformat(),
+            "einddatum": einddatum.isoformat(),
+            "archiefnominatie": "vernietigen",
+            "archiefactiedatum": archiefactiedatum.isoformat(),
+            "_expand": expand,
+        }
+
+    def build_zaak(self, number: int) -> Zaak:
+        startdatum, einddatum, archiefactiedatum = _get_dates(number)
+        expand = self.get_zaak_expand(number)
+        return Zaak(
+            url=self.get_zaak_url(number),
+            uuid=get_uuid(number),
+            identificatie=f"ZAAK-{number}",
+            omschrijving=f"Zaak {number}",
+            bronorganisatie="000000000",
+            verantwoordelijke_organisatie="000000000",
+            zaaktype=expand["zaaktype"]["url"],
+            resultaat=expand["resultaat"]["url"],
+            startdatum=startdatum,
+            einddatum=einddatum,
+            archiefnominatie="vernietigen",
+            archiefactiedatum=archiefactiedatum,
+            _expand=expand,
+            # The zaken don't have related objects, so no requests are needed to
+            # retrieve them.
+            supported_zaakobjecten=[],
+        )
+
+
+def get_zaak_metadata(zaak: Zaak) -> dict:
+    """Return the metadata stored for a deleted zaak.
+
+    The metadata is normally built from the API data at the moment of deletion, see
+    :func:`openarchiefbeheer.zaken.utils.get_zaak_metadata`.
+    """
+    zaaktype = zaak._expand["zaaktype"]
+    resultaattype = zaak._expand["resultaat"]["_expand"]["resultaattype"]
+    return {
+        "url": zaak.url,
+        "identificatie": zaak.identificatie,
+        "startdatum": zaak.startdatum.isoformat(),
+        "einddatum": zaak.einddatum.isoformat(),
+        "omschrijving": zaak.omschrijving,
+        "bronapplicatie": "Open Zaak",
+        "selectielijstklasse": resultaattype["selectielijstklasse"],
+        "selectielijstklasse_versie": "2020",
+        "zaaktype": {
+            "url": zaaktype["url"],
+            "uuid": zaaktype["url"].rsplit("/", 1)[-1],
+            "omschrijving": zaaktype["omschrijving"],
+            "identificatie": zaaktype["identificatie"],
+        },
+        "resultaat": {
+            "resultaattype": {"omschrijving": resultaattype["omschrijving"]},
+        },
+    }
+
+
+def seed_zaken(data: SyntheticData, count: int, start: int = 0) -> None:
+    for numbers in batched(range(start, start + count), BATCH_SIZE):
+        with transaction.atomic():
+            Zaak.objects.bulk_create([data.build_zaak(number) for number in numbers])
+
+
+def seed_destruction_list(
+    name: str,
+    author: User,
+    zaken: QuerySet[Zaak],
+    status: str = ListStatus.new,
+) -> DestructionList:
+    destruction_list = DestructionList.objects.create(
+        name=name, author=author, assignee=author, status=status
+    )
+    for batch in batched(zaken.only("pk", "url").iterator(BATCH_SIZE), BATCH_SIZE):
+        DestructionListItem.objects.bulk_create(
+            DestructionListItem(
+                destruction_list=destruction_list,
+                zaak=zaak,
+                _zaak_url=zaak.url,
+                status=ListItemStatus.suggested,
+            )
+            for zaak in batch
+        )
+    destruction_list.refresh_summary()
+    return destruction_list
+
+
+def seed_review_response(
+    destruction_list: DestructionList, reviewer: User
+) -> QuerySet[ReviewItemResponse]:
+    """Reject all the items of the list and respond by removing them from the list."""
+    review = DestructionListReview.objects.create(
+        destruction_list=destruction_list,
+        author=reviewer,
+        decision=ReviewDecisionChoices.rejected,
+    )
+    ReviewResponse.objects.create(review=review, comment="Removed the zaken.")
+
+    items = destruction_list.items.order_by("pk")
+    for batch in batched(items.iterator(BATCH_SIZE), BATCH_SIZE):
+        review_items = DestructionListItemReview.objects.bulk_create(
+            DestructionListItemReview(
+                destruction_list=destruction_list,
+                destruction_list_item=item,
+                review=review,
+                feedback="Keep this zaak longer.",
+            )
+            for item in batch
+        )
+        ReviewItemResponse.objects.bulk_create(
+            ReviewItemResponse(
+                review_item=review_item,
+                action_item=DestructionListItemAction.remove,
+                action_zaak={"archiefactiedatum": "2050-01-01"},
+                comment="Extended the archiefactiedatum.",
+            )
+            for review_item in review_items
+        )
+
+    return ReviewItemResponse.objects.filter(review_item__review=review)
+
+
+def seed_destruction_results(destruction_list: DestructionList, user: User) -> None:
+    """Mark the list as deleted, as if all its zaken were destroyed."""
+    items = destruction_list.items.select_related("zaak").order_by("pk")
+    for batch in batched(items.iterator(BATCH_SIZE), BATCH_SIZE):
+        ResourceDestructionResult.objects.bulk_create(
+            ResourceDestructionResult(
+                item=item,
+                url=item.zaak.url,
+                resource_type="zaken",
+                status=ResourceDestructionResultStatus.deleted,
+                metadata=get_zaak_metadata(item.zaak),
+            )
+            for item in batch
+        )
+
+    destruction_list.status = ListStatus.deleted
+    destruction_list.end = timezone.now()
+    destruction_list.save(update_fields=["status", "end"])
+    logevent.destruction_list_deletion_triggered(destruction_list, user)
+
+
+def seed_selection(key: str, zaken: QuerySet[Zaak]) -> None:
+    """Select every other zaak and explicitly deselect the others."""
+    urls = zaken.order_by("pk").values_list("url", flat=True)
+    for batch in batched(enumerate(urls.iterator(BATCH_SIZE)), BATCH_SIZE):
+        SelectionItem.objects.bulk_create(
+            SelectionItem(
+                key=key,
+                zaak_url=url,
+                selection_data={"selected": index % 2 == 0},
+            )
+            for index, url in batch
+        )
+
+
+LIST_STATUSES = (
+    ListStatus.new,
+    ListStatus.ready_to_review,
+    ListStatus.changes_requested,
+    ListStatus.ready_to_delete,
+    ListStatus.deleted,
+)
+
+
+def seed_destruction_lists(
+    author: User, zaken: QuerySet[Zaak], count: int, size: int
+) -> list[DestructionList]:
+    """Create lists with consecutive zaken, in each of the stages of the process.
+
+    The lists in the ``changes_requested`` status have a review in which all the
+    items are rejected and a response of the author, the deleted lists have the
+    results of the destruction.
+    """
+    zaken = zaken.order_by("pk")
+    destruction_lists = []
+    for index, status in zip(range(count), cycle(LIST_STATUSES)):
+        with transaction.atomic():
+            destruction_list = seed_destruction_list(
+                f"{LIST_NAME_PREFIX} {index}",
+                author,
+                zaken[index * size : (index + 1) * size],
+                status=status,
+            )
+            if status == ListStatus.changes_requested:
+                seed_review_response(destruction_list, author)
+            elif status == ListStatus.deleted:
+                seed_destruction_results(destruction_list, author)
+
+            seed_selection(
+                f"destruction-list-detail-{destruction_list.uuid}-{status}",
+                Zaak.objects.filter(items__destruction_list=destruction_list),
+            )
+        destruction_lists.append(destruction_list)
+    return destruction_lists
@@ -0,0 +1,184 @@
+"""Fake ZGW APIs and Selectielijst API, serving the synthetic data.
+
+Only the endpoints used by the synchronisation of the zaken, the processing of
+reviews and the destruction of lists are implemented. The filters are ignored:
+listing the zaken always returns all the zaken. The zaken don't have related
+resources (zaakobjecten, besluiten, documenten), and writes are accepted but not
+stored.
+"""
+
+import json
+import re
+import time
+import uuid
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from furl import furl
+
+from openarchiefbeheer.types import JSONValue
+
+from .data import ZAAKTYPEN_COUNT, SyntheticData
+
+UUID_PATTERN = r"(?P<resource_uuid>[0-9a-f-]{36})"
+
+type Response = tuple[int, JSONValue | None]
+
+
+class FakeZGWAPIs:
+    page_size = 100
+
+    def __init__(self, data: SyntheticData, zaken_count: int):
+        self.data = data
+        self.zaken_count = zaken_count
+        self.base_path = furl(data.zaken_api_root).path.segments[:-4]
+        routes = [
+            ("GET", r"zaken/api/v1/zaken", self.list_zaken),
+            ("GET", rf"zaken/api/v1/zaken/{UUID_PATTERN}", self.retrieve_zaak),
+            ("PATCH", rf"zaken/api/v1/zaken/{UUID_PATTERN}", self.update_zaak),
+            ("GET", r"zaken/api/v1/zaakobjecten", self.empty_page),
+            ("GET", r"zaken/api/v1/zaakinformatieobjecten", self.empty_list),
+            ("GET", r"besluiten/api/v1/besluiten", self.empty_page),
+            ("GET", r"besluiten/api/v1/besluitinformatieobjecten", self.empty_list),
+            ("GET", r"catalogi/api/v1/zaaktypen", self.list_zaaktypen),
+            ("GET", r"selectielijst/api/v1/procestypen", self.list_procestypen),
+            ("GET", r"selectielijst/api/v1/resultaten", self.list_resultaten),
+            (
+                "GET",
+                rf"selectielijst/api/v1/resultaten/{UUID_PATTERN}",
+                self.retrieve_resultaat,
+            ),
+            ("POST", r"(?P<api>\w+)/api/v1/(?P<resource>\w+)", self.create),
+            ("DELETE", rf"\w+/api/v1/\w+/{UUID_PATTERN}", self.delete),
+        ]
+        self.routes = [
+            (method, re.compile(rf"{pattern}/?"), view)
+            for method, pattern, view in routes
+        ]
+
+    def handle(self, method: str, url: str, body: JSONValue | None = None) -> Response:
+        parsed_url = furl(url)
+        path = "/".join(parsed_url.path.segments[len(self.base_path) :])
+        for route_method, pattern, view in self.routes:
+            if method == route_method and (match := pattern.fullmatch(path)):
+                return view(parsed_url, body, **match.groupdict())
+
+        return HTTPStatus.NOT_FOUND, {"detail": "Not found."}
+
+    def _get_page_url(self, url: furl, page: int) -> str:
+        page_url = url.copy()
+        page_url.args["page"] = page
+        return page_url.url
+
+    def _paginate(self, url: furl, count: int, get_item: Callable) -> Response:
+        page = int(url.args.get("page", 1))
+        start = (page - 1) * self.page_size
+        end = min(start + self.page_size, count)
+        return HTTPStatus.OK, {
+            "count": count,
+            "previous": self._get_page_url(url, page - 1) if page > 1 else None,
+            "next": self._get_page_url(url, page + 1) if end < count else None,
+            "results": [get_item(number) for number in range(start, end)],
+        }
+
+    def _get_number(self, resource_uuid: str) -> int:
+        return uuid.UUID(resource_uuid).int - 1
+
+    def list_zaken(self, url: furl, body) -> Response:
+        return self._paginate(url, self.zaken_count, self.data.get_zaak_data)
+
+    def retrieve_zaak(self, url: furl, body, resource_uuid: str) -> Response:
+        number = self._get_number(resource_uuid)
+        if not 0 <= number < self.zaken_count:
+            return HTTPStatus.NOT_FOUND, {"detail": "Not found."}
+        return HTTPStatus.OK, self.data.get_zaak_data(number)
+
+    def update_zaak(self, url: furl, body, resource_uuid: str) -> Response:
+        status, zaak = self.retrieve_zaak(url, body, resource_uuid)
+        if status == HTTPStatus.OK:
+            zaak.update(body or {})
+        return status, zaak
+
+    def list_zaaktypen(self, url: furl, body) -> Response:
+        return self._paginate(url, ZAAKTYPEN_COUNT, self.data.get_zaaktype)
+
+    def list_procestypen(self, url: furl, body) -> Response:
+        # Not paginated in the Selectielijst API
+        return HTTPStatus.OK, [
+            self.data.get_procestype(number) for number in range(ZAAKTYPEN_COUNT)
+        ]
+
+    def list_resultaten(self, url: furl, body) -> Response:
+        return self._paginate(
+            url, ZAAKTYPEN_COUNT, self.data.get_selectielijst_resultaat
+        )
+
+    def retrieve_resultaat(self, url: furl, body, resource_uuid: str) -> Response:
+        return HTTPStatus.OK, self.data.get_selectielijst_resultaat(
+            self._get_number(resource_uuid)
+        )
+
+    def empty_page(self, url: furl, body) -> Response:
+        return HTTPStatus.OK, {
+            "count": 0,
+            "next": None,
+            "previous": None,
+            "results": [],
+        }
+
+    def empty_list(self, url: furl, body) -> Response:
+        return HTTPStatus.OK, []
+
+    def create(self, url: furl, body, api: str, resource: str) -> Response:
+        resource_url = url.copy().remove(args=True).add(path=str(uuid.uuid4())).url
+        return HTTPStatus.CREATED, {**(body or {}), "url": resource_url}
+
+    def delete(self, url: furl, body, resource_uuid: str) -> Response:
+        return HTTPStatus.NO_CONTENT, None
+
+
+def run_server(apis: FakeZGWAPIs, host: str, port: int, latency: float = 0) -> None:
+    """Serve the fake APIs until interrupted.
+
+    The ``latency`` (in seconds) is added to every response, to simulate the
+    network and the processing time of the real APIs.
+    """
+
+    class RequestHandler(BaseHTTPRequestHandler):
+        def _respond(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+            url = f"http://{self.headers.get('Host', host)}{self.path}"
+
+            status, data = apis.handle(self.command, url, body)
+            if latency:
+                time.sleep(latency)
+
+            content = json.dumps(data).encode() if data is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def do_GET(self):  # noqa: N802
+            self._respond()
+
+        def do_POST(self):  # noqa: N802
+            self._respond()
+
+        def do_PATCH(self):  # noqa: N802
+            self._respond()
+
+        def do_DELETE(self):  # noqa: N802
+            self._respond()
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), RequestHandler)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
@@ -0,0 +1,159 @@
+import time
+
+from django.core.management import BaseCommand, CommandError, CommandParser
+from django.db import transaction
+
+from zgw_consumers.constants import APITypes, AuthTypes
+from zgw_consumers.models import Service
+
+from openarchiefbeheer.accounts.models import User
+from openarchiefbeheer.config.models import APIConfig
+from openarchiefbeheer.destruction.models import DestructionList
+from openarchiefbeheer.selection.models import SelectionItem
+from openarchiefbeheer.zaken.models import Zaak
+
+from ...load_testing.data import (
+    DEFAULT_BASE_URL,
+    LIST_NAME_PREFIX,
+    SyntheticData,
+    seed_destruction_lists,
+    seed_zaken,
+)
+
+
+class Command(BaseCommand):
+    """Generate synthetic data in bulk, to load test OAB.
+
+    This command is for development purposes only. The zaken are the same as the
+    ones served by the fake APIs (see the ``run_fake_zgw_apis`` command), so that
+    the synchronisation and the destruction can be load tested without Open Zaak.
+
+    The following resources are created:
+
+    * Zaken, with the expanded zaaktype and resultaat.
+    * Destruction lists with consecutive zaken, in the different stages of the
+      process. Each list has a selection in which half of the zaken are selected.
+      The lists with requested changes have a review and a response of the author,
+      the deleted lists have the results of the destruction.
+    """
+
+    help = "Generate synthetic zaken, destruction lists, reviews and selections in bulk for load testing."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+
+        parser.add_argument(
+            "--zaken",
+            help="Number of zaken to create. Defaults to 100000.",
+            default=100_000,
+            type=int,
+        )
+        parser.add_argument(
+            "--lists",
+            help="Number of destruction lists to create. Defaults to 10.",
+            default=10,
+            type=int,
+        )
+        parser.add_argument(
+            "--list-size",
+            help="Number of zaken on each destruction list. Defaults to 1000.",
+            default=1000,
+            type=int,
+        )
+        parser.add_argument(
+            "--base-url",
+            help=f"Base URL of the fake APIs. Defaults to {DEFAULT_BASE_URL}.",
+            default=DEFAULT_BASE_URL,
+        )
+        parser.add_argument(
+            "--configure-services",
+            action="store_true",
+            help="Create the services for the fake APIs and configure the Selectielijst API.",
+        )
+        parser.add_argument(
+            "--flush",
+            action="store_true",
+            help="Delete the data generated previously with the same base URL.",
+        )
+
+    def _flush(self, data: SyntheticData) -> None:
+        self.stdout.write("Deleting the previously generated data...")
+
+        with transaction.atomic():
+            DestructionList.objects.filter(name__startswith=LIST_NAME_PREFIX).delete()
+            SelectionItem.objects.filter(
+                zaak_url__startswith=data.zaken_api_root
+            ).delete()
+            Zaak.objects.filter(url__startswith=data.zaken_api_root).delete()
+
+    def _configure_services(self, data: SyntheticData) -> None:
+        self.stdout.write("Creating/updating the services of the fake APIs...")
+
+        services = [
+            (APITypes.zrc, "Zaken API", data.zaken_api_root),
+            (APITypes.ztc, "Catalogi API", data.catalogi_api_root),
+            (APITypes.brc, "Besluiten API", data.besluiten_api_root),
+            (APITypes.drc, "Documenten API", data.documenten_api_root),
+            (APITypes.orc, "Selectielijst API", data.selectielijst_api_root),
+        ]
+        for api_type, label, api_root in services:
+            service, _ = Service.objects.update_or_create(
+                api_root=api_root,
+                defaults={
+                    "label": f"{label} (load testing)",
+                    "slug": f"load-testing-{label.split()[0].lower()}",
+                    "api_type": api_type,
+                    "auth_type": AuthTypes.no_auth,
+                },
+            )
+
+        api_config = APIConfig.get_solo()
+        api_config.selectielijst_api_service = service
+        api_config.save()
+
+    def handle(self, *args, **options):
+        data = SyntheticData(options["base_url"])
+        number_of_zaken = options["zaken"]
+        number_of_lists = options["lists"]
+        list_size = options["list_size"]
+
+        if number_of_lists * list_size > number_of_zaken:
+            raise CommandError(
+                "There are not enough zaken to create the destruction lists."
+            )
+
+        if options["flush"]:
+            self._flush(data)
+        elif Zaak.objects.filter(url__startswith=data.zaken_api_root).exists():
+            raise CommandError(
+                "Zaken were already generated with this base URL. "
+                "Use --flush to delete them first."
+            )
+
+        if options["configure_services"]:
+            self._configure_services(data)
+
+        start = time.monotonic()
+        self.stdout.write(f"Generating {number_of_zaken} zaken...")
+        seed_zaken(data, number_of_zaken)
+
+        self.stdout.write(f"Generating {number_of_lists} destruction lists...")
+        author, _ = User.objects.get_or_create(username="load-testing")
+        seed_destruction_lists(
+            author,
+            Zaak.objects.filter(url__startswith=data.zaken_api_root),
+            count=number_of_lists,
+            size=list_size,
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated the data in {time.monotonic() - start:.1f} seconds!"
+            )
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Run src/manage.py run_fake_zgw_apis --zaken {number_of_zaken} "
+                "to serve the zaken."
+            )
+        )
@@ -0,0 +1,54 @@
+from django.core.management import BaseCommand, CommandParser
+
+from furl import furl
+
+from ...load_testing.data import DEFAULT_BASE_URL, SyntheticData
+from ...load_testing.fake_apis import FakeZGWAPIs, run_server
+
+
+class Command(BaseCommand):
+    """Serve fake ZGW APIs and Selectielijst API for load testing.
+
+    This command is for development purposes only. The fake APIs serve the same
+    zaken as the ones generated with the ``generate_load_test_data`` command, so
+    that the synchronisation and the destruction of the zaken can be load tested
+    without Open Zaak.
+    """
+
+    help = "Serve fake ZGW APIs and Selectielijst API with synthetic zaken for load testing."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        super().add_arguments(parser)
+
+        parser.add_argument(
+            "--zaken",
+            help="Number of zaken in the Zaken API. Defaults to 100000.",
+            default=100_000,
+            type=int,
+        )
+        parser.add_argument(
+            "--base-url",
+            help=f"URL on which the APIs are served. Defaults to {DEFAULT_BASE_URL}.",
+            default=DEFAULT_BASE_URL,
+        )
+        parser.add_argument(
+            "--latency",
+            help="Latency in milliseconds added to every response. Defaults to 0.",
+            default=0,
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        base_url = furl(options["base_url"])
+        apis = FakeZGWAPIs(SyntheticData(options["base_url"]), options["zaken"])
+
+        self.stdout.write(
+            f"Serving the fake APIs with {options['zaken']} zaken on {base_url.url}. "
+            "Quit with CONTROL-C."
+        )
+        try:
+            run_server(
+                apis, base_url.host, base_url.port, latency=options["latency"] / 1000
+            )
+        except KeyboardInterrupt:
+            self.stdout.write("Stopped.")
@@ -1,4 +1,7 @@
-from rest_framework.pagination import PageNumberPagination as _PageNumberPagination
+from rest_framework.pagination import (
+    CursorPagination,
+    PageNumberPagination as _PageNumberPagination,
+)
 
 
 class PageNumberPagination(_PageNumberPagination):
@@ -18,3 +21,24 @@ class PageNumberPaginationWithPost(_PageNumberPagination):
         if page_number in self.last_page_strings:
             page_number = paginator.num_pages
         return page_number
+
+
+class OptionalCursorPagination(CursorPagination):
+    """Cursor pagination, only applied when a cursor or page size is requested.
+
+    Without these parameters the full (unpaginated) list is returned, as before.
+    The cursor is the position on the first field of the ordering, so this field
+    should be (nearly) unique.
+    """
+
+    page_size_query_param = "page_size"
+    page_size = 100
+    max_page_size = 1000
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        ):
+            return None
+        return super().paginate_queryset(queryset, request, view)
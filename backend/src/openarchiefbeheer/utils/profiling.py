@@ -0,0 +1,123 @@
+"""Profiling of the queries and of the requests to the external APIs made for a request.
+
+See :class:`openarchiefbeheer.middleware.ProfilingMiddleware`.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+from django.db import connections
+
+from ape_pie import APIClient
+from requests import Response
+
+from openarchiefbeheer.clients import response_hooks
+
+from .tracing import get_endpoint
+
+# Lists of placeholders, e.g. in `IN (%s, %s, %s)`, vary with the number of values
+PLACEHOLDERS_PATTERN = re.compile(r"%s(?:\s*,\s*%s)+")
+LITERALS_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+def get_query_fingerprint(sql: str) -> str:
+    """Return the query without the values, to group the same queries.
+
+    The values are normally passed as parameters, but some queries (e.g. with
+    ``RawSQL`` or from migrations) contain literals.
+    """
+    sql = LITERALS_PATTERN.sub("?", sql)
+    return PLACEHOLDERS_PATTERN.sub("%s, ...", sql)
+
+
+@dataclass
+class HTTPCall:
+    method: str
+    endpoint: str
+    status_code: int
+    duration: float
+
+
+@dataclass
+class RequestProfile:
+    start: float = field(default_factory=time.perf_counter)
+    end: float | None = None
+    query_count: int = 0
+    query_duration: float = 0
+    query_fingerprints: Counter[str] = field(default_factory=Counter)
+    http_calls: list[HTTPCall] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def http_duration(self) -> float:
+        return sum(call.duration for call in self.http_calls)
+
+    def get_duplicate_queries(self, threshold: int) -> list[tuple[str, int]]:
+        """Return the queries executed at least ``threshold`` times, e.g. N+1 queries."""
+        return [
+            (fingerprint, count)
+            for fingerprint, count in self.query_fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def record_query(
+        self, execute: Callable, sql: str, params, many: bool, context: dict
+    ):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_count += 1
+            self.query_duration += time.perf_counter() - start
+            self.query_fingerprints[get_query_fingerprint(sql)] += 1
+
+    def record_http_call(self, client: APIClient, response: Response, **kwargs) -> None:
+        # Requests to the external registers can be made from other threads
+        with self._lock:
+            self.http_calls.append(
+                HTTPCall(
+                    method=response.request.method,
+                    endpoint=get_endpoint(client.base_url, response.request.url),
+                    status_code=response.status_code,
+                    duration=response.elapsed.total_seconds(),
+                )
+            )
+
+    def get_server_timing(self) -> str:
+        """Return the value of the ``Server-Timing`` header."""
+        metrics = [
+            ("db", self.query_duration, f"{self.query_count} queries"),
+            ("http", self.http_duration, f"{len(self.http_calls)} API calls"),
+            ("total", self.duration, None),
+        ]
+        return ", ".join(
+            f"{name};dur={duration * 1000:.1f}" + (f';desc="{desc}"' if desc else "")
+            for name, duration, desc in metrics
+        )
+
+
+@contextmanager
+def profile_request() -> Iterator[RequestProfile]:
+    """Profile the queries and the requests to the external APIs in the context.
+
+    Only the queries made from the current thread are recorded, and only the
+    requests made with the clients built in the context.
+    """
+    profile = RequestProfile()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(profile.record_query))
+        stack.enter_context(response_hooks(profile.record_http_call))
+        try:
+            yield profile
+        finally:
+            profile.end = time.perf_counter()
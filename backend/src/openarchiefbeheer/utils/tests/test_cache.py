@@ -0,0 +1,151 @@
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from openarchiefbeheer.accounts.tests.factories import UserFactory
+from openarchiefbeheer.clients import _cached, _cached_with_args, local_cache_scope
+
+from .. import cache_metrics
+from .mixins import ClearCacheMixin
+
+
+class CachedFunctionTests(ClearCacheMixin, TestCase):
+    def test_local_cache_avoids_shared_cache(self):
+        compute = MagicMock(return_value=[{"url": "http://example.com"}])
+        compute.__qualname__ = "compute"
+        cached_function = _cached_with_args(compute)
+
+        with (
+            patch("openarchiefbeheer.clients.django_cache", wraps=cache) as m_cache,
+            local_cache_scope(),
+        ):
+            cached_function("http://example.com")
+            m_cache.reset_mock()
+
+            result = cached_function("http://example.com")
+
+        self.assertEqual(result, [{"url": "http://example.com"}])
+        m_cache.get.assert_not_called()
+        compute.assert_called_once_with("http://example.com")
+
+    def test_local_cache_returns_copies(self):
+        cached_function = _cached(lambda: {"key": "value"})
+
+        with local_cache_scope():
+            cached_function()["key"] = "modified"
+
+            self.assertEqual(cached_function(), {"key": "value"})
+
+    def test_clear_cache_clears_local_cache(self):
+        compute = MagicMock(return_value="value")
+        compute.__qualname__ = "compute"
+        cached_function = _cached(compute)
+
+        with local_cache_scope():
+            cached_function()
+            cached_function.clear_cache()
+            cached_function()
+
+        self.assertEqual(compute.call_count, 2)
+
+    def test_waits_for_value_computed_by_other_worker(self):
+        compute = MagicMock(return_value="computed here")
+        compute.__qualname__ = key = "compute"
+        cached_function = _cached(compute)
+        # Another worker holds the lock and stores the value while this one waits
+        cache.set(f"{key}:lock", True)
+
+        with patch(
+            "openarchiefbeheer.clients.time.sleep",
+            side_effect=lambda _: cache.set(key, "computed elsewhere"),
+        ):
+            result = cached_function()
+
+        self.assertEqual(result, "computed elsewhere")
+        compute.assert_not_called()
+
+    def test_timeout_per_function(self):
+        cached_function = _cached_with_args(timeout=10)(lambda arg: arg)
+
+        with patch("openarchiefbeheer.clients.django_cache", wraps=cache) as m_cache:
+            cached_function("value")
+
+        self.assertEqual(m_cache.set.call_args.args[2], 10)
+
+
+@override_settings(CACHE_METRICS_FLUSH_INTERVAL=0, METRICS_TOKEN="secret")
+class CacheMetricsTests(ClearCacheMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        cache_metrics._pending.clear()
+        cache_metrics._pending_top_keys.clear()
+
+    def test_counters(self):
+        def compute(arg):
+            return arg * 100
+
+        cached_function = _cached_with_args(compute)
+
+        with local_cache_scope():
+            cached_function("a")
+            cached_function("a")
+        cached_function("a")
+
+        counters = cache_metrics.get_counters()[compute.__qualname__]
+
+        self.assertEqual(counters["misses"], 1)
+        self.assertEqual(counters["local_hits"], 1)
+        self.assertEqual(counters["hits"], 1)
+        self.assertGreater(counters["payload_bytes"], 100)
+
+        top_keys = cache_metrics.get_top_keys()
+
+        self.assertEqual(top_keys[0]["arguments"], ["a"])
+
+    @override_settings(CACHE_METRICS_FLUSH_INTERVAL=3600)
+    def test_top_keys_added_on_flush(self):
+        cache_metrics.flush()
+
+        def compute(arg):
+            return arg * 100
+
+        cached_function = _cached_with_args(compute)
+        cached_function("a")
+        cached_function("bb")
+
+        self.assertEqual(cache_metrics.get_top_keys(), [])
+
+        cache_metrics.flush()
+        top_keys = cache_metrics.get_top_keys()
+
+        self.assertEqual([key["arguments"] for key in top_keys], [["bb"], ["a"]])
+
+    def test_metrics_endpoint(self):
+        def compute(arg):
+            return arg
+
+        _cached_with_args(compute)("a")
+
+        response = self.client.get(
+            reverse("metrics"), headers={"Authorization": "Bearer secret"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(
+            f'openarchiefbeheer_cache_requests_total{{function="{compute.__qualname__}",result="miss"}} 1',
+            response.content.decode(),
+        )
+
+    def test_metrics_endpoint_requires_token_or_staff(self):
+        response = self.client.get(
+            reverse("metrics"), headers={"Authorization": "Bearer wrong"}
+        )
+
+        self.assertEqual(response.status_code, 403)
+
+        self.client.force_login(UserFactory.create(is_staff=True))
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, 200)
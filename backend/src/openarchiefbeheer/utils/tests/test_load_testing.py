@@ -0,0 +1,129 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from openarchiefbeheer.destruction.constants import ListStatus
+from openarchiefbeheer.destruction.models import (
+    DestructionList,
+    ResourceDestructionResult,
+    ReviewItemResponse,
+)
+from openarchiefbeheer.selection.models import SelectionItem
+from openarchiefbeheer.zaken.models import Zaak
+
+from ..load_testing.data import SyntheticData, get_uuid
+from ..load_testing.fake_apis import FakeZGWAPIs
+
+
+class GenerateLoadTestDataTests(TestCase):
+    def test_generate_data(self):
+        call_command(
+            "generate_load_test_data",
+            zaken=30,
+            lists=5,
+            list_size=4,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(Zaak.objects.count(), 30)
+        self.assertEqual(
+            list(
+                DestructionList.objects.order_by("pk").values_list("status", flat=True)
+            ),
+            [
+                ListStatus.new,
+                ListStatus.ready_to_review,
+                ListStatus.changes_requested,
+                ListStatus.ready_to_delete,
+                ListStatus.deleted,
+            ],
+        )
+        for destruction_list in DestructionList.objects.all():
+            self.assertEqual(destruction_list.items.count(), 4)
+        self.assertEqual(ReviewItemResponse.objects.count(), 4)
+        self.assertEqual(ResourceDestructionResult.objects.count(), 4)
+        self.assertEqual(SelectionItem.objects.count(), 20)
+
+    def test_generate_data_twice(self):
+        call_command("generate_load_test_data", zaken=10, lists=1, list_size=2)
+
+        with self.assertRaises(CommandError):
+            call_command("generate_load_test_data", zaken=10, lists=1, list_size=2)
+
+        call_command(
+            "generate_load_test_data", zaken=10, lists=1, list_size=2, flush=True
+        )
+
+        self.assertEqual(Zaak.objects.count(), 10)
+        self.assertEqual(DestructionList.objects.count(), 1)
+
+
+class FakeZGWAPIsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.data = SyntheticData("http://localhost:8010")
+        self.apis = FakeZGWAPIs(self.data, zaken_count=150)
+
+    def test_list_zaken(self):
+        status, page = self.apis.handle(
+            "GET",
+            "http://localhost:8010/zaken/api/v1/zaken?archiefnominatie=vernietigen",
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(page["count"], 150)
+        self.assertEqual(len(page["results"]), 100)
+        self.assertEqual(page["results"][0], self.data.get_zaak_data(0))
+
+        status, page = self.apis.handle("GET", page["next"])
+
+        self.assertEqual(len(page["results"]), 50)
+        self.assertIn("archiefnominatie=vernietigen", page["previous"])
+        self.assertIsNone(page["next"])
+
+    def test_update_zaak(self):
+        status, zaak = self.apis.handle(
+            "PATCH",
+            self.data.get_zaak_url(3),
+            {"archiefactiedatum": "2050-01-01"},
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(zaak["archiefactiedatum"], "2050-01-01")
+        self.assertEqual(zaak["identificatie"], "ZAAK-3")
+
+    def test_unknown_zaak(self):
+        status, _ = self.apis.handle("GET", self.data.get_zaak_url(150))
+
+        self.assertEqual(status, 404)
+
+    def test_delete_and_create(self):
+        status, _ = self.apis.handle("DELETE", self.data.get_zaak_url(1))
+
+        self.assertEqual(status, 204)
+
+        status, resource = self.apis.handle(
+            "POST", f"{self.data.documenten_api_root}enkelvoudiginformatieobjecten", {}
+        )
+
+        self.assertEqual(status, 201)
+        self.assertTrue(
+            resource["url"].startswith(
+                f"{self.data.documenten_api_root}enkelvoudiginformatieobjecten/"
+            )
+        )
+
+    def test_selectielijst(self):
+        status, resultaat = self.apis.handle(
+            "GET", f"{self.data.selectielijst_api_root}resultaten/{get_uuid(2)}"
+        )
+
+        self.assertEqual(status, 200)
+        self.assertEqual(resultaat, self.data.get_selectielijst_resultaat(2))
+
+        status, procestypen = self.apis.handle(
+            "GET", f"{self.data.selectielijst_api_root}procestypen"
+        )
+
+        self.assertIn(resultaat["procesType"], [p["url"] for p in procestypen])
@@ -0,0 +1,107 @@
+from django.test import TestCase, override_settings
+
+from requests_mock import Mocker
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+from zgw_consumers.constants import APITypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openarchiefbeheer.accounts.tests.factories import UserFactory
+from openarchiefbeheer.clients import build_client
+from openarchiefbeheer.zaken.models import Zaak
+
+from ..profiling import get_query_fingerprint, profile_request
+
+
+class ProfileRequestTests(TestCase):
+    def test_get_query_fingerprint(self):
+        self.assertEqual(
+            get_query_fingerprint(
+                'SELECT "zaken_zaak"."id" FROM "zaken_zaak" '
+                'WHERE "zaken_zaak"."id" IN (%s, %s, %s) LIMIT 21'
+            ),
+            'SELECT "zaken_zaak"."id" FROM "zaken_zaak" '
+            'WHERE "zaken_zaak"."id" IN (%s, ...) LIMIT ?',
+        )
+        self.assertEqual(
+            get_query_fingerprint("SELECT * FROM t WHERE name = 'it''s' AND id = 1"),
+            "SELECT * FROM t WHERE name = ? AND id = ?",
+        )
+
+    def test_queries_recorded(self):
+        with profile_request() as profile:
+            for pk in range(3):
+                Zaak.objects.filter(pk=pk).exists()
+            Zaak.objects.count()
+
+        self.assertEqual(profile.query_count, 4)
+        self.assertGreater(profile.query_duration, 0)
+        duplicate_queries = profile.get_duplicate_queries(threshold=2)
+        self.assertEqual(len(duplicate_queries), 1)
+        self.assertEqual(duplicate_queries[0][1], 3)
+
+        # Not recorded outside of the context
+        Zaak.objects.count()
+        self.assertEqual(profile.query_count, 4)
+
+    @Mocker()
+    def test_http_calls_recorded(self, m):
+        service = ServiceFactory.create(
+            api_type=APITypes.zrc,
+            api_root="http://zaken-api.nl/zaken/api/v1/",
+        )
+        m.get(
+            "http://zaken-api.nl/zaken/api/v1/zaken/75f4c682-1e16-45ea-8f78-99b4474986ac",
+            status_code=404,
+        )
+
+        with profile_request() as profile, build_client(service) as client:
+            client.get("zaken/75f4c682-1e16-45ea-8f78-99b4474986ac")
+
+        self.assertEqual(len(profile.http_calls), 1)
+        self.assertEqual(profile.http_calls[0].method, "GET")
+        self.assertEqual(profile.http_calls[0].endpoint, "zaken/{uuid}")
+        self.assertEqual(profile.http_calls[0].status_code, 404)
+
+        self.assertIn("db;dur=", profile.get_server_timing())
+        self.assertIn("http;dur=", profile.get_server_timing())
+        self.assertIn('desc="1 API calls"', profile.get_server_timing())
+
+
+@override_settings(
+    PROFILING_ENABLED=True,
+    PROFILING_SLOW_REQUEST_THRESHOLD=60_000,
+    PROFILING_QUERY_COUNT_THRESHOLD=100,
+    PROFILING_DUPLICATE_QUERIES_THRESHOLD=10,
+)
+class ProfilingMiddlewareTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.client.force_login(UserFactory.create())
+
+    def test_server_timing_header_added(self):
+        with self.assertNoLogs("performance"):
+            response = self.client.get(reverse("api:whoami"))
+
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn("total;dur=", response["Server-Timing"])
+
+    def test_only_api_requests_profiled(self):
+        response = self.client.get(reverse("admin:login"))
+
+        self.assertNotIn("Server-Timing", response)
+
+    @override_settings(PROFILING_QUERY_COUNT_THRESHOLD=1)
+    def test_outliers_logged(self):
+        with self.assertLogs("performance", level="INFO") as logs:
+            self.client.get(reverse("api:whoami"))
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("GET /api/v1/whoami/ 200", logs.output[0])
+
+    @override_settings(PROFILING_ENABLED=False)
+    def test_disabled(self):
+        response = self.client.get(reverse("api:whoami"))
+
+        self.assertNotIn("Server-Timing", response)
@@ -0,0 +1,104 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode
+from requests_mock import Mocker
+from zgw_consumers.constants import APITypes
+from zgw_consumers.test.factories import ServiceFactory
+
+from openarchiefbeheer.clients import build_client
+from openarchiefbeheer.zaken.models import Zaak
+
+from ..profiling import profile_request
+from ..tracing import get_endpoint, install_query_tracing, trace_query
+
+
+class TracingTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        self.tracer = provider.get_tracer(__name__)
+
+        patcher = patch("openarchiefbeheer.utils.tracing.tracer", self.tracer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_endpoint(self):
+        base_url = "http://zaken-api.nl/zaken/api/v1/"
+
+        self.assertEqual(
+            get_endpoint(base_url, "zaken/75f4c682-1e16-45ea-8f78-99b4474986ac"),
+            "zaken/{uuid}",
+        )
+        self.assertEqual(
+            get_endpoint(base_url, "http://zaken-api.nl/zaken/api/v1/zaken?page=2"),
+            "zaken",
+        )
+
+    @Mocker()
+    def test_client_requests_traced(self, m):
+        service = ServiceFactory.create(
+            label="Open Zaak",
+            api_type=APITypes.zrc,
+            api_root="http://zaken-api.nl/zaken/api/v1/",
+        )
+        m.get(
+            "http://zaken-api.nl/zaken/api/v1/zaken/75f4c682-1e16-45ea-8f78-99b4474986ac",
+            json={},
+        )
+        m.delete(
+            "http://zaken-api.nl/zaken/api/v1/zaken/75f4c682-1e16-45ea-8f78-99b4474986ac",
+            status_code=400,
+        )
+
+        with build_client(service) as client:
+            client.get("zaken/75f4c682-1e16-45ea-8f78-99b4474986ac")
+            client.delete("zaken/75f4c682-1e16-45ea-8f78-99b4474986ac")
+
+        get_span, delete_span, session_span = self.exporter.get_finished_spans()
+
+        self.assertEqual(session_span.name, "Open Zaak session")
+        self.assertEqual(get_span.name, "GET zaken/{uuid}")
+        self.assertEqual(get_span.parent.span_id, session_span.context.span_id)
+        self.assertEqual(get_span.attributes["zgw.service.label"], "Open Zaak")
+        self.assertEqual(get_span.attributes["http.response.status_code"], 200)
+        self.assertEqual(delete_span.name, "DELETE zaken/{uuid}")
+        self.assertEqual(delete_span.status.status_code, StatusCode.ERROR)
+
+    def test_queries_traced_within_trace(self):
+        Zaak.objects.count()
+
+        self.assertEqual(len(self.exporter.get_finished_spans()), 0)
+
+        with self.tracer.start_as_current_span("request"):
+            Zaak.objects.count()
+
+        query_span, request_span = self.exporter.get_finished_spans()
+
+        self.assertEqual(query_span.name, "SELECT default")
+        self.assertEqual(query_span.parent.span_id, request_span.context.span_id)
+        self.assertIn("zaken_zaak", query_span.attributes["db.query.text"])
+
+    def test_query_tracing_kept_when_connection_created_in_wrapper(self):
+        connection.execute_wrappers.remove(trace_query)
+        self.addCleanup(install_query_tracing, sender=None, connection=connection)
+
+        with profile_request() as profile:
+            # As if the connection is opened during the request
+            install_query_tracing(sender=None, connection=connection)
+
+        self.assertEqual(connection.execute_wrappers, [trace_query])
+
+        Zaak.objects.count()
+
+        self.assertEqual(profile.query_count, 0)
@@ -0,0 +1,128 @@
+"""Tracing of the requests to the external APIs and of the database queries.
+
+The spans are created with the OpenTelemetry API, so they are exported with the
+rest of the telemetry (see the Open Telemetry configuration in the documentation).
+Without a configured SDK, for example with ``OTEL_SDK_DISABLED=true``, the spans
+are not recorded.
+"""
+
+import re
+from typing import Callable
+from urllib.parse import urljoin, urlsplit
+
+from ape_pie import APIClient
+from opentelemetry import trace
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+tracer = trace.get_tracer(__name__)
+
+UUID_PATTERN = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
+
+def get_endpoint(base_url: str, url: str) -> str:
+    """Return the path of the URL relative to the API root, e.g. ``zaken/{uuid}``.
+
+    The UUIDs are replaced, so that the requests to the same endpoint can be
+    grouped.
+    """
+    path = urlsplit(urljoin(base_url, url)).path
+    base_path = urlsplit(base_url).path
+    path = path.removeprefix(base_path)
+    return UUID_PATTERN.sub("{uuid}", path.strip("/"))
+
+
+class TracedAPIClient(APIClient):
+    """API client that traces its session and the requests made with it.
+
+    A span is created for each request, with the service, the endpoint and the
+    status of the response. When the client is used as a context manager, the spans
+    of the requests are grouped under a span for the session, also when the
+    requests are made from other threads.
+    """
+
+    service = None
+    _session_span = None
+
+    def _get_service_attributes(self) -> dict[str, str]:
+        if self.service is None:
+            return {"server.address": urlsplit(self.base_url).netloc}
+
+        return {
+            "server.address": urlsplit(self.base_url).netloc,
+            "zgw.service.label": self.service.label,
+            "zgw.service.slug": self.service.slug,
+            "zgw.service.api_type": self.service.api_type,
+        }
+
+    def __enter__(self):
+        label = self.service.label if self.service else self.base_url
+        self._session_span = tracer.start_span(
+            f"{label} session", attributes=self._get_service_attributes()
+        )
+        return super().__enter__()
+
+    def __exit__(self, *args):
+        try:
+            return super().__exit__(*args)
+        finally:
+            if self._session_span is not None:
+                self._session_span.end()
+                self._session_span = None
+
+    def request(self, method, url, *args, **kwargs):
+        endpoint = get_endpoint(self.base_url, url)
+        context = (
+            trace.set_span_in_context(self._session_span)
+            if self._session_span is not None
+            else None
+        )
+        with tracer.start_as_current_span(
+            f"{method} {endpoint}",
+            context=context,
+            kind=SpanKind.CLIENT,
+            attributes={
+                **self._get_service_attributes(),
+                "http.request.method": method,
+                "zgw.endpoint": endpoint,
+            },
+        ) as span:
+            response = super().request(method, url, *args, **kwargs)
+
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 400:
+                span.set_status(Status(StatusCode.ERROR))
+            return response
+
+
+def trace_query(execute: Callable, sql: str, params, many: bool, context: dict):
+    """Execute wrapper that creates a span for each database query.
+
+    The span is only created within a recorded trace (e.g. of a request or a task),
+    to avoid the overhead for queries that would not be exported anyway.
+    """
+    if not trace.get_current_span().is_recording():
+        return execute(sql, params, many, context)
+
+    connection = context["connection"]
+    operation = sql.split(maxsplit=1)[0].upper() if sql else ""
+    with tracer.start_as_current_span(
+        f"{operation} {connection.alias}",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": connection.vendor,
+            "db.namespace": connection.settings_dict["NAME"],
+            "db.operation.name": operation,
+            "db.query.text": sql,
+        },
+    ):
+        return execute(sql, params, many, context)
+
+
+def install_query_tracing(sender, connection, **kwargs) -> None:
+    # The connection can be created within a ``connection.execute_wrapper()`` block,
+    # which removes the last wrapper on exit. Insert the tracing first, so that it
+    # is not removed instead of the wrapper of the block.
+    if trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, trace_query)
@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.contrib import admin
+from django.http import HttpRequest, HttpResponse, HttpResponseForbidden
+from django.template.response import TemplateResponse
+from django.utils.crypto import constant_time_compare
+from django.utils.translation import gettext_lazy as _
+
+from . import cache_metrics
+
+METRICS = (
+    (
+        "openarchiefbeheer_cache_requests_total",
+        "Number of calls of a cached function, per result.",
+        {
+            "local_hit": cache_metrics.LOCAL_HITS,
+            "hit": cache_metrics.HITS,
+            "miss": cache_metrics.MISSES,
+        },
+    ),
+    (
+        "openarchiefbeheer_cache_miss_duration_seconds_total",
+        "Time spent computing the values missing from the cache.",
+        {"": cache_metrics.MISS_MILLISECONDS},
+    ),
+    (
+        "openarchiefbeheer_cache_payload_bytes_total",
+        "Size of the values computed on a cache miss.",
+        {"": cache_metrics.PAYLOAD_BYTES},
+    ),
+)
+
+
+def _format_metrics(counters: dict[str, dict[str, int]]) -> str:
+    lines = []
+    for name, help_text, results in METRICS:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+        for function, values in counters.items():
+            for result, counter in results.items():
+                labels = f'function="{function}"'
+                if result:
+                    labels += f',result="{result}"'
+
+                value = values[counter]
+                if counter == cache_metrics.MISS_MILLISECONDS:
+                    value = value / 1000
+                lines.append(f"{name}{{{labels}}} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics(request: HttpRequest) -> HttpResponse:
+    """Metrics of the cached functions, in the Prometheus text format.
+
+    Available to staff users and to scrapers sending the ``METRICS_TOKEN``.
+    """
+    token = settings.METRICS_TOKEN
+    has_token = token and constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    )
+    if not (has_token or request.user.is_staff):
+        return HttpResponseForbidden()
+
+    cache_metrics.flush()
+    return HttpResponse(
+        _format_metrics(cache_metrics.get_counters()),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def cache_metrics_admin(request: HttpRequest) -> TemplateResponse:
+    cache_metrics.flush()
+    return TemplateResponse(
+        request,
+        "admin/cache_metrics.html",
+        {
+            **admin.site.each_context(request),
+            "title": _("Cache statistics"),
+            "counters": cache_metrics.get_counters(),
+            "top_keys": cache_metrics.get_top_keys(),
+        },
+    )
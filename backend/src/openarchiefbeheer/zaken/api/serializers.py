@@ -9,6 +9,7 @@ from openarchiefbeheer.clients import get_service_from_url
 
 from ..models import Zaak
 from ..utils import (
+    bump_zaken_version,
     get_selectielijstklasse_choices_dict,
     get_selectielijstprocestypen_dict,
     get_selectielijstresultaten_dict,
@@ -18,6 +19,7 @@ from ..utils import (
 class ZaakListSerializer(serializers.ListSerializer):
     def create(self, validated_data):
         zaken_to_create = [Zaak(**item) for item in validated_data]
+        bump_zaken_version()
         return Zaak.objects.bulk_create(zaken_to_create)
 
 
@@ -75,6 +77,10 @@ class ZaakSerializer(serializers.ModelSerializer):
             "_expand",
         )
 
+    def update(self, instance, validated_data):
+        bump_zaken_version()
+        return super().update(instance, validated_data)
+
 
 class ChoiceSerializer(serializers.Serializer):
     label = serializers.CharField(help_text=_("The description field of the choice."))
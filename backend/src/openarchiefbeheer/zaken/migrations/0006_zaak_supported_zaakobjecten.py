@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-10-19 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zaken", "0005_alter_zaak_url"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zaak",
+            name="supported_zaakobjecten",
+            field=models.JSONField(
+                blank=True,
+                help_text="The zaakobjecten of the zaak that are supported by an external register plugin. Empty if the zaakobjecten have not been retrieved yet.",
+                null=True,
+                verbose_name="supported zaakobjecten",
+            ),
+        ),
+    ]
@@ -1,10 +1,7 @@
-from django.conf import settings
 from django.contrib.gis.db.models import GeometryField
 from django.contrib.postgres.fields import ArrayField
 from django.db import models
 
-from openarchiefbeheer.clients import zrc_client
-
 
 class Zaak(models.Model):
     uuid = models.UUIDField("UUID", unique=True)
@@ -99,6 +96,15 @@ class Zaak(models.Model):
         "verantwoordelijke organisatie", max_length=9
     )
     _expand = models.JSONField("expand", blank=True, null=True, default=dict)
+    supported_zaakobjecten = models.JSONField(
+        "supported zaakobjecten",
+        blank=True,
+        null=True,
+        help_text=(
+            "The zaakobjecten of the zaak that are supported by an external register "
+            "plugin. Empty if the zaakobjecten have not been retrieved yet."
+        ),
+    )
 
     class Meta:
         verbose_name = "Zaak"
@@ -106,23 +112,3 @@ class Zaak(models.Model):
 
     def __str__(self):
         return self.identificatie
-
-    def update_data(self, data: dict) -> None:
-        from .api.serializers import ZaakSerializer
-
-        with zrc_client() as client:
-            response = client.patch(
-                f"zaken/{self.uuid}",
-                headers={
-                    "Accept-Crs": "EPSG:4326",
-                    "Content-Crs": "EPSG:4326",
-                },
-                json=data,
-                timeout=settings.REQUESTS_DEFAULT_TIMEOUT,
-            )
-            response.raise_for_status()
-            updated_zaak = response.json()
-
-        serializer = ZaakSerializer(data=updated_zaak, partial=True, instance=self)
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
@@ -12,13 +12,20 @@ from requests.adapters import HTTPAdapter, Retry
 
 from openarchiefbeheer.celery import app
 from openarchiefbeheer.clients import selectielijst_client, zrc_client
-from openarchiefbeheer.destruction.utils import resync_items_and_zaken
+from openarchiefbeheer.destruction.utils import (
+    get_items_zaak_fingerprints,
+    resync_items_and_zaken,
+)
 from openarchiefbeheer.logging import logevent
 
 from .api.serializers import ZaakSerializer
 from .decorators import log_errors
 from .models import Zaak
-from .utils import pagination_helper, process_expanded_data
+from .utils import (
+    enrich_zaken_with_related_objects,
+    pagination_helper,
+    process_expanded_data,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +68,7 @@ def retrieve_and_cache_zaken(is_full_resync=False):
         selectielijst_api_client_cm as selectielijst_api_client,
     ):
         if is_full_resync:
+            fingerprints = get_items_zaak_fingerprints()
             Zaak.objects.all().delete()
 
         response = client.get(
@@ -100,7 +108,28 @@ def retrieve_and_cache_zaken(is_full_resync=False):
             serializer.save()
 
         if is_full_resync:
-            resync_items_and_zaken()
+            resync_items_and_zaken(fingerprints)
+
+        transaction.on_commit(enrich_zaken_related_objects.delay)
+
+
+@app.task
+def enrich_zaken_related_objects() -> None:
+    """Store the supported related objects of the zaken that don't have them yet."""
+    last_pk = 0
+    while True:
+        zaken = list(
+            Zaak.objects.filter(pk__gt=last_pk, supported_zaakobjecten__isnull=True)
+            .order_by("pk")
+            .only("pk", "url", "supported_zaakobjecten")[
+                : settings.RELATED_OBJECTS_ENRICHMENT_BATCH_SIZE
+            ]
+        )
+        if not zaken:
+            break
+
+        enrich_zaken_with_related_objects(zaken)
+        last_pk = zaken[-1].pk
 
 
 @app.task
@@ -12,11 +12,19 @@ from zgw_consumers.test.factories import ServiceFactory
 
 from openarchiefbeheer.config.tests.factories import APIConfigFactory
 from openarchiefbeheer.destruction.tests.factories import DestructionListItemFactory
+from openarchiefbeheer.external_registers.contrib.openklant.constants import (
+    OPENKLANT_IDENTIFIER,
+)
+from openarchiefbeheer.external_registers.models import ExternalRegisterConfig
 from openarchiefbeheer.utils.tests.get_queries import executed_queries
 from openarchiefbeheer.utils.tests.mixins import ClearCacheMixin
 
 from ..models import Zaak
-from ..tasks import resync_zaken, retrieve_and_cache_zaken_from_openzaak
+from ..tasks import (
+    enrich_zaken_related_objects,
+    resync_zaken,
+    retrieve_and_cache_zaken_from_openzaak,
+)
 from .factories import ZaakFactory
 
 PAGE_1 = {
@@ -583,3 +591,79 @@ class RetrieveCachedZakenQueryTest(ClearCacheMixin, TestCase):
         self.assertEqual(
             1, len([q for q in queries if 'INSERT INTO "zaken_zaak"' in q["sql"]])
         )
+
+
+class EnrichZakenRelatedObjectsTest(ClearCacheMixin, TestCase):
+    @Mocker()
+    def test_supported_zaakobjecten_stored(self, m):
+        ServiceFactory.create(
+            api_type=APITypes.zrc,
+            api_root="http://zaken-api.nl/zaken/api/v1",
+        )
+        openklant_service = ServiceFactory.create(
+            api_type=APITypes.orc,
+            api_root="http://openklant.nl/klantinteracties/api/v1/",
+        )
+        config = ExternalRegisterConfig.objects.get(identifier=OPENKLANT_IDENTIFIER)
+        config.services.add(openklant_service)
+        zaak = ZaakFactory.create(url="http://zaken-api.nl/zaken/api/v1/zaken/111")
+        already_enriched_zaak = ZaakFactory.create(supported_zaakobjecten=[])
+
+        m.get(
+            "http://zaken-api.nl/zaken/api/v1/zaakobjecten",
+            json={
+                "results": [
+                    {
+                        "url": "http://zaken-api.nl/zaken/api/v1/zaakobjecten/1",
+                        "object": "http://openklant.nl/klantinteracties/api/v1/onderwerpobjecten/1",
+                        "objectType": "overige",
+                    },
+                    {
+                        "url": "http://zaken-api.nl/zaken/api/v1/zaakobjecten/2",
+                        "object": "http://unsupported.nl/api/v1/objects/2",
+                        "objectType": "overige",
+                    },
+                ]
+            },
+        )
+
+        enrich_zaken_related_objects()
+
+        zaak.refresh_from_db()
+        self.assertEqual(
+            zaak.supported_zaakobjecten,
+            [
+                {
+                    "url": "http://zaken-api.nl/zaken/api/v1/zaakobjecten/1",
+                    "object": "http://openklant.nl/klantinteracties/api/v1/onderwerpobjecten/1",
+                    "object_type": "overige",
+                    "plugin": OPENKLANT_IDENTIFIER,
+                }
+            ],
+        )
+        already_enriched_zaak.refresh_from_db()
+        self.assertEqual(already_enriched_zaak.supported_zaakobjecten, [])
+        self.assertEqual(len(m.request_history), 1)
+
+    @Mocker()
+    def test_zaak_left_as_is_on_error(self, m):
+        ServiceFactory.create(
+            api_type=APITypes.zrc,
+            api_root="http://zaken-api.nl/zaken/api/v1",
+        )
+        zaak = ZaakFactory.create(url="http://zaken-api.nl/zaken/api/v1/zaken/111")
+        m.get("http://zaken-api.nl/zaken/api/v1/zaakobjecten", status_code=500)
+
+        enrich_zaken_related_objects()
+
+        zaak.refresh_from_db()
+        self.assertIsNone(zaak.supported_zaakobjecten)
+
+    def test_stored_zaakobjecten_reset_when_plugin_config_changes(self):
+        zaak = ZaakFactory.create(supported_zaakobjecten=[])
+        config = ExternalRegisterConfig.objects.get(identifier=OPENKLANT_IDENTIFIER)
+
+        config.services.add(ServiceFactory.create())
+
+        zaak.refresh_from_db()
+        self.assertIsNone(zaak.supported_zaakobjecten)
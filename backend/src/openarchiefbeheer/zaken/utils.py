@@ -1,22 +1,27 @@
+import logging
 from functools import partial
 from typing import Generator, Iterable
+from uuid import uuid4
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 from django.utils.translation import gettext as _
 
 from ape_pie import APIClient
 from djangorestframework_camel_case.parser import CamelCaseJSONParser
 from djangorestframework_camel_case.util import underscoreize
 from glom import glom
+from requests.exceptions import RequestException
 from zgw_consumers.api_models.selectielijst import Resultaat
-from zgw_consumers.client import build_client
 from zgw_consumers.concurrent import parallel
 from zgw_consumers.utils import PaginatedResponseData
 
 from openarchiefbeheer.clients import (
     _cached,
     _cached_with_args,
+    build_client,
     get_service_from_url,
     selectielijst_client,
     zrc_client,
@@ -29,6 +34,25 @@ from openarchiefbeheer.utils.datastructure import HashableDict
 from .models import Zaak
 from .types import DropDownChoice
 
+logger = logging.getLogger(__name__)
+
+ZAKEN_VERSION_CACHE_KEY = "zaken-version"
+
+
+def get_zaken_version() -> str:
+    """Return a marker that changes whenever the cached zaken change.
+
+    Used in the keys of the cached results computed from the zaken.
+    """
+    return cache.get_or_set(ZAKEN_VERSION_CACHE_KEY, lambda: uuid4().hex, timeout=None)
+
+
+def bump_zaken_version() -> None:
+    """Change the marker of the zaken, once the current transaction is committed."""
+    transaction.on_commit(
+        lambda: cache.set(ZAKEN_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+    )
+
 
 def pagination_helper(
     client: APIClient, paginated_response: PaginatedResponseData, **kwargs
@@ -114,6 +138,83 @@ def fetch_zaakobjects(zaak_url: str) -> list[dict[str, JSONValue]]:
     return zaakobjects
 
 
+def fetch_supported_zaakobjects_counts(zaak_urls: Iterable[str]) -> dict[str, int]:
+    """Return the number of supported related objects for each of the given zaken.
+
+    The zaakobjecten are retrieved concurrently. The Zaken API can only filter the
+    zaakobjecten on a single zaak, so one request is still needed per zaak.
+    """
+    zaak_urls = list(dict.fromkeys(zaak_urls))
+    if not zaak_urls:
+        return {}
+
+    # Resolve the service in this thread, the worker threads don't share the
+    # database connection.
+    zrc_client()
+
+    with parallel(max_workers=settings.RELATED_OBJECTS_PREFETCH_WORKERS) as executor:
+        list(executor.map(fetch_zaakobjects, zaak_urls))
+
+    return {
+        zaak_url: len(fetch_supported_zaakobjects(zaak_url)) for zaak_url in zaak_urls
+    }
+
+
+def get_supported_zaakobjecten_metadata(
+    zaakobjecten: Iterable[dict[str, JSONValue]],
+) -> list[dict[str, JSONValue]]:
+    """Return the zaakobjecten that are supported by a plugin, with their plugin."""
+    supported = []
+    for zaakobject in zaakobjecten:
+        plugin = get_plugin_for_related_object(zaakobject["object"])
+        if plugin is None:
+            continue
+
+        supported.append(
+            {
+                "url": zaakobject["url"],
+                "object": zaakobject["object"],
+                "object_type": zaakobject.get("object_type"),
+                "plugin": plugin.identifier,
+            }
+        )
+    return supported
+
+
+def enrich_zaken_with_related_objects(zaken: Iterable[Zaak]) -> None:
+    """Store the supported related objects of the zaken in the database.
+
+    The zaakobjecten are retrieved concurrently. If they can't be retrieved for a
+    zaak, the zaak is left as is and its related objects are looked up when needed.
+    """
+    zaken = list(zaken)
+    if not zaken:
+        return
+
+    def _fetch_zaakobjects(zaak_url: str) -> list[dict[str, JSONValue]] | None:
+        try:
+            return fetch_zaakobjects(zaak_url)
+        except RequestException:
+            logger.exception("Could not retrieve the zaakobjecten of %s.", zaak_url)
+
+    # Resolve the service in this thread, the worker threads don't share the
+    # database connection.
+    zrc_client()
+
+    with parallel(max_workers=settings.RELATED_OBJECTS_PREFETCH_WORKERS) as executor:
+        results = list(executor.map(_fetch_zaakobjects, [zaak.url for zaak in zaken]))
+
+    enriched_zaken = []
+    for zaak, zaakobjecten in zip(zaken, results, strict=True):
+        if zaakobjecten is None:
+            continue
+
+        zaak.supported_zaakobjecten = get_supported_zaakobjecten_metadata(zaakobjecten)
+        enriched_zaken.append(zaak)
+
+    Zaak.objects.bulk_update(enriched_zaken, ["supported_zaakobjecten"])
+
+
 def process_expanded_data(
     zaken: list[dict], selectielijst_api_client: APIClient
 ) -> list[dict]:
@@ -198,7 +299,7 @@ def format_resultaten_choices(resultaten: list[dict | None]) -> DropDownChoice:
     return result
 
 
-@_cached_with_args
+@_cached_with_args(timeout=60 * 60 * 24)
 def retrieve_selectielijstklasse_choices(
     procestype_url: str = "",
 ) -> list[DropDownChoice]:
@@ -281,7 +382,7 @@ def get_selectielijstresultaten_dict() -> dict[str, JSONValue]:
     return {item["url"]: item for item in resultaten}
 
 
-@_cached_with_args
+@_cached_with_args(timeout=60 * 60 * 24)
 def retrieve_selectielijstklasse_resultaat(resultaat_url: str) -> JSONValue:
     client = selectielijst_client()
 